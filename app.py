@@ -1,22 +1,115 @@
 """Streamlit application for Excel to Snowflake Bronze ingestion."""
 import os
-import tempfile
 import time
 
-import pandas as pd
 import streamlit as st
 
-from excel_to_bronze.ingestion.base import DataIngestionError
-from excel_to_bronze.ingestion.bronze import ExcelIngestor
+from excel_to_bronze.ingestion.base import INGESTORS
+from excel_to_bronze.ingestion.bronze import PREVIEW_ROWS, BronzeIngestor
+from excel_to_bronze.ingestion.jobs import JobManager
+from excel_to_bronze.ingestion.tabular import create_ingestor
 from excel_to_bronze.utils.logging import setup_logging
 
 # Set up logging
 logger = setup_logging()
 
+# Seconds between status refreshes while jobs are running
+POLL_INTERVAL = 1.0
+
 # 1. Track processed files in session state to avoid re-ingestion.
 #    This prevents reloading both files when a new one is added.
 if "processed_files" not in st.session_state:
     st.session_state.processed_files = set()
+# Background jobs submitted in this session, keyed by filename
+if "jobs" not in st.session_state:
+    st.session_state.jobs = {}
+# Preview DataFrames keyed by job id, so they survive the polling reruns
+if "previews" not in st.session_state:
+    st.session_state.previews = {}
+
+
+@st.cache_resource
+def get_job_manager() -> JobManager:
+    """Get the job manager shared by all sessions of this server."""
+    return JobManager()
+
+
+@st.cache_resource
+def get_preview_ingestor(extension: str) -> BronzeIngestor:
+    """Get the ingestor used to preview uploads with an extension."""
+    return create_ingestor(extension)
+
+
+def submit_upload(uploaded_file) -> str:
+    """Preview an uploaded file and queue it for background ingestion.
+
+    The preview is kept in the session state under the job id, as every
+    rerun redraws the page.
+
+    Args:
+        uploaded_file: File from st.file_uploader
+
+    Returns:
+        Job id
+    """
+    # Preview the data; only the first rows are parsed here, the worker
+    # parses the whole workbook once
+    content = uploaded_file.getvalue()
+    extension = os.path.splitext(uploaded_file.name)[1].lower()
+    df = get_preview_ingestor(extension).preview(content, uploaded_file.name)
+
+    # The content goes to the worker in memory, without a temporary file
+    job_id = get_job_manager().submit(content, original_filename=uploaded_file.name)
+    st.session_state.previews[job_id] = df
+    return job_id
+
+
+def show_preview(filename: str, job_id: str) -> None:
+    """Show the preview stored for a job, if any."""
+    df = st.session_state.previews.get(job_id)
+    if df is None:
+        return
+    with st.expander(f"Preview Data: {filename}"):
+        st.dataframe(df)
+        st.text(f"First {min(len(df), PREVIEW_ROWS)} rows")
+        st.text(f"Columns: {', '.join(map(str, df.columns))}")
+
+
+def show_jobs() -> bool:
+    """Show the status of this session's jobs.
+
+    Returns:
+        True if any job is still queued or running
+    """
+    manager = get_job_manager()
+    running = False
+    for filename, job_id in st.session_state.jobs.items():
+        show_preview(filename, job_id)
+        job = manager.get(job_id)
+        if job is None:
+            continue
+        if not job.done:
+            running = True
+            label = (
+                f"{filename}: {job.status}, {job.rows:,} rows written "
+                f"({job.rows_per_second:,.0f} rows/s)"
+            )
+            if job.total_batches:
+                st.progress(job.fraction, text=label)
+            else:
+                # Streamed files and several sheets report rows written so
+                # far; their number of batches is only known at the end
+                st.info(label)
+        elif job.error:
+            st.error(f"Error processing {filename}: {job.error}")
+        else:
+            st.success(
+                f"Successfully processed {filename} ({job.rows:,} rows in "
+                f"{job.elapsed:.1f}s, {job.rows_per_second:,.0f} rows/s)"
+            )
+            # Mark file as processed so it won't be re-ingested.
+            st.session_state.processed_files.add(filename)
+    return running
 
 
 def main():
@@ -33,90 +126,17 @@ def main():
     """
     )
 
-    # File uploader
-    uploaded_files = st.file_uploader(
-        "Choose Excel file(s)", type=["xlsx", "xls"], accept_multiple_files=True
-    )
-
-    if uploaded_files:
-        ingestor = ExcelIngestor()
-
-        # Progress tracking
-        progress_container = st.empty()
-        status_container = st.empty()
-        preview_container = st.empty()
-
-        for uploaded_file in uploaded_files:
-            # Skip files that have already been processed
-            if uploaded_file.name in st.session_state.processed_files:
-                st.info(f"{uploaded_file.name} has already been processed. Skipping.")
-                continue
-
-            try:
-                # Create progress bar
-                progress_bar = progress_container.progress(0)
-                status_container.info(f"Processing {uploaded_file.name}...")
-
-                # Preview the data
-                df = pd.read_excel(uploaded_file)
-                with preview_container.expander("Preview Data"):
-                    st.dataframe(df.head())
-                    st.text(f"Total rows: {len(df)}")
-                    st.text(f"Columns: {', '.join(df.columns)}")
-
-                # Create a temporary file
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=".xlsx"
-                ) as tmp_file:
-                    tmp_file.write(uploaded_file.getvalue())
-                    tmp_file_path = tmp_file.name
-
-                # Process the file with original filename
-                ingestor.ingest_excel(
-                    tmp_file_path, original_filename=uploaded_file.name
-                )
-
-                # Update progress
-                progress_bar.progress(100)
-                status_container.success(f"Successfully processed {uploaded_file.name}")
-
-                # Clean up
-                os.unlink(tmp_file_path)
-                time.sleep(1)  # Give users time to see the success message
-
-                # Mark file as processed so it won't be re-ingested.
-                st.session_state.processed_files.add(uploaded_file.name)
-
-            except DataIngestionError as e:
-                status_container.error(
-                    f"Error processing {uploaded_file.name}: {str(e)}"
-                )
-                logger.error(f"Ingestion error for {uploaded_file.name}: {str(e)}")
-                continue
-            except Exception as e:
-                status_container.error(
-                    f"Unexpected error with {uploaded_file.name}: {str(e)}"
-                )
-                logger.exception(f"Unexpected error processing {uploaded_file.name}")
-                continue
-            finally:
-                # Clear progress indicators for next file
-                progress_container.empty()
-                status_container.empty()
-
-        # Final success message
-        st.success("All files processed!")
-
     # Add helpful information in sidebar
     with st.sidebar:
         st.header("Information")
         st.markdown(
             """
         ### Supported Features
-        - Multiple file upload
+        - Multiple file upload, processed in parallel
         - Excel formats: .xlsx, .xls
+        - CSV/TSV and Parquet files
         - Data preview before ingestion
-        - Progress tracking
+        - Background processing with live progress and rows/s
         - Batch processing
         - Original filename preservation
 
@@ -128,6 +148,34 @@ def main():
         """
         )
 
+    # File uploader
+    uploaded_files = st.file_uploader(
+        "Choose file(s)",
+        type=[ext.lstrip(".") for ext in INGESTORS],
+        accept_multiple_files=True,
+    )
+
+    for uploaded_file in uploaded_files or []:
+        if uploaded_file.name in st.session_state.jobs:
+            continue
+        if uploaded_file.name in st.session_state.processed_files:
+            st.info(f"{uploaded_file.name} has already been processed. Skipping.")
+            continue
+        try:
+            st.session_state.jobs[uploaded_file.name] = submit_upload(uploaded_file)
+        except Exception as e:
+            st.error(f"Unexpected error with {uploaded_file.name}: {str(e)}")
+            logger.exception(f"Unexpected error reading {uploaded_file.name}")
+
+    if st.session_state.jobs:
+        if show_jobs():
+            # Poll until this session's jobs have finished; other sessions
+            # keep running on their own script threads meanwhile
+            time.sleep(POLL_INTERVAL)
+            st.rerun()
+        else:
+            st.success("All files processed!")
+
 
 if __name__ == "__main__":
     main()
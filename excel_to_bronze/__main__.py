@@ -1,43 +1,182 @@
-"""Command-line interface for Excel to Bronze ingestion."""
+"""Command-line interface for Excel to Bronze ingestion.
+
+Arguments are parsed and validated before pandas, the Snowflake driver and
+the ingestion modules are imported, so ``--help`` and usage errors return
+immediately and short cron runs only pay for what they use.
+"""
 import argparse
+import os
 import sys
 
-from excel_to_bronze.ingestion.base import DataIngestionError
-from excel_to_bronze.ingestion.bronze import ExcelIngestor
-from excel_to_bronze.utils.logging import setup_logging
 
-# Set up logging
-logger = setup_logging()
+def watch(args, parser) -> int:
+    """Run the directory watcher until it is interrupted."""
+    if args.filename:
+        parser.error("--filename cannot be used with --watch")
+    for path in args.paths:
+        if not os.path.isdir(path):
+            parser.error(f"--watch needs directories; not a directory: {path}")
+
+    from excel_to_bronze.ingestion.watcher import DirectoryWatcher
+
+    try:
+        watcher = DirectoryWatcher(
+            args.paths,
+            workers=args.workers,
+            max_writers=args.max_writers,
+            settle_seconds=args.settle_seconds,
+            poll_interval=args.poll_interval,
+            queue_size=args.queue_size,
+            backend="polling" if args.polling else None,
+            recursive=args.recursive,
+            streaming=args.streaming,
+            force=args.force,
+            sheets=args.sheets,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    watcher.install_signal_handlers()
+    watcher.run()
+    return 0
 
 
 def main():
     """Main command-line interface."""
     parser = argparse.ArgumentParser(
-        description="Ingest Excel files into Snowflake Bronze layer."
+        description="Ingest Excel, CSV and Parquet files into Snowflake Bronze layer."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=str,
+        help="Excel, CSV or Parquet files, directories or glob patterns to ingest",
     )
-    parser.add_argument("file_path", type=str, help="Path to Excel file for ingestion")
     parser.add_argument(
         "--filename",
         type=str,
         help="Original filename to store (defaults to basename of file_path)",
     )
     parser.add_argument("--config", type=str, help="Path to configuration file")
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        default=None,
+        help="Read the file in constant memory, one batch at a time",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ingest even if identical content was already loaded",
+    )
+    parser.add_argument(
+        "--sheets",
+        type=str,
+        help=(
+            'Sheets to ingest: "*" for all, "re:<pattern>" or a comma-separated '
+            "list (defaults to the first sheet)"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of files processed in parallel (defaults to CPU count)",
+    )
+    parser.add_argument(
+        "--max-writers",
+        type=int,
+        help="Total Snowflake connections shared by all workers",
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Watch the given directories and ingest files as they arrive",
+    )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="With --watch, also watch subdirectories",
+    )
+    parser.add_argument(
+        "--settle-seconds",
+        type=float,
+        help="With --watch, time a file must stay unchanged before ingestion",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        help="With --watch, seconds between checks for new or settled files",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        help="With --watch, settled files waiting for a worker",
+    )
+    parser.add_argument(
+        "--polling",
+        action="store_true",
+        help="With --watch, poll instead of using watchdog notifications",
+    )
 
     args = parser.parse_args()
 
+    single_file = len(args.paths) == 1 and os.path.isfile(args.paths[0])
+    if args.filename and not single_file:
+        parser.error("--filename can only be used with a single file")
+    if args.config:
+        if not os.path.isfile(args.config):
+            parser.error(f"Configuration file not found: {args.config}")
+        from excel_to_bronze.config import config
+
+        # Also seen by worker processes that re-import the package
+        os.environ["CONFIG_PATH"] = args.config
+        config.use_file(args.config)
+
+    if args.watch:
+        return watch(args, parser)
+
+    from excel_to_bronze.ingestion.base import DataIngestionError
+    from excel_to_bronze.ingestion.pipeline import format_summary, ingest_files
+    from excel_to_bronze.ingestion.tabular import create_ingestor
+    from excel_to_bronze.utils.logging import setup_logging
+
+    logger = setup_logging()
     try:
-        # Initialize ingestor
-        ingestor = ExcelIngestor()
+        if not single_file:
+            results = ingest_files(
+                args.paths,
+                workers=args.workers,
+                max_writers=args.max_writers,
+                streaming=args.streaming,
+                force=args.force,
+                sheets=args.sheets,
+            )
+            print(format_summary(results))
+            if not results:
+                logger.error("No Excel, CSV or Parquet files found")
+                return 1
+            return 0 if all(result.success for result in results) else 1
+
+        file_path = args.paths[0]
+
+        # Initialize the ingestor registered for the file's extension
+        ingestor = create_ingestor(args.filename or file_path)
 
         # Process file
-        logger.info(f"Processing file: {args.file_path}")
-        result = ingestor.ingest_excel(args.file_path, args.filename)
+        logger.info(f"Processing file: {file_path}")
+        result = ingestor.ingest_excel(
+            file_path,
+            args.filename,
+            streaming=args.streaming,
+            force=args.force,
+            sheets=args.sheets,
+        )
 
         if result:
-            logger.info(f"Successfully ingested {args.file_path}")
+            logger.info(f"Successfully ingested {file_path}")
             return 0
         else:
-            logger.error(f"Failed to ingest {args.file_path}")
+            logger.error(f"Failed to ingest {file_path}")
             return 1
 
     except DataIngestionError as e:
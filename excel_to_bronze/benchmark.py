@@ -0,0 +1,454 @@
+"""Benchmark harness for the read, serialize and write stages.
+
+Generates a synthetic workbook, times each stage of the bronze ingestion
+against a SQLite stand-in for Snowflake and compares the throughput with a
+stored JSON baseline.
+
+Usage:
+    python -m excel_to_bronze.benchmark --rows 100000 --columns 20
+    python -m excel_to_bronze.benchmark --baseline bench.json --save-baseline
+    python -m excel_to_bronze.benchmark --baseline bench.json --threshold 0.15
+    python -m excel_to_bronze.benchmark --memory-mode low --max-memory-ratio 6
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from excel_to_bronze.config import config
+from excel_to_bronze.connectors.faults import FaultInjectingConnector
+from excel_to_bronze.connectors.sqlite import SQLiteConnector
+from excel_to_bronze.ingestion.batching import create_batch_sizer
+from excel_to_bronze.ingestion.bronze import MEMORY_MODES, ExcelIngestor
+from excel_to_bronze.utils.logging import setup_logging
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = setup_logging()
+
+DTYPE_KINDS = ("int", "float", "bool", "date", "timedelta", "nan", "text")
+DEFAULT_MIX = ("int", "float", "date", "timedelta", "nan", "text")
+STAGES = ("read", "serialize", "write")
+
+# Share of missing values in "nan" columns
+NAN_FRACTION = 0.9
+
+_WORDS = np.array(
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua".split()
+)
+
+
+def make_column(kind: str, rows: int, rng: np.random.Generator) -> pd.Series:
+    """Generate one synthetic column.
+
+    Args:
+        kind: One of ``DTYPE_KINDS``
+        rows: Number of values
+        rng: Random generator
+
+    Returns:
+        Column values
+    """
+    if kind == "int":
+        return pd.Series(rng.integers(-1_000_000, 1_000_000, rows))
+    if kind == "float":
+        return pd.Series(rng.normal(0, 1000, rows))
+    if kind == "bool":
+        return pd.Series(rng.integers(0, 2, rows).astype(bool))
+    if kind == "date":
+        seconds = rng.integers(0, 20 * 365 * 86400, rows)
+        return pd.Series(pd.Timestamp("2000-01-01") + pd.to_timedelta(seconds, "s"))
+    if kind == "timedelta":
+        return pd.Series(pd.to_timedelta(rng.integers(0, 86400, rows), unit="s"))
+    if kind == "nan":
+        values = rng.normal(0, 1, rows)
+        values[rng.random(rows) < NAN_FRACTION] = np.nan
+        return pd.Series(values)
+    if kind == "text":
+        words = rng.choice(_WORDS, size=(rows, 16))
+        return pd.Series([" ".join(row) for row in words])
+    raise ValueError(f"Unknown column kind: {kind}. Choose from {DTYPE_KINDS}")
+
+
+def generate_workbook(
+    path: str,
+    rows: int,
+    columns: int,
+    mix: Sequence[str] = DEFAULT_MIX,
+    seed: int = 0,
+) -> str:
+    """Write a reproducible synthetic workbook.
+
+    Columns cycle through the kinds in ``mix``; the same arguments always
+    produce the same data.
+
+    Args:
+        path: Destination .xlsx path
+        rows: Number of data rows
+        columns: Number of columns
+        mix: Column kinds (see ``DTYPE_KINDS``)
+        seed: Random seed
+
+    Returns:
+        Path of the workbook
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            f"{mix[j % len(mix)]}_{j}": make_column(mix[j % len(mix)], rows, rng)
+            for j in range(columns)
+        }
+    )
+    df.to_excel(path, index=False)
+    return path
+
+
+def time_stage(func: Callable, repeat: int):
+    """Run a stage ``repeat`` times and keep the fastest run.
+
+    Args:
+        func: Stage to run
+        repeat: Number of runs
+
+    Returns:
+        Tuple of (best seconds, result of the last run)
+    """
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def traced_peak(func: Callable) -> int:
+    """Run a function once under tracemalloc.
+
+    Args:
+        func: Function to run
+
+    Returns:
+        Peak size in bytes of the Python allocations made while it ran
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of this process in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def stage_result(seconds: float, rows: int, size: int) -> Dict[str, float]:
+    """Summarize a stage's throughput."""
+    return {
+        "seconds": round(seconds, 4),
+        "rows_per_second": round(rows / seconds, 1) if seconds else 0.0,
+        "mb_per_second": round(size / 1e6 / seconds, 3) if seconds else 0.0,
+    }
+
+
+def run_benchmark(
+    rows: int = 100_000,
+    columns: int = 20,
+    mix: Sequence[str] = DEFAULT_MIX,
+    seed: int = 0,
+    repeat: int = 3,
+    workdir: Optional[str] = None,
+    ingestor: Optional[ExcelIngestor] = None,
+    memory_mode: Optional[str] = None,
+    fault_rate: float = 0.0,
+    adaptive: bool = False,
+) -> Dict:
+    """Benchmark the read, serialize and write stages on a synthetic workbook.
+
+    Workbooks are cached in ``workdir`` by their parameters, so repeated
+    runs skip the (slow) generation. Writes go to an in-memory SQLite table
+    through the regular INSERT path.
+
+    Args:
+        rows: Number of data rows
+        columns: Number of columns
+        mix: Column kinds (see ``DTYPE_KINDS``)
+        seed: Random seed
+        repeat: Runs per stage; the fastest is reported
+        workdir: Directory for generated workbooks (defaults to the temp dir)
+        ingestor: Ingestor to benchmark (defaults to one writing to SQLite)
+        memory_mode: Memory mode of the ingestor (see ``MEMORY_MODES``)
+        fault_rate: Probability of an injected transient error per written
+            batch (see ``FaultInjectingConnector``); retry delays are cut to
+            milliseconds so the benchmark measures the retry overhead only
+        adaptive: Size batches adaptively (see ``AdaptiveBatchSizer``)
+
+    Returns:
+        Dictionary with the scenario, per-stage results, the traced peak
+        memory of serializing and writing the sheet relative to the size of
+        the DataFrame, and peak RSS
+    """
+    workdir = workdir or tempfile.gettempdir()
+    os.makedirs(workdir, exist_ok=True)
+    name = f"bench_{rows}x{columns}_{'-'.join(mix)}_{seed}.xlsx"
+    path = os.path.join(workdir, name)
+    if not os.path.exists(path):
+        logger.info(f"Generating {path}")
+        generate_workbook(path, rows, columns, mix, seed)
+
+    if ingestor is None:
+        ingestor = ExcelIngestor(connector=SQLiteConnector())
+        ingestor.write_settings.load_method = "insert"
+    if memory_mode:
+        ingestor.read_settings.memory_mode = memory_mode
+    if fault_rate:
+        ingestor.connector = FaultInjectingConnector(
+            ingestor.connector, failure_rate=fault_rate, seed=seed
+        )
+        ingestor.retry_policy.base_delay = 0.001
+        ingestor.retry_policy.retries = max(ingestor.retry_policy.retries, 5)
+    if adaptive and ingestor.batch_sizer is None:
+        ingestor.batch_sizer = create_batch_sizer(
+            {**config.get_application_config(), "adaptive_batching": True}
+        )
+    sink = ingestor.connector
+    file_size = os.path.getsize(path)
+
+    read_seconds, df = time_stage(lambda: ingestor.read_file(path), repeat)
+    serialize_seconds, prepared = time_stage(
+        lambda: ingestor.prepare_data(df, name), repeat
+    )
+    payload_size = sum(len(raw_data) for _, _, raw_data in prepared)
+
+    def reset_table() -> None:
+        table = ingestor.bronze_table
+        if hasattr(sink, "create_table"):
+            sink.execute_query(f"DROP TABLE IF EXISTS {table}")
+            sink.create_table(table)
+
+    def write() -> None:
+        reset_table()
+        progress = ingestor.batch_progress(len(prepared))
+        batches = ingestor.split_batches(prepared, progress=progress)
+        ingestor.write_batches(batches, progress, name)
+
+    write_seconds, _ = time_stage(write, repeat)
+
+    # Serializing and writing batch by batch should need memory proportional
+    # to a batch, not to the sheet
+    frame_size = int(df.memory_usage(deep=True).sum())
+    reset_table()
+    write_peak = traced_peak(lambda: ingestor.write_data(df, original_filename=name))
+
+    return {
+        "scenario": {
+            "rows": rows,
+            "columns": columns,
+            "mix": list(mix),
+            "seed": seed,
+            "repeat": repeat,
+            "excel_backend": ingestor.select_backend(path).name,
+            "json_backend": ingestor.write_settings.json_backend,
+            "write_workers": ingestor.write_settings.workers,
+            "memory_mode": ingestor.read_settings.memory_mode,
+            "fault_rate": fault_rate,
+            "adaptive_batching": ingestor.batch_sizer is not None,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+        },
+        "file_mb": round(file_size / 1e6, 3),
+        "payload_mb": round(payload_size / 1e6, 3),
+        "stages": {
+            "read": stage_result(read_seconds, len(df), file_size),
+            "serialize": stage_result(serialize_seconds, len(df), payload_size),
+            "write": stage_result(write_seconds, len(df), payload_size),
+        },
+        "frame_mb": round(frame_size / 1e6, 3),
+        "write_peak_mb": round(write_peak / 1e6, 3),
+        "write_peak_ratio": round(write_peak / frame_size, 3) if frame_size else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+        "injected_faults": dict(getattr(sink, "injected", {})),
+    }
+
+
+def compare_to_baseline(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Find stages whose throughput dropped beyond a threshold.
+
+    Args:
+        results: Output of ``run_benchmark``
+        baseline: Earlier output of ``run_benchmark``
+        threshold: Allowed relative drop in rows/s, e.g. 0.1 for 10%
+
+    Returns:
+        One message per regressed stage
+    """
+    if results["scenario"] != baseline.get("scenario"):
+        logger.warning("Baseline was recorded for a different scenario")
+
+    regressions = []
+    for stage in STAGES:
+        current = results["stages"][stage]["rows_per_second"]
+        previous = baseline.get("stages", {}).get(stage, {}).get("rows_per_second")
+        if previous and current < previous * (1 - threshold):
+            regressions.append(
+                f"{stage}: {current:,.0f} rows/s vs baseline {previous:,.0f} "
+                f"({current / previous - 1:+.1%})"
+            )
+    return regressions
+
+
+def format_results(results: Dict) -> str:
+    """Format benchmark results as a plain-text table."""
+    scenario = results["scenario"]
+    lines = [
+        f"{scenario['rows']} rows x {scenario['columns']} columns "
+        f"({', '.join(scenario['mix'])}), file {results['file_mb']} MB, "
+        f"payload {results['payload_mb']} MB",
+        f"{'stage':<10} {'seconds':>9} {'rows/s':>12} {'MB/s':>9}",
+    ]
+    for stage in STAGES:
+        result = results["stages"][stage]
+        lines.append(
+            f"{stage:<10} {result['seconds']:>9.3f} "
+            f"{result['rows_per_second']:>12,.0f} {result['mb_per_second']:>9.2f}"
+        )
+    lines.append(
+        f"traced peak while writing {results['write_peak_mb']} MB "
+        f"({results['write_peak_ratio']}x the {results['frame_mb']} MB DataFrame)"
+    )
+    if results["peak_rss_mb"] is not None:
+        lines.append(f"peak RSS {results['peak_rss_mb']:.1f} MB")
+    if results["injected_faults"]:
+        faults = ", ".join(
+            f"{count} {kind}" for kind, count in results["injected_faults"].items()
+        )
+        lines.append(f"injected faults: {faults}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line interface for the benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the read, serialize and write stages."
+    )
+    parser.add_argument("--rows", type=int, default=100_000, help="Data rows")
+    parser.add_argument("--columns", type=int, default=20, help="Columns")
+    parser.add_argument(
+        "--mix",
+        type=str,
+        default=",".join(DEFAULT_MIX),
+        help=f"Comma-separated column kinds from: {', '.join(DTYPE_KINDS)}",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage")
+    parser.add_argument("--workdir", type=str, help="Directory for workbooks")
+    parser.add_argument("--output", type=str, help="Write results to this JSON file")
+    parser.add_argument("--baseline", type=str, help="Baseline JSON file")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed relative throughput drop before failing (default 0.1)",
+    )
+    parser.add_argument(
+        "--memory-mode",
+        choices=MEMORY_MODES,
+        help="Memory mode of the ingestor (default: MEMORY_MODE setting)",
+    )
+    parser.add_argument(
+        "--max-memory-ratio",
+        type=float,
+        help="Fail if the traced peak while writing exceeds this multiple of "
+        "the DataFrame's size",
+    )
+    parser.add_argument(
+        "--fault-rate",
+        type=float,
+        default=0.0,
+        help="Probability of an injected transient error per written batch",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Size batches adaptively (default: ADAPTIVE_BATCHING setting)",
+    )
+    args = parser.parse_args(argv)
+
+    mix = [kind.strip() for kind in args.mix.split(",") if kind.strip()]
+    unknown = [kind for kind in mix if kind not in DTYPE_KINDS]
+    if unknown or not mix:
+        parser.error(f"--mix must use kinds from: {', '.join(DTYPE_KINDS)}")
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline requires --baseline")
+    if args.baseline and not args.save_baseline and not os.path.exists(args.baseline):
+        parser.error(
+            f"Baseline {args.baseline} not found; create it with --save-baseline"
+        )
+
+    results = run_benchmark(
+        rows=args.rows,
+        columns=args.columns,
+        mix=mix,
+        seed=args.seed,
+        repeat=args.repeat,
+        workdir=args.workdir,
+        memory_mode=args.memory_mode,
+        fault_rate=args.fault_rate,
+        adaptive=args.adaptive,
+    )
+    print(format_results(results))
+    status = 0
+    if args.max_memory_ratio and results["write_peak_ratio"] > args.max_memory_ratio:
+        print(
+            f"MEMORY traced peak {results['write_peak_ratio']}x exceeds "
+            f"{args.max_memory_ratio}x the DataFrame's size"
+        )
+        status = 1
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regression beyond {args.threshold:.0%} of {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
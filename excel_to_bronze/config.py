@@ -2,8 +2,6 @@
 import os
 from typing import Any, Dict, Optional
 
-import yaml
-
 
 class ConfigManager:
     """Manages application configuration from environment variables and config files."""
@@ -19,15 +17,35 @@ class ConfigManager:
         return cls._instance
 
     def __init__(self, config_path: Optional[str] = None):
-        """Initialize configuration from environment variables or config file."""
+        """Initialize configuration from environment variables or config file.
+
+        The configuration is loaded on first access, so importing the package
+        stays cheap and ``use_file`` can still pick another file.
+        """
         # Skip initialization if already done (singleton pattern)
         if self._initialized:
             return
 
         self.config_path = config_path or os.getenv("CONFIG_PATH", "config/config.yaml")
-        self.config = self._load_config()
+        self._config: Optional[Dict[str, Any]] = None
         self._initialized = True
 
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration dictionary, loaded on first access."""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+
+    def use_file(self, config_path: str) -> None:
+        """Read the configuration from another file from now on.
+
+        Args:
+            config_path: Path to a YAML configuration file
+        """
+        self.config_path = config_path
+        self._config = None
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from environment variables or YAML file."""
         # Default configuration structure
@@ -44,12 +62,94 @@ class ConfigManager:
                 "log_level": os.getenv("LOG_LEVEL", "INFO"),
                 "batch_size": int(os.getenv("BATCH_SIZE", "10000")),
                 "bronze_table": os.getenv("BRONZE_TABLE", "bronze_table"),
+                "json_backend": os.getenv("JSON_BACKEND", "json"),
+                "payload_format": os.getenv("PAYLOAD_FORMAT", "full"),
+                "excel_backend": os.getenv("EXCEL_BACKEND", "auto"),
+                "large_file_mb": float(os.getenv("LARGE_FILE_MB", "10")),
+                "streaming": os.getenv("STREAMING", "false").lower() == "true",
+                "memory_mode": os.getenv("MEMORY_MODE", "default").lower(),
+                "write_workers": int(os.getenv("WRITE_WORKERS", "1")),
+                "write_retries": int(os.getenv("WRITE_RETRIES", "2")),
+                "write_retry_delay": float(os.getenv("WRITE_RETRY_DELAY", "1.0")),
+                "write_retry_max_delay": float(
+                    os.getenv("WRITE_RETRY_MAX_DELAY", "30.0")
+                ),
+                "adaptive_batching": os.getenv("ADAPTIVE_BATCHING", "false").lower()
+                == "true",
+                "batch_target_mb": float(os.getenv("BATCH_TARGET_MB", "16")),
+                "batch_min_rows": int(os.getenv("BATCH_MIN_ROWS", "100")),
+                "batch_max_rows": int(os.getenv("BATCH_MAX_ROWS", "100000")),
+                "batch_target_seconds": float(os.getenv("BATCH_TARGET_SECONDS", "10")),
+                "pipeline_workers": int(
+                    os.getenv("PIPELINE_WORKERS", str(os.cpu_count() or 1))
+                ),
+                "max_writers": int(os.getenv("MAX_WRITERS", "8")),
+                "sheets": os.getenv("SHEETS", ""),
+                "sheet_workers": int(
+                    os.getenv("SHEET_WORKERS", str(os.cpu_count() or 1))
+                ),
+                "parallel_read_mb": float(os.getenv("PARALLEL_READ_MB", "50")),
+                "csv_delimiter": os.getenv("CSV_DELIMITER", ""),
+                "csv_encoding": os.getenv("CSV_ENCODING", "utf8"),
+                "contracts": [],
+                "contracts_path": os.getenv("CONTRACTS_PATH"),
+                "contract_action": os.getenv("CONTRACT_ACTION", "quarantine"),
+                "quarantine_table": os.getenv("QUARANTINE_TABLE"),
+                "quarantine_dir": os.getenv("QUARANTINE_DIR", "quarantine"),
+                "watch_settle_seconds": float(os.getenv("WATCH_SETTLE_SECONDS", "2")),
+                "watch_poll_interval": float(os.getenv("WATCH_POLL_INTERVAL", "1.0")),
+                "watch_queue_size": int(os.getenv("WATCH_QUEUE_SIZE", "100")),
+                "watch_backend": os.getenv("WATCH_BACKEND", "auto"),
+                "ledger_path": os.getenv("LEDGER_PATH", "config/ingestion_ledger.db"),
+                "ledger_ttl_days": int(os.getenv("LEDGER_TTL_DAYS", "90")),
+                "ledger_max_entries": int(os.getenv("LEDGER_MAX_ENTRIES", "10000")),
+                "ledger_table": os.getenv("LEDGER_TABLE"),
+                "checkpoint_path": os.getenv("CHECKPOINT_PATH", ""),
+                "incremental": os.getenv("INCREMENTAL", "false").lower() == "true",
+                "incremental_key_columns": [
+                    col
+                    for col in os.getenv("INCREMENTAL_KEY_COLUMNS", "").split(",")
+                    if col
+                ],
+                "emit_tombstones": os.getenv("EMIT_TOMBSTONES", "false").lower()
+                == "true",
+                "fingerprint_index_path": os.getenv(
+                    "FINGERPRINT_INDEX_PATH", "config/row_fingerprints.db"
+                ),
+                "load_method": os.getenv("LOAD_METHOD", "insert"),
+                "stage_file_format": os.getenv("STAGE_FILE_FORMAT", "ndjson"),
+                "stage_name": os.getenv("STAGE_NAME"),
+                "local_stage_dir": os.getenv("LOCAL_STAGE_DIR"),
+                "pool_min_size": int(os.getenv("POOL_MIN_SIZE", "0")),
+                "pool_max_size": int(os.getenv("POOL_MAX_SIZE", "4")),
+                "pool_max_idle_seconds": int(os.getenv("POOL_MAX_IDLE_SECONDS", "300")),
+                "pool_max_lifetime_seconds": int(
+                    os.getenv("POOL_MAX_LIFETIME_SECONDS", "3600")
+                ),
+                "pool_timeout": int(os.getenv("POOL_TIMEOUT", "30")),
+                "query_cache": os.getenv("QUERY_CACHE", "false").lower() == "true",
+                "query_cache_ttl_seconds": float(
+                    os.getenv("QUERY_CACHE_TTL_SECONDS", "300")
+                ),
+                "query_cache_max_entries": int(
+                    os.getenv("QUERY_CACHE_MAX_ENTRIES", "256")
+                ),
+                "query_cache_max_mb": float(os.getenv("QUERY_CACHE_MAX_MB", "64")),
+                "metrics": os.getenv("METRICS", "none"),
+                "metrics_path": os.getenv("METRICS_PATH"),
+                "metrics_prefix": os.getenv("METRICS_PREFIX", "excel_to_bronze"),
+                "statsd_host": os.getenv("STATSD_HOST", "localhost"),
+                "statsd_port": int(os.getenv("STATSD_PORT", "8125")),
+                "profile_dir": os.getenv("PROFILE_DIR"),
+                "profiler": os.getenv("PROFILER", "cprofile"),
             },
         }
 
         # Override with config file if it exists
         if os.path.exists(self.config_path):
             try:
+                import yaml
+
                 with open(self.config_path, "r") as f:
                     yaml_config = yaml.safe_load(f)
 
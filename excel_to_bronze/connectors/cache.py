@@ -0,0 +1,376 @@
+"""LRU result cache with TTL for read-only queries, invalidated by writes."""
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Tuple
+
+from excel_to_bronze.utils.logging import setup_logging
+from excel_to_bronze.utils.metrics import metrics
+
+logger = setup_logging()
+
+# String literals and quoted identifiers, kept verbatim when normalizing SQL
+_QUOTED = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Statements whose results can be cached
+_READ_ONLY = re.compile(r"^\s*(SELECT|WITH|SHOW|DESCRIBE|DESC)\b", re.IGNORECASE)
+
+# Table name, optionally database/schema qualified and quoted
+_NAME = r"((?:\"[^\"]+\"|[\w$]+)(?:\.(?:\"[^\"]+\"|[\w$]+))*)"
+
+# Tokens scanned for the tables a query reads: names, parentheses and commas
+_TOKENS = re.compile(rf"{_NAME}|([(),])")
+
+# Keywords that end a FROM clause
+_FROM_END = frozenset(
+    "where group order having limit offset fetch qualify window union except "
+    "intersect minus select".split()
+)
+
+# Tables a statement writes to
+_WRITE_TABLES = re.compile(
+    r"\b(?:INSERT\s+(?:OVERWRITE\s+)?INTO|UPDATE|DELETE\s+FROM|MERGE\s+INTO|"
+    r"COPY\s+INTO|TRUNCATE\s+(?:TABLE\s+)?(?:IF\s+EXISTS\s+)?|"
+    r"(?:CREATE|DROP|ALTER)\s+(?:OR\s+REPLACE\s+)?(?:\w+\s+)?TABLE\s+"
+    rf"(?:IF\s+(?:NOT\s+)?EXISTS\s+)?)\s*{_NAME}",
+    re.IGNORECASE,
+)
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and drop a trailing semicolon outside quoted text.
+
+    Keywords keep their case, so ``select`` and ``SELECT`` are cached apart.
+
+    Args:
+        sql: SQL statement
+
+    Returns:
+        Statement usable as a cache key
+    """
+    parts = _QUOTED.split(sql.strip().rstrip(";").strip())
+    # Odd positions hold the quoted parts captured by the split
+    return "".join(
+        part if i % 2 else _WHITESPACE.sub(" ", part) for i, part in enumerate(parts)
+    )
+
+
+def is_read_only(sql: str) -> bool:
+    """Check whether a statement only reads, so its result may be cached."""
+    return _READ_ONLY.match(sql) is not None
+
+
+def _without_literals(sql: str) -> str:
+    """Blank out string literals, keeping quoted identifiers."""
+    return _QUOTED.sub(lambda m: m.group(0) if m.group(0)[0] == '"' else "''", sql)
+
+
+def _table_names(names: List[str]) -> FrozenSet[str]:
+    """Turn matched table names into unqualified, lower-case names."""
+    return frozenset(name.split(".")[-1].strip('"').lower() for name in names)
+
+
+def read_tables(sql: str) -> FrozenSet[str]:
+    """Get the tables a query reads from (unqualified, lower case).
+
+    Follows comma-separated FROM lists and joins, including subqueries. An
+    empty result means the tables could not be determined (e.g. ``SHOW``
+    statements or table functions), so the query depends on every table.
+    """
+    names: List[str] = []
+    depth = 0
+    # Parenthesis depth of each open FROM clause, innermost last
+    clauses: List[int] = []
+    expect_table = False
+    tokens = _TOKENS.findall(_without_literals(sql))
+    for position, (name, punctuation) in enumerate(tokens):
+        if punctuation == "(":
+            expect_table = False
+            depth += 1
+        elif punctuation == ")":
+            depth -= 1
+            while clauses and clauses[-1] > depth:
+                clauses.pop()
+        elif punctuation == ",":
+            expect_table = bool(clauses) and clauses[-1] == depth
+        elif name.lower() in ("from", "join"):
+            if name.lower() == "from":
+                clauses.append(depth)
+            expect_table = True
+        elif clauses and clauses[-1] == depth and name.lower() in _FROM_END:
+            clauses.pop()
+            expect_table = False
+        elif expect_table and name.lower() != "lateral":
+            following = tokens[position + 1][1] if position + 1 < len(tokens) else ""
+            if following == "(":
+                # Table function such as TABLE(...) or FLATTEN(...)
+                return frozenset()
+            names.append(name)
+            expect_table = False
+    if expect_table:
+        return frozenset()
+    return _table_names(names)
+
+
+def written_tables(sql: str) -> FrozenSet[str]:
+    """Get the tables a statement writes to (unqualified, lower case)."""
+    return _table_names(_WRITE_TABLES.findall(_without_literals(sql)))
+
+
+def params_key(params: Any) -> Optional[Hashable]:
+    """Turn query parameters into a hashable key.
+
+    Args:
+        params: Mapping or sequence of parameters, or None
+
+    Returns:
+        Hashable key, or None if a value is unhashable
+    """
+    if params is None:
+        key: Hashable = ()
+    elif isinstance(params, dict):
+        key = tuple(sorted(params.items()))
+    else:
+        key = tuple(params)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def estimate_bytes(rows: List[Tuple]) -> int:
+    """Estimate the memory held by result rows."""
+    return sys.getsizeof(rows) + sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row) for row in rows
+    )
+
+
+class _CacheEntry:
+    """Cached rows together with their size, tables and expiry time."""
+
+    __slots__ = ("rows", "size", "tables", "expires_at")
+
+    def __init__(
+        self, rows: List[Tuple], size: int, tables: FrozenSet[str], expires_at: float
+    ):
+        self.rows = rows
+        self.size = size
+        self.tables = tables
+        self.expires_at = expires_at
+
+
+class ResultCache:
+    """Least-recently-used cache of query results with a time to live.
+
+    Results are keyed on the normalized SQL and the parameters. Entries
+    expire ``ttl_seconds`` after they were stored; the least recently used
+    ones are evicted beyond ``max_entries`` or ``max_bytes`` (an estimate of
+    the rows' memory). Entries reading a table are dropped when this process
+    writes to it; writes from elsewhere become visible once entries expire.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum estimated size of all cached rows; larger
+                results are not cached
+            ttl_seconds: Seconds a result stays valid
+            clock: Time source, replaceable in tests
+        """
+        if max_entries < 1 or max_bytes < 1 or ttl_seconds <= 0:
+            raise ValueError("Cache limits and TTL must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+    @staticmethod
+    def key(sql: str, params: Any = None) -> Optional[Hashable]:
+        """Build the cache key of a query.
+
+        Args:
+            sql: SQL query
+            params: Parameters for the query
+
+        Returns:
+            Key, or None if the query must not be cached
+        """
+        if not is_read_only(sql):
+            return None
+        params = params_key(params)
+        if params is None:
+            return None
+        return normalize_sql(sql), params
+
+    @property
+    def generation(self) -> int:
+        """Number of writes seen so far; read it before running a query."""
+        return self._generation
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry; must be called with the lock held."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def get(self, key: Hashable) -> Optional[List[Tuple]]:
+        """Get the rows cached for a key.
+
+        Args:
+            key: Key from ``key``
+
+        Returns:
+            Copy of the cached rows, or None on a miss or an expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self.clock():
+                self._remove(key)
+                self._stats["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+            else:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+        if entry is None:
+            metrics.increment("query_cache_misses_total")
+            return None
+        metrics.increment("query_cache_hits_total")
+        return list(entry.rows)
+
+    def put(
+        self,
+        key: Hashable,
+        sql: str,
+        rows: List[Tuple],
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store the rows of a query, evicting least recently used entries.
+
+        Args:
+            key: Key from ``key``
+            sql: SQL query, whose tables invalidate the entry when written
+            rows: Query results
+            generation: ``generation`` read before the query ran; the rows
+                are not stored if a write happened since, as they may
+                predate it
+        """
+        size = estimate_bytes(rows)
+        if size > self.max_bytes:
+            logger.debug(f"Result of {size} bytes exceeds the query cache; not cached")
+            return
+        entry = _CacheEntry(
+            list(rows), size, read_tables(sql), self.clock() + self.ttl_seconds
+        )
+        evicted = 0
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+            self._stats["evictions"] += evicted
+        if evicted:
+            metrics.increment("query_cache_evictions_total", evicted)
+
+    def invalidate(self, sql: str) -> int:
+        """Drop the entries a statement may have made stale.
+
+        Entries reading a table the statement writes to are dropped, as are
+        entries whose tables could not be determined. For statements whose
+        tables cannot be determined (e.g. ``CALL``) the whole cache is
+        cleared; read-only statements change nothing.
+
+        Args:
+            sql: Executed SQL statement
+
+        Returns:
+            Number of dropped entries
+        """
+        if is_read_only(sql):
+            return 0
+        tables = written_tables(sql)
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if not tables or not entry.tables or entry.tables & tables
+            ]
+            for key in stale:
+                self._remove(key)
+            self._stats["invalidations"] += len(stale)
+        if stale:
+            metrics.increment("query_cache_invalidations_total", len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Counters for hits, misses, evictions, expirations and
+            invalidations plus the current number of entries and bytes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+            return stats
+
+    def __repr__(self) -> str:
+        return f"ResultCache(max_entries={self.max_entries}, stats={self.stats()})"
+
+
+def create_result_cache(settings: Optional[Dict] = None) -> Optional[ResultCache]:
+    """Create the cache configured by ``query_cache*`` application settings.
+
+    Args:
+        settings: Application configuration dictionary
+
+    Returns:
+        ResultCache, or None unless ``query_cache`` is enabled
+    """
+    settings = settings or {}
+    if not settings.get("query_cache"):
+        return None
+    return ResultCache(
+        max_entries=int(settings.get("query_cache_max_entries", 256)),
+        max_bytes=int(float(settings.get("query_cache_max_mb", 64)) * 1024 * 1024),
+        ttl_seconds=float(settings.get("query_cache_ttl_seconds", 300)),
+    )
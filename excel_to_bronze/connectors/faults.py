@@ -0,0 +1,128 @@
+"""Fault-injecting connector wrapper for exercising retries and batch sizing."""
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from excel_to_bronze.connectors.retry import mark_not_sent
+
+# Snowflake's "statement canceled" error, which it raises on statement timeouts
+STATEMENT_CANCELED_ERRNO = 604
+
+
+class InjectedConnectionError(ConnectionError):
+    """Transient failure raised by FaultInjectingConnector."""
+
+
+class InjectedTimeoutError(TimeoutError):
+    """Statement timeout raised by FaultInjectingConnector.
+
+    Carries Snowflake's statement-canceled errno: the server rolled the
+    statement back, so nothing was committed.
+    """
+
+    errno = STATEMENT_CANCELED_ERRNO
+
+
+class ProgrammingError(Exception):
+    """Fatal failure raised by FaultInjectingConnector.
+
+    Named like the DB-API error so ``connectors.retry`` classifies it alike.
+    """
+
+
+class FaultInjectingConnector:
+    """Wraps a connector and makes ``execute_batch`` fail or slow down.
+
+    Each batch fails with probability ``failure_rate`` (a transient
+    connection error), or with a timeout when its parameters exceed
+    ``max_batch_bytes``. ``fatal_rate`` injects non-retryable errors. These
+    faults are raised before the batch is sent. ``lost_ack_rate`` instead
+    commits the batch and then raises a connection error, like a connection
+    dropping before the server's acknowledgement arrives.
+    ``seconds_per_mb`` adds latency proportional to the batch size, plus a
+    fixed ``seconds_per_batch`` round trip, so adaptive batch sizing sees a
+    realistic cost curve. Everything else is delegated to the wrapped
+    connector, e.g. SQLiteConnector.
+    """
+
+    def __init__(
+        self,
+        connector,
+        failure_rate: float = 0.0,
+        fatal_rate: float = 0.0,
+        max_batch_bytes: Optional[int] = None,
+        lost_ack_rate: float = 0.0,
+        seconds_per_batch: float = 0.0,
+        seconds_per_mb: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            connector: Connector receiving the calls that do not fail
+            failure_rate: Probability of a transient error per batch
+            fatal_rate: Probability of a fatal error per batch
+            max_batch_bytes: Batches larger than this time out
+            lost_ack_rate: Probability of a connection error raised after
+                the batch was committed
+            seconds_per_batch: Simulated round-trip latency
+            seconds_per_mb: Simulated latency per MB of parameters
+            seed: Seed for reproducible failures
+        """
+        self.connector = connector
+        self.failure_rate = failure_rate
+        self.fatal_rate = fatal_rate
+        self.max_batch_bytes = max_batch_bytes
+        self.lost_ack_rate = lost_ack_rate
+        self.seconds_per_batch = seconds_per_batch
+        self.seconds_per_mb = seconds_per_mb
+        self.random = random.Random(seed)  # nosec B311: not crypto
+        self.injected: Dict[str, int] = {
+            "transient": 0,
+            "timeout": 0,
+            "fatal": 0,
+            "lost_ack": 0,
+        }
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.connector, name)
+
+    def _inject(self, kind: str) -> None:
+        with self._lock:
+            self.injected[kind] += 1
+
+    def execute_batch(self, sql: str, params_list: list) -> None:
+        """Execute a batch on the wrapped connector unless a fault is injected.
+
+        Args:
+            sql: SQL query to execute
+            params_list: List of parameter sets for the query
+        """
+        size = sum(
+            len(value)
+            for params in params_list
+            for value in params
+            if isinstance(value, str)
+        )
+        with self._lock:
+            draw = self.random.random()
+        time.sleep(self.seconds_per_batch + self.seconds_per_mb * size / 1e6)
+
+        if draw < self.fatal_rate:
+            self._inject("fatal")
+            raise mark_not_sent(ProgrammingError("Injected fatal error"))
+        if draw < self.fatal_rate + self.failure_rate:
+            self._inject("transient")
+            raise mark_not_sent(InjectedConnectionError("Injected connection reset"))
+        if self.max_batch_bytes is not None and size > self.max_batch_bytes:
+            self._inject("timeout")
+            raise InjectedTimeoutError(
+                f"Injected timeout: batch of {size} bytes exceeds "
+                f"{self.max_batch_bytes}"
+            )
+        self.connector.execute_batch(sql, params_list)
+        if draw < self.fatal_rate + self.failure_rate + self.lost_ack_rate:
+            self._inject("lost_ack")
+            raise InjectedConnectionError("Injected connection reset after commit")
@@ -0,0 +1,295 @@
+"""Thread-safe bounded connection pool."""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection becomes available within the checkout timeout."""
+
+    pass
+
+
+class PoolClosedError(Exception):
+    """Raised when a connection is requested from a closed pool."""
+
+    pass
+
+
+class _PooledConnection:
+    """A connection together with its bookkeeping timestamps."""
+
+    __slots__ = ("connection", "created_at", "last_used")
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+def default_health_check(connection: Any) -> bool:
+    """Consider a connection healthy unless it reports itself closed."""
+    is_closed = getattr(connection, "is_closed", None)
+    return not (callable(is_closed) and is_closed())
+
+
+class ConnectionPool:
+    """Bounded pool of reusable connections.
+
+    Connections are created on demand up to ``max_size``; callers block (with
+    a timeout) when the pool is exhausted. Idle connections are health-checked
+    on checkout, evicted after ``max_idle_seconds`` (keeping ``min_size``
+    warm) and recycled once older than ``max_lifetime_seconds``. After
+    ``close_all`` the pool refuses checkouts and closes connections as they
+    are released.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        min_size: int = 0,
+        max_size: int = 4,
+        max_idle_seconds: float = 300.0,
+        max_lifetime_seconds: float = 3600.0,
+        timeout: float = 30.0,
+        health_check: Callable[[Any], bool] = default_health_check,
+    ):
+        """Initialize the pool.
+
+        Args:
+            connect: Factory returning a new connection
+            min_size: Idle connections kept open despite idle eviction
+            max_size: Maximum number of open connections
+            max_idle_seconds: Close connections idle for longer than this
+            max_lifetime_seconds: Close connections older than this
+            timeout: Seconds to wait for a free connection before failing
+            health_check: Returns False for connections that must be discarded
+        """
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size >= 1")
+
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self.max_lifetime_seconds = max_lifetime_seconds
+        self.timeout = timeout
+        self.health_check = health_check
+
+        self._idle: List[_PooledConnection] = []
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._stats = {
+            "creations": 0,
+            "hits": 0,
+            "waits": 0,
+            "evictions": 0,
+            "discards": 0,
+        }
+
+    def _expired(self, pooled: _PooledConnection, now: float) -> bool:
+        """Check whether a connection exceeded its maximum lifetime."""
+        return now - pooled.created_at > self.max_lifetime_seconds
+
+    def _evict_idle(self, now: float) -> List[_PooledConnection]:
+        """Remove stale idle connections; must be called with the lock held."""
+        keep, evicted = [], []
+        for pooled in self._idle:
+            stale = now - pooled.last_used > self.max_idle_seconds
+            if self._expired(pooled, now) or (stale and self._size > self.min_size):
+                evicted.append(pooled)
+                self._size -= 1
+            else:
+                keep.append(pooled)
+        self._idle = keep
+        self._stats["evictions"] += len(evicted)
+        return evicted
+
+    @staticmethod
+    def _close(pooled: _PooledConnection) -> None:
+        """Close a connection, ignoring errors from already broken ones."""
+        try:
+            pooled.connection.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection: {e}")
+
+    def acquire(self) -> Any:
+        """Check a connection out of the pool.
+
+        Returns:
+            An open connection; hand it back with ``release``
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for ``timeout`` seconds
+            PoolClosedError: If the pool was closed
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            pooled = None
+            evicted: List[_PooledConnection] = []
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise PoolClosedError("Connection pool is closed")
+                    evicted.extend(self._evict_idle(time.monotonic()))
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        self._stats["hits"] += 1
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f"No connection available after {self.timeout}s "
+                            f"(max_size={self.max_size})"
+                        )
+                    self._stats["waits"] += 1
+                    self._condition.wait(remaining)
+
+            for stale in evicted:
+                self._close(stale)
+
+            if pooled is None:
+                # Open the new connection outside the lock
+                try:
+                    connection = self.connect()
+                except Exception:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+                pooled = _PooledConnection(connection)
+                with self._condition:
+                    self._stats["creations"] += 1
+                    closed = self._closed
+                    if not closed:
+                        self._in_use[id(connection)] = pooled
+                if closed:
+                    self._discard(pooled)
+                    raise PoolClosedError("Connection pool is closed")
+                return connection
+
+            if self.health_check(pooled.connection):
+                with self._condition:
+                    self._in_use[id(pooled.connection)] = pooled
+                return pooled.connection
+
+            # Unhealthy: drop it and try again
+            self._discard(pooled)
+
+    def _discard(self, pooled: _PooledConnection) -> None:
+        """Close a connection and free its slot."""
+        self._close(pooled)
+        with self._condition:
+            self._size -= 1
+            self._stats["discards"] += 1
+            self._condition.notify()
+
+    def release(self, connection: Any, discard: bool = False) -> None:
+        """Return a connection to the pool.
+
+        Args:
+            connection: Connection obtained from ``acquire``
+            discard: Close the connection instead of reusing it
+        """
+        with self._condition:
+            pooled = self._in_use.pop(id(connection), None)
+        if pooled is None:
+            pooled = _PooledConnection(connection)
+        pooled.last_used = time.monotonic()
+
+        with self._condition:
+            reuse = not (
+                discard or self._closed or self._expired(pooled, pooled.last_used)
+            )
+            if reuse:
+                self._idle.append(pooled)
+                self._condition.notify()
+        if not reuse:
+            self._discard(pooled)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of a ``with`` block.
+
+        The connection is discarded rather than reused if the block raises.
+        """
+        connection = self.acquire()
+        try:
+            yield connection
+        except Exception:
+            self.release(connection, discard=True)
+            raise
+        else:
+            self.release(connection)
+
+    def warm(self) -> None:
+        """Open connections until ``min_size`` are idle in the pool."""
+        connections = []
+        with self._condition:
+            missing = min(self.min_size - len(self._idle), self.max_size - self._size)
+        for _ in range(max(missing, 0)):
+            connections.append(self.acquire())
+        for connection in connections:
+            self.release(connection)
+
+    def close_all(self) -> None:
+        """Close the pool and its idle connections.
+
+        In-use connections are closed when released; further ``acquire``
+        calls, including ones waiting for a connection, raise
+        ``PoolClosedError``.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for pooled in idle:
+            self._close(pooled)
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool statistics.
+
+        Returns:
+            Counters for creations, hits, waits, evictions and discards plus
+            the current number of idle and in-use connections
+        """
+        with self._condition:
+            stats = dict(self._stats)
+            stats["idle"] = len(self._idle)
+            stats["in_use"] = self._size - len(self._idle)
+            return stats
+
+    def __repr__(self) -> str:
+        return f"ConnectionPool(max_size={self.max_size}, stats={self.stats()})"
+
+
+def create_pool(connect: Callable[[], Any], settings: Optional[Dict] = None):
+    """Create a pool from ``pool_*`` application settings.
+
+    Args:
+        connect: Factory returning a new connection
+        settings: Application configuration dictionary
+
+    Returns:
+        ConnectionPool instance
+    """
+    settings = settings or {}
+    return ConnectionPool(
+        connect,
+        min_size=int(settings.get("pool_min_size", 0)),
+        max_size=int(settings.get("pool_max_size", 4)),
+        max_idle_seconds=float(settings.get("pool_max_idle_seconds", 300)),
+        max_lifetime_seconds=float(settings.get("pool_max_lifetime_seconds", 3600)),
+        timeout=float(settings.get("pool_timeout", 30)),
+    )
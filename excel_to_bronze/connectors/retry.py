@@ -0,0 +1,202 @@
+"""Retry policy for connector calls: error classification and jittered backoff."""
+import random
+from typing import Dict, Optional
+
+# DB-API and Snowflake connector error classes, matched by name so the
+# classification also covers the SQLite stand-in and needs no driver import.
+# Fatal names are checked first along the MRO, e.g. NonRetryableTlsError is
+# an OperationalError that must not be retried.
+FATAL_ERRORS = frozenset(
+    {
+        "ProgrammingError",
+        "IntegrityError",
+        "DataError",
+        "NotSupportedError",
+        "NonRetryableTlsError",
+        "ForbiddenError",
+        "BadRequest",
+        "MethodNotAllowed",
+        "MissingDependencyError",
+    }
+)
+RETRYABLE_ERRORS = frozenset(
+    {
+        "OperationalError",
+        "InterfaceError",
+        "InternalError",
+        "InternalServerError",
+        "ServiceUnavailableError",
+        "BadGatewayError",
+        "GatewayTimeoutError",
+        "RequestTimeoutError",
+        "TooManyRequests",
+        "OtherHTTPRetryableError",
+        "RequestExceedMaxRetryError",
+        "TokenExpiredError",
+        "ConnectionError",
+        "TimeoutError",
+    }
+)
+TIMEOUT_ERRORS = frozenset(
+    {"TimeoutError", "RequestTimeoutError", "GatewayTimeoutError"}
+)
+
+# Snowflake error codes for statements cancelled by a statement or warehouse
+# timeout
+TIMEOUT_ERRNOS = frozenset({604, 630})
+
+# SQLSTATE classes of transient failures: connection exceptions, operator
+# intervention (e.g. statement timeout) and transaction rollbacks
+RETRYABLE_SQLSTATE_CLASSES = ("08", "40", "57")
+
+
+def _error_names(error: BaseException):
+    return [cls.__name__ for cls in type(error).__mro__]
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Whether an error means a statement or request took too long.
+
+    Args:
+        error: Exception raised by a connector
+
+    Returns:
+        True for timeouts and cancelled statements
+    """
+    if getattr(error, "errno", None) in TIMEOUT_ERRNOS:
+        return True
+    if str(getattr(error, "sqlstate", None) or "") == "57014":
+        return True
+    return any(name in TIMEOUT_ERRORS for name in _error_names(error))
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Classify a connector error as transient or fatal.
+
+    Connection problems, timeouts, throttling and server-side errors are
+    worth retrying; SQL, data and permission errors fail the same way every
+    time. Errors of unknown type are treated as fatal.
+
+    Args:
+        error: Exception raised by a connector
+
+    Returns:
+        True if the call may succeed when retried
+    """
+    if is_timeout(error):
+        return True
+    sqlstate = str(getattr(error, "sqlstate", None) or "")
+    if sqlstate.startswith(RETRYABLE_SQLSTATE_CLASSES):
+        return True
+    for name in _error_names(error):
+        if name in FATAL_ERRORS:
+            return False
+        if name in RETRYABLE_ERRORS:
+            return True
+    return False
+
+
+def mark_not_sent(error: BaseException) -> BaseException:
+    """Record that an error was raised before the statement reached the server.
+
+    Args:
+        error: Exception raised e.g. while acquiring a connection
+
+    Returns:
+        The same exception
+    """
+    error.statement_sent = False
+    return error
+
+
+def may_have_committed(error: BaseException) -> bool:
+    """Whether a failed write may nevertheless have been committed.
+
+    Under autocommit a timeout or a dropped connection can arrive after the
+    server stored the rows. Only errors raised before the statement was sent
+    (see ``mark_not_sent``) and statements the server cancelled are known
+    not to have committed.
+
+    Args:
+        error: Exception raised by a connector
+
+    Returns:
+        False only if the statement certainly did not commit
+    """
+    if getattr(error, "statement_sent", True) is False:
+        return False
+    if getattr(error, "errno", None) in TIMEOUT_ERRNOS:
+        return False
+    return str(getattr(error, "sqlstate", None) or "") != "57014"
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter for transient connector errors.
+
+    The delay before retry ``n`` (0-based) is drawn between half and all of
+    ``min(max_delay, base_delay * 2**n)`` ("equal jitter"), so concurrent
+    writers that failed together do not retry in lockstep.
+    """
+
+    def __init__(
+        self,
+        retries: int = 2,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+    ):
+        """Initialize the policy.
+
+        Args:
+            retries: Retries after the first attempt
+            base_delay: Delay before the first retry, in seconds
+            max_delay: Upper bound for any delay, in seconds
+            jitter: Randomize delays
+        """
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """Whether to retry after a failed attempt.
+
+        Args:
+            error: Exception raised by the attempt
+            attempt: 0-based number of the failed attempt
+
+        Returns:
+            True if retries remain and the error is transient
+        """
+        return attempt < self.retries and is_retryable(error)
+
+    def delay(self, attempt: int) -> float:
+        """Get the delay before retrying a failed attempt.
+
+        Args:
+            attempt: 0-based number of the failed attempt
+
+        Returns:
+            Seconds to wait
+        """
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)  # nosec B311: not crypto
+        return delay
+
+
+def create_retry_policy(settings: Optional[Dict] = None) -> RetryPolicy:
+    """Create the retry policy configured by ``write_retry*`` settings.
+
+    Args:
+        settings: Application configuration dictionary
+
+    Returns:
+        RetryPolicy
+    """
+    settings = settings or {}
+    return RetryPolicy(
+        retries=int(settings.get("write_retries", 2)),
+        base_delay=float(settings.get("write_retry_delay", 1.0)),
+        max_delay=float(settings.get("write_retry_max_delay", 30.0)),
+    )
@@ -1,17 +1,59 @@
 """Snowflake connection management."""
+import threading
 from contextlib import contextmanager
-from typing import Any, Dict, Optional
-
-import snowflake.connector
+from typing import Any, Dict, Iterator, Optional
 
 from excel_to_bronze.config import config
+from excel_to_bronze.connectors.cache import create_result_cache
+from excel_to_bronze.connectors.pool import create_pool
+from excel_to_bronze.connectors.retry import mark_not_sent
 from excel_to_bronze.utils.logging import setup_logging
+from excel_to_bronze.utils.metrics import metrics
 
 logger = setup_logging()
 
+# Batch types ``stream_query`` can yield
+RESULT_FORMATS = ("arrow", "pandas")
+
+
+def iter_result_batches(cursor, result_format: str = "arrow") -> Iterator[Any]:
+    """Yield the result of an executed cursor one batch at a time.
+
+    The driver downloads result chunks as they are consumed, so memory
+    follows the batch size rather than the result size.
+
+    Args:
+        cursor: Cursor on which a query was executed
+        result_format: ``arrow`` for pyarrow Tables or ``pandas`` for
+            DataFrames
+
+    Yields:
+        One pyarrow Table or DataFrame per result chunk
+
+    Raises:
+        ValueError: If the result format is not supported
+    """
+    if result_format == "arrow":
+        batches = cursor.fetch_arrow_batches()
+    elif result_format == "pandas":
+        batches = cursor.fetch_pandas_batches()
+    else:
+        raise ValueError(
+            f"Unsupported result format: {result_format}. "
+            f"Supported: {', '.join(RESULT_FORMATS)}"
+        )
+    for batch in batches:
+        metrics.increment("query_batches_total")
+        yield batch
+
 
 class SnowflakeConnector:
-    """Manages connections to Snowflake with connection pooling support."""
+    """Manages connections to Snowflake with connection pooling support.
+
+    The driver is imported and the pool created on first use, so importing
+    this module (e.g. for ``--help`` or a file the ledger skips) costs
+    neither.
+    """
 
     _instance = None
 
@@ -28,43 +70,110 @@ class SnowflakeConnector:
         if getattr(self, "_initialized", False):
             return
 
-        self.snowflake_config = config.get_snowflake_config()
-        self.connection_pool = {}
+        self._pool = None
+        self._result_cache = None
+        self._cache_configured = False
+        # Guards the lazy creation of the pool and cache, which concurrent
+        # writer threads may request at the same time
+        self._init_lock = threading.Lock()
         self._initialized = True
 
+    @property
+    def connection_pool(self):
+        """Connection pool, created from the configuration on first use."""
+        if self._pool is None:
+            with self._init_lock:
+                if self._pool is None:
+                    self._pool = create_pool(
+                        self._connect, config.get_application_config()
+                    )
+        return self._pool
+
+    @connection_pool.setter
+    def connection_pool(self, pool) -> None:
+        self._pool = pool
+
+    @property
+    def result_cache(self):
+        """Query result cache from the configuration, or None if disabled."""
+        if not self._cache_configured:
+            with self._init_lock:
+                if not self._cache_configured:
+                    self._result_cache = create_result_cache(
+                        config.get_application_config()
+                    )
+                    self._cache_configured = True
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, cache) -> None:
+        self._result_cache = cache
+        self._cache_configured = True
+
+    def _connect(self):
+        """Open a new Snowflake connection (used by the connection pool)."""
+        import snowflake.connector
+
+        snowflake_config = config.get_snowflake_config()
+        with metrics.timer("connection_open_seconds"):
+            connection = snowflake.connector.connect(
+                user=snowflake_config["user"],
+                password=snowflake_config["password"],
+                account=snowflake_config["account"],
+                warehouse=snowflake_config["warehouse"],
+                database=snowflake_config["database"],
+                schema=snowflake_config["schema"],
+            )
+        metrics.increment("connections_opened_total")
+        logger.debug("Connected to Snowflake successfully")
+        return connection
+
     @contextmanager
     def get_connection(self):
-        """Get a Snowflake connection using context manager pattern.
+        """Borrow a pooled Snowflake connection using context manager pattern.
+
+        The connection goes back to the pool when the block exits, or is
+        closed if the block raised.
 
         Usage:
             with snowflake_connector.get_connection() as conn:
                 # Use connection
         """
-        connection = None
+        # Hand the connection back to the pool it came from, even if close()
+        # replaced the pool in the meantime
+        pool = self.connection_pool
         try:
-            # Establish connection
-            connection = snowflake.connector.connect(
-                user=self.snowflake_config["user"],
-                password=self.snowflake_config["password"],
-                account=self.snowflake_config["account"],
-                warehouse=self.snowflake_config["warehouse"],
-                database=self.snowflake_config["database"],
-                schema=self.snowflake_config["schema"],
-            )
-            logger.debug("Connected to Snowflake successfully")
-            yield connection
+            connection = pool.acquire()
         except Exception as e:
             logger.error(f"Failed to connect to Snowflake: {str(e)}")
+            # Nothing was sent, so retrying cannot apply a statement twice
+            mark_not_sent(e)
+            raise
+
+        try:
+            yield connection
+        except BaseException:
+            # Also covers GeneratorExit when a stream_query is abandoned
+            pool.release(connection, discard=True)
+            logger.debug("Discarded Snowflake connection after error")
             raise
-        finally:
-            # Close connection when done
-            if connection:
-                connection.close()
-                logger.debug("Closed Snowflake connection")
+        else:
+            pool.release(connection)
+
+    def close(self) -> None:
+        """Close the connection pool; the next query opens a new one."""
+        with self._init_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close_all()
 
     def execute_query(self, sql: str, params: Optional[Dict[str, Any]] = None) -> list:
         """Execute a SQL query on Snowflake.
 
+        With the result cache enabled, read-only queries are answered from
+        it when possible, and other statements drop the cached results of
+        the tables they write to.
+
         Args:
             sql: SQL query to execute
             params: Parameters for the query
@@ -72,11 +181,69 @@ class SnowflakeConnector:
         Returns:
             Query results as a list of records
         """
-        with self.get_connection() as conn:
+        cache = self.result_cache
+        key = cache.key(sql, params) if cache is not None else None
+        if key is not None:
+            rows = cache.get(key)
+            if rows is not None:
+                return rows
+            generation = cache.generation
+
+        with self.get_connection() as conn, metrics.timer("query_seconds"):
             cursor = conn.cursor()
             try:
                 cursor.execute(sql, params or {})
-                return cursor.fetchall()
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+
+        if key is not None:
+            cache.put(key, sql, rows, generation)
+        elif cache is not None:
+            cache.invalidate(sql)
+        return rows
+
+    def stream_query(
+        self,
+        sql: str,
+        params: Optional[Dict[str, Any]] = None,
+        result_format: str = "arrow",
+    ) -> Iterator[Any]:
+        """Execute a SQL query and stream its result in batches.
+
+        Unlike ``execute_query`` the rows are never materialized as Python
+        tuples and results are not cached. The pooled connection stays
+        checked out until the generator is exhausted or closed.
+
+        Args:
+            sql: SQL query to execute
+            params: Parameters for the query
+            result_format: ``arrow`` for pyarrow Tables or ``pandas`` for
+                DataFrames
+
+        Returns:
+            Iterator of one pyarrow Table or DataFrame per result chunk
+
+        Raises:
+            ValueError: If the result format is not supported
+        """
+        if result_format not in RESULT_FORMATS:
+            raise ValueError(
+                f"Unsupported result format: {result_format}. "
+                f"Supported: {', '.join(RESULT_FORMATS)}"
+            )
+        return self._stream_query(sql, params, result_format)
+
+    def _stream_query(
+        self, sql: str, params: Optional[Dict[str, Any]], result_format: str
+    ) -> Iterator[Any]:
+        """Generator behind ``stream_query``, run lazily on first iteration."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                with metrics.timer("query_seconds"):
+                    cursor.execute(sql, params or {})
+                yield from iter_result_batches(cursor, result_format)
             finally:
                 cursor.close()
 
@@ -87,13 +254,15 @@ class SnowflakeConnector:
             sql: SQL query to execute
             params_list: List of parameter sets for the query
         """
-        with self.get_connection() as conn:
+        with self.get_connection() as conn, metrics.timer("execute_batch_seconds"):
             cursor = conn.cursor()
             try:
                 cursor.executemany(sql, params_list)
                 conn.commit()
             finally:
                 cursor.close()
+        if self.result_cache is not None:
+            self.result_cache.invalidate(sql)
 
 
 # Default instance
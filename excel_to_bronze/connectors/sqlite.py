@@ -0,0 +1,109 @@
+"""SQLite stand-in for the Snowflake connector."""
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+_NAMED_PARAM = re.compile(r"%\((\w+)\)s")
+
+
+class SQLiteConnector:
+    """Connector with the SnowflakeConnector interface backed by SQLite.
+
+    Statements written for Snowflake are translated (``%s`` and ``%(name)s``
+    placeholders, ``CURRENT_TIMESTAMP()``) and run on a single connection
+    guarded by a lock, so the ingestion code can run end to end without a
+    Snowflake account, e.g. in benchmarks.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """Initialize the connector.
+
+        Args:
+            path: SQLite database file, or ``:memory:``
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.bytes_written = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def translate(sql: str) -> str:
+        """Rewrite Snowflake SQL into SQLite syntax.
+
+        Args:
+            sql: Statement using Snowflake placeholders and functions
+
+        Returns:
+            Equivalent SQLite statement
+        """
+        sql = _NAMED_PARAM.sub(r":\1", sql).replace("%s", "?")
+        return sql.replace("CURRENT_TIMESTAMP()", "CURRENT_TIMESTAMP")
+
+    def create_table(self, table: str) -> None:
+        """Create a bronze table if it does not exist.
+
+        Args:
+            table: Table name
+        """
+        self.execute_query(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id TEXT, filename TEXT, uploaded_at TEXT, raw_data TEXT, load_id TEXT
+            )
+            """
+        )
+
+    @contextmanager
+    def get_connection(self):
+        """Use the shared connection exclusively for the duration of a block.
+
+        The transaction is rolled back if the block raises.
+        """
+        with self._lock:
+            try:
+                yield self.connection
+            except Exception:
+                self.connection.rollback()
+                raise
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.connection.close()
+
+    def execute_query(self, sql: str, params: Optional[Dict[str, Any]] = None) -> list:
+        """Execute a SQL query.
+
+        Args:
+            sql: SQL query to execute
+            params: Parameters for the query
+
+        Returns:
+            Query results as a list of records
+        """
+        with self.get_connection() as conn:
+            rows = conn.execute(self.translate(sql), params or {}).fetchall()
+            conn.commit()
+            return rows
+
+    def execute_batch(self, sql: str, params_list: list) -> None:
+        """Execute a batch of SQL statements.
+
+        Args:
+            sql: SQL query to execute
+            params_list: List of parameter sets for the query
+        """
+        with self.get_connection() as conn:
+            conn.executemany(self.translate(sql), params_list)
+            conn.commit()
+            self.bytes_written += sum(
+                len(value)
+                for params in params_list
+                for value in params
+                if isinstance(value, str)
+            )
@@ -0,0 +1,284 @@
+"""Stage-based bulk loading (PUT + COPY INTO) for the bronze table."""
+import gzip
+import json
+import os
+import shutil
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+# Column order of the rows produced by ExcelIngestor.prepare_data
+STAGED_COLUMNS = ("id", "filename", "raw_data")
+
+# "arrow" files hold typed columns (see ingestion.arrow) rather than JSON rows
+FILE_FORMATS = {
+    "ndjson": ".ndjson.gz",
+    "parquet": ".parquet",
+    "arrow": ".arrow.parquet",
+}
+
+# Position of rows_loaded in the per-file result rows returned by COPY INTO
+ROWS_LOADED_COLUMN = 3
+
+
+def write_stage_file(rows: Sequence[Tuple], path: str, file_format: str) -> str:
+    """Write prepared bronze rows to a local file ready for staging.
+
+    Args:
+        rows: Tuples of (id, filename, raw_data)
+        path: Destination path without extension
+        file_format: ``ndjson`` (gzip-compressed) or ``parquet``
+
+    Returns:
+        Path of the written file
+    """
+    if file_format not in ("ndjson", "parquet"):
+        raise ValueError(f"Unsupported stage file format: {file_format}")
+    file_path = path + FILE_FORMATS[file_format]
+
+    if file_format == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = list(zip(*rows)) if rows else [(), (), ()]
+        table = pa.table(
+            {
+                name: pa.array(values, type=pa.string())
+                for name, values in zip(STAGED_COLUMNS, columns)
+            }
+        )
+        pq.write_table(table, file_path, compression="snappy")
+    else:
+        with gzip.open(file_path, "wt", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(dict(zip(STAGED_COLUMNS, row))))
+                f.write("\n")
+
+    return file_path
+
+
+def write_arrow_file(table, path: str) -> str:
+    """Write an Arrow table from ``dataframe_to_arrow`` as Parquet for staging.
+
+    Args:
+        table: ``pyarrow.Table`` to write
+        path: Destination path without extension
+
+    Returns:
+        Path of the written file
+    """
+    import pyarrow.parquet as pq
+
+    file_path = path + FILE_FORMATS["arrow"]
+    pq.write_table(table, file_path, compression="snappy", use_dictionary=True)
+    return file_path
+
+
+def read_stage_file(file_path: str) -> List[Tuple]:
+    """Read rows back from a file written by ``write_stage_file``.
+
+    Arrow files are turned into bronze rows the way COPY INTO does, by
+    combining each row's metadata and data struct into one JSON object.
+
+    Args:
+        file_path: Path to staged file
+
+    Returns:
+        Tuples of (id, filename, raw_data)
+    """
+    if file_path.endswith(FILE_FORMATS["arrow"]):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(file_path)
+        return [
+            (
+                record["id"],
+                record["filename"],
+                json.dumps(
+                    {
+                        "metadata": json.loads(record["metadata"]),
+                        "data": record["data"],
+                    },
+                    default=str,
+                ),
+            )
+            for record in table.to_pylist()
+        ]
+
+    if file_path.endswith(FILE_FORMATS["parquet"]):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(file_path)
+        return list(zip(*(table.column(name).to_pylist() for name in STAGED_COLUMNS)))
+
+    with gzip.open(file_path, "rt", encoding="utf-8") as f:
+        return [
+            tuple(record[name] for name in STAGED_COLUMNS)
+            for record in map(json.loads, f)
+        ]
+
+
+class Stage(ABC):
+    """Interface for a location files are uploaded to before COPY INTO."""
+
+    @abstractmethod
+    def put(self, file_path: str) -> str:
+        """Upload a local file to the stage.
+
+        Args:
+            file_path: Path to local file
+
+        Returns:
+            Name of the file on the stage
+        """
+        pass
+
+    @abstractmethod
+    def copy_into(self, table: str, files: List[str], file_format: str) -> int:
+        """Load staged files into a table.
+
+        Args:
+            table: Target table
+            files: Staged file names returned by ``put``
+            file_format: ``ndjson``, ``parquet`` or ``arrow``
+
+        Returns:
+            Number of rows loaded
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, files: List[str]) -> None:
+        """Remove files from the stage.
+
+        Args:
+            files: Staged file names returned by ``put``
+        """
+        pass
+
+
+class SnowflakeStage(Stage):
+    """Snowflake internal stage driven through PUT and COPY INTO."""
+
+    def __init__(self, connector, stage_name: str):
+        """Initialize the stage.
+
+        Args:
+            connector: SnowflakeConnector used to run the commands
+            stage_name: Stage reference, e.g. ``@%bronze_table`` or ``@my_stage``
+        """
+        self.connector = connector
+        self.stage_name = stage_name
+
+    def put(self, file_path: str) -> str:
+        """Upload a local file with PUT (already compressed, so no auto-compress)."""
+        self.connector.execute_query(
+            f"PUT 'file://{os.path.abspath(file_path)}' {self.stage_name} "
+            "AUTO_COMPRESS=FALSE OVERWRITE=TRUE PARALLEL=4"
+        )
+        return os.path.basename(file_path)
+
+    def copy_into(self, table: str, files: List[str], file_format: str) -> int:
+        """Load staged files with a single COPY INTO statement."""
+        if file_format in ("parquet", "arrow"):
+            format_options = "TYPE = PARQUET"
+        else:
+            format_options = "TYPE = JSON COMPRESSION = GZIP"
+        if file_format == "arrow":
+            # Typed data struct loads as an OBJECT; the bronze column gets JSON
+            raw_data = (
+                "TO_JSON(OBJECT_CONSTRUCT('metadata', "
+                "PARSE_JSON($1:metadata::STRING), 'data', $1:data))"
+            )
+        else:
+            raw_data = "$1:raw_data::STRING"
+        file_list = ", ".join(f"'{name}'" for name in files)
+
+        # Table and stage names come from config, not user input
+        # nosec
+        # B608: SQL injection is not possible as table name is fixed
+        copy_sql = f"""
+            COPY INTO {table} (id, filename, uploaded_at, raw_data)
+            FROM (
+                SELECT $1:id::STRING, $1:filename::STRING,
+                       CURRENT_TIMESTAMP(), {raw_data}
+                FROM {self.stage_name}
+            )
+            FILES = ({file_list})
+            FILE_FORMAT = ({format_options})
+        """
+        results = self.connector.execute_query(copy_sql)
+        return sum(
+            int(row[ROWS_LOADED_COLUMN])
+            for row in results
+            if len(row) > ROWS_LOADED_COLUMN
+        )
+
+    def remove(self, files: List[str]) -> None:
+        """Remove loaded files from the stage."""
+        for name in files:
+            self.connector.execute_query(f"REMOVE {self.stage_name}/{name}")
+
+
+class LocalStage(Stage):
+    """Local-filesystem stand-in for a Snowflake stage.
+
+    Files are copied into ``directory`` and COPY INTO appends their rows to
+    the in-memory ``tables`` mapping, so the bulk-load path can be exercised
+    without a Snowflake account.
+    """
+
+    def __init__(self, directory: str):
+        """Initialize the stage.
+
+        Args:
+            directory: Directory playing the role of the stage
+        """
+        self.directory = directory
+        self.tables: Dict[str, List[Tuple]] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def put(self, file_path: str) -> str:
+        """Copy a local file into the stage directory."""
+        shutil.copy(file_path, self.directory)
+        return os.path.basename(file_path)
+
+    def copy_into(self, table: str, files: List[str], file_format: str) -> int:
+        """Append the rows of the staged files to ``tables[table]``."""
+        _ = file_format  # Format is inferred from the file extension
+        loaded = 0
+        for name in files:
+            rows = read_stage_file(os.path.join(self.directory, name))
+            self.tables.setdefault(table, []).extend(rows)
+            loaded += len(rows)
+        return loaded
+
+    def remove(self, files: List[str]) -> None:
+        """Delete files from the stage directory."""
+        for name in files:
+            os.remove(os.path.join(self.directory, name))
+
+
+def get_stage(
+    connector,
+    table: str,
+    stage_name: Optional[str] = None,
+    local_dir: Optional[str] = None,
+) -> Stage:
+    """Create the stage configured for bulk loading.
+
+    Args:
+        connector: SnowflakeConnector used by the Snowflake stage
+        table: Target table (its table stage is the default)
+        stage_name: Named stage to use instead of the table stage
+        local_dir: Use a local directory stand-in instead of Snowflake
+
+    Returns:
+        Stage instance
+    """
+    if local_dir:
+        return LocalStage(local_dir)
+    return SnowflakeStage(connector, stage_name or f"@%{table}")
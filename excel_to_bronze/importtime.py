@@ -0,0 +1,230 @@
+"""Import-time benchmark for the command-line entry points.
+
+Runs each scenario in fresh interpreters under ``python -X importtime``,
+reports the import time and the slowest top-level imports, fails when a
+scenario imports a module it must not (e.g. pandas for ``--help``) and
+compares the import time with a stored JSON baseline.
+
+Usage:
+    python -m excel_to_bronze.importtime
+    python -m excel_to_bronze.importtime --baseline importtime.json --save-baseline
+    python -m excel_to_bronze.importtime --baseline importtime.json --threshold 0.25
+"""
+import argparse
+import json
+import os
+import subprocess  # nosec B404: runs the current interpreter only
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Interpreter arguments of each scenario
+SCENARIOS = {
+    "help": ["-m", "excel_to_bronze", "--help"],
+    "cli": ["-c", "import excel_to_bronze.__main__"],
+    "pipeline": ["-c", "import excel_to_bronze.ingestion.pipeline"],
+}
+
+# Modules a scenario must not import, with their submodules
+FORBIDDEN = {
+    "help": ("pandas", "numpy", "pyarrow", "snowflake.connector", "yaml"),
+    "cli": ("pandas", "numpy", "pyarrow", "snowflake.connector", "yaml"),
+    # pandas imports the pyarrow core itself when it is installed, so only
+    # the readers and writers the ingestion modules load on demand are banned
+    "pipeline": ("snowflake.connector", "pyarrow.csv", "pyarrow.parquet"),
+}
+
+# Top-level imports listed per scenario
+TOP_IMPORTS = 5
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Parse ``-X importtime`` output.
+
+    Args:
+        stderr: Standard error of the interpreter
+
+    Returns:
+        (module, self µs, cumulative µs, nesting depth) per imported module
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return imports
+
+
+def measure(args: Sequence[str], repeat: int) -> Dict:
+    """Time one scenario, keeping the fastest of ``repeat`` runs.
+
+    Args:
+        args: Interpreter arguments
+        repeat: Number of runs
+
+    Returns:
+        Dictionary with ``import_ms``, ``wall_ms``, ``modules`` and ``top``
+    """
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(  # nosec B603: fixed arguments
+            [sys.executable, "-X", "importtime", *args],
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+            check=False,
+        )
+        wall = time.perf_counter() - started
+        if completed.returncode != 0:
+            raise RuntimeError(
+                f"{' '.join(args)} exited with {completed.returncode}: "
+                f"{completed.stderr.strip().splitlines()[-1:]}"
+            )
+        imports = parse_importtime(completed.stderr)
+        total_us = sum(self_us for _, self_us, _, _ in imports)
+        if best is None or total_us < best[0]:
+            best = (total_us, wall, imports)
+
+    total_us, wall, imports = best
+    top = sorted(
+        (entry for entry in imports if entry[3] == 0), key=lambda e: e[2], reverse=True
+    )
+    return {
+        "import_ms": round(total_us / 1000, 1),
+        "wall_ms": round(wall * 1000, 1),
+        "modules": sorted(name for name, _, _, _ in imports),
+        "top": [[name, round(cum / 1000, 1)] for name, _, cum, _ in top[:TOP_IMPORTS]],
+    }
+
+
+def forbidden_imports(scenario: str, modules: Sequence[str]) -> List[str]:
+    """Find modules a scenario imported although it must not."""
+    return [
+        ban
+        for ban in FORBIDDEN.get(scenario, ())
+        if any(name == ban or name.startswith(ban + ".") for name in modules)
+    ]
+
+
+def run_benchmark(scenarios: Sequence[str], repeat: int = 3) -> Dict:
+    """Measure the import time of the given scenarios.
+
+    Args:
+        scenarios: Names from ``SCENARIOS``
+        repeat: Runs per scenario
+
+    Returns:
+        Dictionary with the Python version and one result per scenario
+    """
+    return {
+        "python": sys.version.split()[0],
+        "scenarios": {name: measure(SCENARIOS[name], repeat) for name in scenarios},
+    }
+
+
+def compare_to_baseline(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Find scenarios whose import time grew beyond a threshold.
+
+    Args:
+        results: Output of ``run_benchmark``
+        baseline: Earlier output of ``run_benchmark``
+        threshold: Allowed relative increase, e.g. 0.25 for 25%
+
+    Returns:
+        One message per regressed scenario
+    """
+    regressions = []
+    for name, result in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name, {}).get("import_ms")
+        current = result["import_ms"]
+        if previous and current > previous * (1 + threshold):
+            regressions.append(
+                f"{name}: {current:,.1f} ms vs baseline {previous:,.1f} ms "
+                f"({current / previous - 1:+.1%})"
+            )
+    return regressions
+
+
+def format_results(results: Dict) -> str:
+    """Format benchmark results as a plain-text table."""
+    lines = [f"{'scenario':<10} {'import ms':>10} {'wall ms':>9}  slowest imports"]
+    for name, result in results["scenarios"].items():
+        top = ", ".join(f"{module} {ms:.0f}" for module, ms in result["top"])
+        lines.append(
+            f"{name:<10} {result['import_ms']:>10.1f} {result['wall_ms']:>9.1f}  {top}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line interface for the import-time benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Measure the import time of the command-line entry points."
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=str,
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated scenarios from: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario")
+    parser.add_argument("--output", type=str, help="Write results to this JSON file")
+    parser.add_argument("--baseline", type=str, help="Baseline JSON file")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed relative import-time increase before failing (default 0.25)",
+    )
+    args = parser.parse_args(argv)
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown or not scenarios:
+        parser.error(f"--scenarios must use names from: {', '.join(SCENARIOS)}")
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline requires --baseline")
+    if args.baseline and not args.save_baseline and not os.path.exists(args.baseline):
+        parser.error(
+            f"Baseline {args.baseline} not found; create it with --save-baseline"
+        )
+
+    results = run_benchmark(scenarios, args.repeat)
+    print(format_results(results))
+    status = 0
+    for name, result in results["scenarios"].items():
+        banned = forbidden_imports(name, result["modules"])
+        if banned:
+            print(f"FORBIDDEN {name} imports {', '.join(banned)}")
+            status = 1
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regression beyond {args.threshold:.0%} of {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
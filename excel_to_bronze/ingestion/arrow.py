@@ -0,0 +1,125 @@
+"""Conversion of DataFrames to typed Arrow tables for columnar bulk loading."""
+import json
+import os
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from excel_to_bronze.connectors.stage import write_arrow_file
+from excel_to_bronze.utils.logging import setup_logging
+from excel_to_bronze.utils.metrics import metrics
+
+logger = setup_logging()
+
+
+def column_to_arrow(column: pd.Series) -> pa.Array:
+    """Convert a column to an Arrow array, keeping its type where possible.
+
+    Numeric and datetime columns convert without copying values into
+    Python objects. Object columns mixing incompatible types fall back to
+    strings.
+
+    Args:
+        column: DataFrame column
+
+    Returns:
+        Arrow array
+    """
+    try:
+        return pa.array(column, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        logger.debug(f"Column {column.name} has mixed types; storing as strings")
+        return pa.array(
+            column.astype(str).where(column.notna(), None), type=pa.string()
+        )
+
+
+def repeated(value: str, length: int) -> pa.DictionaryArray:
+    """Build a dictionary-encoded array repeating one string."""
+    return pa.DictionaryArray.from_arrays(
+        pa.array(np.zeros(length, dtype=np.int32)), pa.array([value])
+    )
+
+
+def dataframe_to_arrow(
+    df: pd.DataFrame,
+    filename: str,
+    extra_metadata: Optional[Dict[str, Any]] = None,
+) -> pa.Table:
+    """Convert a DataFrame to the Arrow layout loaded into the bronze table.
+
+    The table has ``id``, ``filename`` and ``metadata`` columns and a
+    ``data`` struct column holding the sheet's columns with their types
+    (plus ``id``, as in the JSON payload). The struct loads as a VARIANT
+    object; ``filename`` and the per-file ``metadata`` JSON are dictionary
+    encoded, so they are stored once per file.
+
+    Args:
+        df: DataFrame to convert (index holds the row ids)
+        filename: Original filename to store
+        extra_metadata: Additional keys for the metadata, e.g. the sheet name
+
+    Returns:
+        Arrow table
+    """
+    ids = pa.array(np.asarray(df.index)).cast(pa.string())
+    names = [str(col) for col in df.columns] + ["id"]
+    arrays = [column_to_arrow(column) for _, column in df.items()] + [ids]
+    data = pa.StructArray.from_arrays(arrays, names=names)
+
+    metadata = {
+        "column_names": names,
+        "dtypes": {
+            # Categorical columns are described by their values' type
+            name: str(getattr(array.type, "value_type", array.type))
+            for name, array in zip(names, arrays)
+        },
+        **(extra_metadata or {}),
+    }
+    return pa.table(
+        {
+            "id": ids,
+            "filename": repeated(filename, len(df)),
+            "metadata": repeated(json.dumps(metadata), len(df)),
+            "data": data,
+        }
+    )
+
+
+def write_arrow_files(
+    df: pd.DataFrame,
+    filename: str,
+    directory: str,
+    prefix: str,
+    batch_size: int,
+    extra_metadata: Optional[Dict[str, Any]] = None,
+) -> Iterator[str]:
+    """Write a DataFrame as Arrow Parquet files of ``batch_size`` rows.
+
+    Each file is written just before it is yielded, so a caller staging the
+    files one by one holds only one batch in Arrow form.
+
+    Args:
+        df: DataFrame to write (index holds the row ids)
+        filename: Original filename to store
+        directory: Directory to write the files to
+        prefix: File name prefix, followed by the batch number
+        batch_size: Rows per file
+        extra_metadata: Additional keys for the metadata, e.g. the sheet name
+
+    Yields:
+        Paths of the written files
+    """
+    for start in range(0, len(df), batch_size):
+        with metrics.timer("serialize_seconds", method="arrow"):
+            table = dataframe_to_arrow(
+                df.iloc[start : start + batch_size], filename, extra_metadata
+            )
+            file_path = write_arrow_file(
+                table,
+                os.path.join(directory, f"{prefix}_{start // batch_size:05d}"),
+            )
+        metrics.increment("rows_serialized_total", table.num_rows)
+        yield file_path
@@ -0,0 +1,218 @@
+"""Excel parsing backends and automatic backend selection."""
+import hashlib
+import importlib.util
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+
+class ExcelBackend:
+    """A pandas Excel engine together with the files it can read."""
+
+    def __init__(self, name: str, engine: str, module: str, extensions: Iterable[str]):
+        """Initialize the backend.
+
+        Args:
+            name: Backend name used in configuration
+            engine: ``engine`` argument passed to pandas
+            module: Module that must be importable for the backend to work
+            extensions: File extensions the backend can read
+        """
+        self.name = name
+        self.engine = engine
+        self.module = module
+        self.extensions = tuple(ext.lower() for ext in extensions)
+
+    def available(self) -> bool:
+        """Check whether the backend's parser is installed."""
+        return importlib.util.find_spec(self.module) is not None
+
+    def supports(self, file_path: str) -> bool:
+        """Check whether the backend can read a file, judging by its extension."""
+        return os.path.splitext(file_path)[1].lower() in self.extensions
+
+    def read(self, file_path: str, **kwargs) -> pd.DataFrame:
+        """Read a sheet into a DataFrame.
+
+        Args:
+            file_path: Path to Excel file or a file-like object
+            **kwargs: Additional arguments for pd.read_excel
+
+        Returns:
+            DataFrame with Excel data
+        """
+        return pd.read_excel(file_path, engine=self.engine, **kwargs)
+
+    def open(self, file_path: str) -> pd.ExcelFile:
+        """Open a workbook for reading several sheets.
+
+        Args:
+            file_path: Path to Excel file or a file-like object
+
+        Returns:
+            Open ``pd.ExcelFile``
+        """
+        return pd.ExcelFile(file_path, engine=self.engine)
+
+    def __repr__(self) -> str:
+        return f"ExcelBackend({self.name!r})"
+
+
+BACKENDS: Dict[str, ExcelBackend] = {}
+
+
+def register_backend(backend: ExcelBackend) -> ExcelBackend:
+    """Add a backend to the registry, replacing one with the same name.
+
+    Args:
+        backend: Backend to register
+
+    Returns:
+        The registered backend
+    """
+    BACKENDS[backend.name] = backend
+    return backend
+
+
+# Rust-based reader, much faster than openpyxl on large workbooks
+register_backend(
+    ExcelBackend(
+        "calamine", "calamine", "python_calamine", (".xlsx", ".xlsm", ".xls", ".xlsb")
+    )
+)
+# pandas opens openpyxl workbooks read-only
+register_backend(ExcelBackend("openpyxl", "openpyxl", "openpyxl", (".xlsx", ".xlsm")))
+register_backend(ExcelBackend("xlrd", "xlrd", "xlrd", (".xls",)))
+
+# Preference order for automatic selection
+SMALL_FILE_BACKENDS = ("openpyxl", "xlrd", "calamine")
+LARGE_FILE_BACKENDS = ("calamine", "openpyxl", "xlrd")
+
+
+def select_backend(
+    file_path: str,
+    override: Optional[str] = None,
+    large_file_bytes: int = 0,
+    size: Optional[int] = None,
+) -> ExcelBackend:
+    """Pick the backend to read a file with.
+
+    With ``override`` set to a backend name that backend is used, provided
+    it supports the file's extension (names without one are accepted).
+    Otherwise (``auto``) the first installed backend supporting the file's
+    extension is taken, preferring calamine for files of at least
+    ``large_file_bytes`` and openpyxl/xlrd, pandas' defaults, for smaller
+    ones.
+
+    Args:
+        file_path: Path to Excel file, or the original filename of in-memory
+            content
+        override: Backend name, or ``auto``/None for automatic selection
+        large_file_bytes: Size from which the fastest backend is preferred
+        size: Size of the content in bytes (defaults to the file's size)
+
+    Returns:
+        Selected backend
+
+    Raises:
+        ValueError: If the requested backend is unknown, not installed or
+            cannot read the file's extension, or no installed backend
+            supports the file
+    """
+    if override and override != "auto":
+        backend = BACKENDS.get(override)
+        if backend is None:
+            raise ValueError(
+                f"Unknown Excel backend: {override}. "
+                f"Available: {', '.join(BACKENDS)}"
+            )
+        if not backend.available():
+            raise ValueError(f"Excel backend {override} requires {backend.module}")
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension and not backend.supports(file_path):
+            raise ValueError(
+                f"Excel backend {override} cannot read {extension} files "
+                f"({file_path}). Supported: {', '.join(backend.extensions)}"
+            )
+        return backend
+
+    if size is None:
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            pass
+    large = size is not None and size >= large_file_bytes
+    preference = LARGE_FILE_BACKENDS if large else SMALL_FILE_BACKENDS
+    names = [name for name in preference if name in BACKENDS]
+    names += [name for name in BACKENDS if name not in names]  # Registered later
+
+    for name in names:
+        backend = BACKENDS[name]
+        if backend.supports(file_path) and backend.available():
+            return backend
+    raise ValueError(f"No installed Excel backend can read {file_path}")
+
+
+def compare_backends(
+    file_path: str,
+    backends: Optional[Iterable[str]] = None,
+    json_backend: Optional[str] = None,
+    **kwargs,
+) -> List[Dict]:
+    """Read a file with several backends and compare speed and output.
+
+    Each backend's DataFrame is serialized the way the bronze layer stores
+    it; backends agree when their ``raw_data_sha256`` values are equal.
+
+    Args:
+        file_path: Path to Excel file
+        backends: Backend names (defaults to all installed backends that
+            support the file)
+        json_backend: JSON backend used for serialization
+        **kwargs: Additional arguments for pd.read_excel
+
+    Returns:
+        One dictionary per backend with name, rows, read and serialize
+        seconds and the SHA-256 of the serialized rows
+    """
+    from excel_to_bronze.ingestion.serializers import DataSerializer
+
+    if backends is None:
+        backends = [
+            name
+            for name, backend in BACKENDS.items()
+            if backend.supports(file_path) and backend.available()
+        ]
+
+    results = []
+    for name in backends:
+        backend = select_backend(file_path, override=name)
+        started = time.perf_counter()
+        df = backend.read(file_path, **kwargs)
+        read_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        raw_data = DataSerializer.serialize_dataframe(df, json_backend=json_backend)
+        serialize_seconds = time.perf_counter() - started
+
+        digest = hashlib.sha256()
+        for value in raw_data:
+            digest.update(value.encode("utf-8"))
+            digest.update(b"\n")
+        results.append(
+            {
+                "backend": name,
+                "rows": len(df),
+                "read_seconds": round(read_seconds, 4),
+                "serialize_seconds": round(serialize_seconds, 4),
+                "raw_data_sha256": digest.hexdigest(),
+            }
+        )
+        logger.info(f"Backend {name}: {len(df)} rows in {read_seconds:.3f}s")
+    return results
@@ -1,13 +1,75 @@
 """Base classes for data ingestion."""
+import io
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import IO, Any, Callable, Dict, Iterator, Optional, Tuple, Type, Union
 
 import pandas as pd
 
 from excel_to_bronze.utils.logging import setup_logging
+from excel_to_bronze.utils.metrics import metrics
 
 logger = setup_logging()
 
+# A file path, in-memory file content or an already-parsed DataFrame
+Source = Union[str, bytes, bytearray, memoryview, IO[bytes], pd.DataFrame]
+
+
+def is_buffer(source: Any) -> bool:
+    """Check whether a source is in-memory file content rather than a path."""
+    return isinstance(source, (bytes, bytearray, memoryview)) or hasattr(source, "read")
+
+
+def as_file_like(source: Source) -> Source:
+    """Wrap raw bytes in a rewound file-like object; other sources pass through.
+
+    Args:
+        source: File path, in-memory content or DataFrame
+
+    Returns:
+        The source, with bytes-like content wrapped in ``io.BytesIO`` and
+        file-like objects positioned at their start
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def source_size(source: Source) -> Optional[int]:
+    """Get the size in bytes of a file or in-memory content.
+
+    Args:
+        source: File path, in-memory content or DataFrame
+
+    Returns:
+        Size in bytes, or None if unknown (e.g. for DataFrames)
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    if isinstance(source, memoryview):
+        return source.nbytes
+    if isinstance(source, io.BytesIO):
+        return source.getbuffer().nbytes
+    if isinstance(source, (str, os.PathLike)):
+        try:
+            return os.path.getsize(source)
+        except OSError:
+            return None
+    return None
+
+
+def describe_source(source: Source) -> str:
+    """Describe a source for log and error messages."""
+    if isinstance(source, pd.DataFrame):
+        return f"<DataFrame of {len(source)} rows>"
+    if is_buffer(source):
+        return "<in-memory file>"
+    return str(source)
+
 
 class DataIngestionError(Exception):
     """Base exception for data ingestion errors."""
@@ -15,6 +77,91 @@ class DataIngestionError(Exception):
     pass
 
 
+# Ingestor class for each lower-case file extension
+INGESTORS: Dict[str, Type["FileIngestion"]] = {}
+
+
+def register_ingestor(cls: Type["FileIngestion"]) -> Type["FileIngestion"]:
+    """Register an ingestor class for the file extensions it lists.
+
+    Usable as a class decorator. A class registered later for the same
+    extension replaces the earlier one.
+
+    Args:
+        cls: FileIngestion subclass with an ``extensions`` tuple
+
+    Returns:
+        The registered class
+    """
+    for ext in cls.extensions:
+        INGESTORS[ext.lower()] = cls
+    return cls
+
+
+def ingestor_class(filename: str) -> Type["FileIngestion"]:
+    """Look up the ingestor class registered for a file's extension.
+
+    Args:
+        filename: File path or name, or a bare extension such as ``".csv"``
+
+    Returns:
+        Registered FileIngestion subclass
+
+    Raises:
+        DataIngestionError: If no ingestor handles the extension
+    """
+    _, ext = os.path.splitext(filename)
+    if not ext and filename.startswith("."):
+        ext = filename
+    try:
+        return INGESTORS[ext.lower()]
+    except KeyError:
+        raise DataIngestionError(
+            f"Unsupported file extension: {ext}. Supported: {', '.join(INGESTORS)}"
+        ) from None
+
+
+class FileProgress:
+    """Progress callback adding up the chunks (or sheets) of one file.
+
+    Each chunk is written with its own batch counter starting from one. This
+    reports batches and rows for the whole file instead, with a total of 0
+    batches: the total is only known once the last chunk has been read.
+    """
+
+    def __init__(self, callback: Callable[[int, int, int], None]):
+        """Initialize the tracker.
+
+        Args:
+            callback: Called with (batches written, 0, rows written) for the
+                whole file after every written batch
+        """
+        self.callback = callback
+        self.batches_written = 0
+        self.rows_written = 0
+        self._chunk = (0, 0)
+        self._lock = threading.Lock()
+
+    def __call__(self, batches_written: int, _total_batches: int, rows: int) -> None:
+        """Report progress within the current chunk."""
+        with self._lock:
+            # Batches written concurrently may report out of order
+            self._chunk = (
+                max(self._chunk[0], batches_written),
+                max(self._chunk[1], rows),
+            )
+            batches_written = self.batches_written + self._chunk[0]
+            rows = self.rows_written + self._chunk[1]
+        self.callback(batches_written, 0, rows)
+
+    def chunk_finished(self) -> None:
+        """Add the current chunk to the file's totals; call after writing it."""
+        with self._lock:
+            self.batches_written += self._chunk[0]
+            self.rows_written += self._chunk[1]
+            self._chunk = (0, 0)
+
+
 class BaseIngestion(ABC):
     """Abstract base class for all ingestion processors."""
 
@@ -53,9 +200,12 @@ class BaseIngestion(ABC):
 class FileIngestion(BaseIngestion):
     """Base class for file-based ingestion processors."""
 
+    # File extensions the processor reads, used by register_ingestor
+    extensions: Tuple[str, ...] = ()
+
     def __init__(self):
         """Initialize the file ingestion processor."""
-        self.supported_extensions = []
+        self.supported_extensions = list(self.extensions)
 
     def validate(self, data: pd.DataFrame) -> bool:
         """Validate DataFrame before ingestion.
@@ -86,20 +236,75 @@ class FileIngestion(BaseIngestion):
         Raises:
             DataIngestionError: If validation fails
         """
-        import os
-
         # Check file exists
         if not os.path.isfile(file_path):
             raise DataIngestionError(f"File does not exist: {file_path}")
 
-        # Check file extension
-        _, ext = os.path.splitext(file_path)
+        self.validate_extension(file_path)
+        return True
+
+    def validate_buffer(self, buffer: Source, filename: Optional[str]) -> bool:
+        """Validate in-memory file content before processing.
+
+        Args:
+            buffer: File content as bytes, memoryview or a file-like object
+            filename: Original filename, whose extension identifies the format
+
+        Returns:
+            True if validation passes
+
+        Raises:
+            DataIngestionError: If validation fails
+        """
+        if not filename:
+            raise DataIngestionError(
+                "original_filename is required for in-memory files"
+            )
+        if source_size(buffer) == 0:
+            raise DataIngestionError(f"File is empty: {filename}")
+
+        self.validate_extension(filename)
+        return True
+
+    def validate_source(self, source: Source, filename: Optional[str] = None) -> bool:
+        """Validate a file path, in-memory file or DataFrame before processing.
+
+        DataFrames are checked by ``validate`` once they are processed.
+
+        Args:
+            source: File path, in-memory content or DataFrame
+            filename: Original filename (required for in-memory content)
+
+        Returns:
+            True if validation passes
+
+        Raises:
+            DataIngestionError: If validation fails
+        """
+        if isinstance(source, pd.DataFrame):
+            return True
+        if is_buffer(source):
+            return self.validate_buffer(source, filename)
+        return self.validate_file(source)
+
+    def validate_extension(self, filename: str) -> bool:
+        """Check that a filename has a supported extension.
+
+        Args:
+            filename: File path or name
+
+        Returns:
+            True if validation passes
+
+        Raises:
+            DataIngestionError: If the extension is not supported
+        """
+        _, ext = os.path.splitext(filename)
         if ext.lower() not in self.supported_extensions:
             raise DataIngestionError(
                 f"Unsupported file extension: {ext}. "
                 f"Supported: {', '.join(self.supported_extensions)}"
             )
-
         return True
 
     @abstractmethod
@@ -115,6 +320,26 @@ class FileIngestion(BaseIngestion):
         """
         pass
 
+    def read_chunks(
+        self, file_path: str, chunk_size: int, **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """Read data from file as a stream of DataFrame chunks.
+
+        The default implementation reads the whole file and slices it;
+        subclasses override this with a constant-memory reader.
+
+        Args:
+            file_path: Path to file
+            chunk_size: Maximum number of rows per chunk
+            **kwargs: Additional arguments for file reading
+
+        Yields:
+            DataFrame chunks of at most ``chunk_size`` rows
+        """
+        data = self.read_file(file_path, **kwargs)
+        for start in range(0, len(data), chunk_size):
+            yield data.iloc[start : start + chunk_size]
+
     @abstractmethod
     def write_data(self, data: pd.DataFrame, **kwargs) -> bool:
         """Write data to destination.
@@ -128,11 +353,12 @@ class FileIngestion(BaseIngestion):
         """
         pass
 
-    def process(self, file_path: str, **kwargs) -> bool:
+    def process(self, file_path: Source, **kwargs) -> bool:
         """Process the file and ingest data.
 
         Args:
-            file_path: Path to file
+            file_path: Path to file, in-memory file content or a DataFrame
+                that was already parsed
             **kwargs: Additional processing arguments
 
         Returns:
@@ -141,19 +367,75 @@ class FileIngestion(BaseIngestion):
         Raises:
             DataIngestionError: If processing fails
         """
+        started = time.perf_counter()
         try:
             # Validate file
-            self.validate_file(file_path)
+            self.validate_source(file_path, kwargs.get("original_filename"))
 
             # Read file - pass appropriate kwargs to read_file
-            data = self.read_file(file_path, **kwargs)
+            if isinstance(file_path, pd.DataFrame):
+                data = file_path
+            else:
+                data = self.read_file(file_path, **kwargs)
 
             # Validate data
             self.validate(data)
 
             # Write data
-            return self.write_data(data, **kwargs)
+            result = self.write_data(data, **kwargs)
+            metrics.file_ingested(time.perf_counter() - started, len(data))
+            return result
+
+        except Exception as e:
+            metrics.increment("files_failed_total")
+            name = kwargs.get("original_filename") or describe_source(file_path)
+            logger.error(f"Error processing file {name}: {e}")
+            raise DataIngestionError(f"Failed to process file: {str(e)}") from e
+
+    def process_stream(self, file_path: Source, chunk_size: int, **kwargs) -> bool:
+        """Process the file chunk by chunk so memory stays flat.
+
+        Each chunk goes through validation and ``write_data`` before the next
+        one is read. Chunks keep the file's row positions as their index, so
+        row ids continue across chunks. A ``progress_callback`` gets batches
+        and rows for the whole file (see ``FileProgress``).
+
+        Args:
+            file_path: Path to file
+            chunk_size: Maximum number of rows per chunk
+            **kwargs: Additional processing arguments
+
+        Returns:
+            True if successful
+
+        Raises:
+            DataIngestionError: If processing fails
+        """
+        started = time.perf_counter()
+        try:
+            # Validate file
+            self.validate_source(file_path, kwargs.get("original_filename"))
+
+            if kwargs.get("progress_callback"):
+                kwargs["progress_callback"] = FileProgress(kwargs["progress_callback"])
+            total_rows = 0
+            for chunk in self.read_chunks(file_path, chunk_size, **kwargs):
+                self.validate(chunk)
+                self.write_data(chunk, **kwargs)
+                if kwargs.get("progress_callback"):
+                    kwargs["progress_callback"].chunk_finished()
+                total_rows += len(chunk)
+                logger.info(
+                    f"Streamed {total_rows} rows from {describe_source(file_path)}"
+                )
+
+            if total_rows == 0:
+                raise DataIngestionError("DataFrame is empty or None")
+            metrics.file_ingested(time.perf_counter() - started, total_rows)
+            return True
 
         except Exception as e:
-            logger.error(f"Error processing file {file_path}: {str(e)}")
+            metrics.increment("files_failed_total")
+            name = kwargs.get("original_filename") or describe_source(file_path)
+            logger.error(f"Error processing file {name}: {e}")
             raise DataIngestionError(f"Failed to process file: {str(e)}") from e
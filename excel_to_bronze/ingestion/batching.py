@@ -0,0 +1,120 @@
+"""Adaptive batch sizing driven by a bytes budget and observed write latency."""
+import threading
+from typing import Dict, Optional
+
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+
+class AdaptiveBatchSizer:
+    """Picks the number of rows per batch from write feedback.
+
+    Batches never exceed ``target_bytes`` given the current row width, so
+    wide sheets get fewer rows per batch. Within that budget the row target
+    grows while per-batch throughput keeps improving, steps back when it
+    drops, shrinks proportionally when a batch takes longer than
+    ``target_seconds`` and is cut by ``shrink`` after every failed attempt.
+    Feedback may come from several writer threads.
+    """
+
+    def __init__(
+        self,
+        initial_rows: int,
+        target_bytes: int,
+        min_rows: int = 100,
+        max_rows: int = 100_000,
+        target_seconds: float = 10.0,
+        growth: float = 1.25,
+        shrink: float = 0.5,
+        tolerance: float = 0.05,
+    ):
+        """Initialize the sizer.
+
+        Args:
+            initial_rows: Row target before any feedback
+            target_bytes: Upper bound for the serialized size of a batch
+            min_rows: Smallest batch
+            max_rows: Largest batch
+            target_seconds: Batches taking longer than this shrink
+            growth: Factor applied while throughput improves
+            shrink: Factor applied after a failed attempt
+            tolerance: Relative throughput change treated as noise
+        """
+        self.target_bytes = target_bytes
+        self.min_rows = max(1, min_rows)
+        self.max_rows = max(self.min_rows, max_rows)
+        self.target_seconds = target_seconds
+        self.growth = growth
+        self.shrink = shrink
+        self.tolerance = tolerance
+        self.rows = float(self._clamp(initial_rows))
+        self.last_throughput: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _clamp(self, rows: float) -> float:
+        return min(self.max_rows, max(self.min_rows, rows))
+
+    def next_size(self, row_bytes: Optional[float] = None) -> int:
+        """Get the number of rows for the next batch.
+
+        Args:
+            row_bytes: Average serialized size of the rows to be batched
+
+        Returns:
+            Rows per batch
+        """
+        with self._lock:
+            rows = self.rows
+        if row_bytes:
+            rows = min(rows, self.target_bytes / row_bytes)
+        return int(self._clamp(rows))
+
+    def succeeded(self, rows: int, seconds: float) -> None:
+        """Adjust the row target after a batch was written.
+
+        Args:
+            rows: Rows in the batch
+            seconds: Time taken to write it
+        """
+        if rows <= 0 or seconds <= 0:
+            return
+        throughput = rows / seconds
+        with self._lock:
+            last = self.last_throughput
+            if seconds > self.target_seconds:
+                factor = max(self.shrink, self.target_seconds / seconds)
+                self.rows = self._clamp(self.rows * factor)
+            elif last is None or throughput > last * (1 + self.tolerance):
+                self.rows = self._clamp(self.rows * self.growth)
+            elif throughput < last * (1 - self.tolerance):
+                self.rows = self._clamp(self.rows / self.growth)
+            self.last_throughput = throughput
+
+    def failed(self) -> None:
+        """Shrink the row target after a failed or timed-out attempt."""
+        with self._lock:
+            self.rows = self._clamp(self.rows * self.shrink)
+            self.last_throughput = None
+            rows = int(self.rows)
+        logger.info(f"Batch failed; reducing batch size to {rows} rows")
+
+
+def create_batch_sizer(settings: Dict) -> Optional[AdaptiveBatchSizer]:
+    """Create the sizer configured by the ``adaptive_batching`` settings.
+
+    Args:
+        settings: Application configuration dictionary
+
+    Returns:
+        AdaptiveBatchSizer, or None when adaptive batching is disabled
+    """
+    if not settings.get("adaptive_batching"):
+        return None
+    return AdaptiveBatchSizer(
+        initial_rows=settings["batch_size"],
+        target_bytes=int(settings["batch_target_mb"] * 1024 * 1024),
+        min_rows=settings["batch_min_rows"],
+        max_rows=settings["batch_max_rows"],
+        target_seconds=settings["batch_target_seconds"],
+    )
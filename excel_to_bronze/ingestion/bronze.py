@@ -1,79 +1,525 @@
 """Bronze layer ingestion implementation."""
+import json
 import os
-from typing import List, Optional, Tuple
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from abc import abstractmethod
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import count, repeat
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from excel_to_bronze.config import config
+from excel_to_bronze.connectors.retry import (
+    create_retry_policy,
+    is_retryable,
+    is_timeout,
+    may_have_committed,
+)
 from excel_to_bronze.connectors.snowflake import snowflake_connector
-from excel_to_bronze.ingestion.base import DataIngestionError, FileIngestion
+from excel_to_bronze.ingestion.backends import ExcelBackend, select_backend
+from excel_to_bronze.ingestion.base import (
+    DataIngestionError,
+    FileIngestion,
+    FileProgress,
+    Source,
+    as_file_like,
+    describe_source,
+    is_buffer,
+    register_ingestor,
+    source_size,
+)
+from excel_to_bronze.ingestion.batching import create_batch_sizer
+from excel_to_bronze.ingestion.checkpoints import (
+    BatchCheckpoint,
+    begin_checkpoint,
+    create_journal,
+    delete_load_sql,
+)
+from excel_to_bronze.ingestion.contracts import (
+    ContractSettings,
+    ContractValidator,
+    find_contract,
+    load_contracts,
+)
+from excel_to_bronze.ingestion.incremental import IncrementalSettings, RowDiff
+from excel_to_bronze.ingestion.ledger import (
+    create_ledger,
+    hash_file,
+    hash_sheets,
+    sheet_selection_key,
+    sheet_signature,
+)
+from excel_to_bronze.ingestion.readers import (
+    SheetSelection,
+    iter_excel_chunks,
+    select_sheets,
+)
 from excel_to_bronze.ingestion.serializers import DataSerializer
+from excel_to_bronze.ingestion.sheet_ranges import (
+    RangeParseError,
+    index_sheet,
+    init_range_worker,
+    parse_range,
+    plan_ranges,
+    read_range_frame,
+)
+from excel_to_bronze.ingestion.staging import STAGE_LOAD_METHODS, create_stage_loader
 from excel_to_bronze.utils.logging import setup_logging
+from excel_to_bronze.utils.metrics import metrics
+from excel_to_bronze.utils.profiling import ProfileSettings, profile_run
 
 logger = setup_logging()
 
+# "full" repeats column names and dtypes in every row; "compact" stores them
+# once per file in a manifest row keyed by schema hash
+PAYLOAD_FORMATS = ("full", "compact")
 
-class ExcelIngestor(FileIngestion):
-    """Excel file ingestion processor for the Bronze layer."""
+# "low" trades speed for peak memory: string columns are downcast right after
+# reading and batches are written one at a time
+MEMORY_MODES = ("default", "low")
+
+# "insert" sends batched INSERTs; the others load through a stage (see staging)
+LOAD_METHODS = ("insert", *STAGE_LOAD_METHODS)
+
+# Callback receiving (batches written, total batches, rows written)
+ProgressCallback = Callable[[int, int, int], None]
+
+# Rows read for a preview
+PREVIEW_ROWS = 100
+
+# Rows serialized up front to estimate row width for adaptive batch sizing
+WIDTH_SAMPLE_ROWS = 50
+
+
+@dataclass
+class WriteSettings:
+    """How rows are serialized and written to the bronze table."""
+
+    json_backend: str = "json"
+    payload_format: str = "full"
+    load_method: str = "insert"
+    workers: int = 1
+
+    def __post_init__(self):
+        """Check the payload format and load method."""
+        if self.payload_format not in PAYLOAD_FORMATS:
+            raise ValueError(
+                f"Unsupported payload format: {self.payload_format}. "
+                f"Supported: {', '.join(PAYLOAD_FORMATS)}"
+            )
+        if self.load_method not in LOAD_METHODS:
+            raise ValueError(
+                f"Unsupported load method: {self.load_method}. "
+                f"Supported: {', '.join(LOAD_METHODS)}"
+            )
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> "WriteSettings":
+        """Read the settings from the application configuration.
+
+        Args:
+            settings: Application configuration dictionary
+
+        Returns:
+            WriteSettings
+
+        Raises:
+            ValueError: If the payload format or load method is not supported
+        """
+        return cls(
+            json_backend=settings["json_backend"],
+            payload_format=settings["payload_format"],
+            load_method=settings["load_method"],
+            workers=settings["write_workers"],
+        )
+
+
+@dataclass
+class ReadSettings:
+    """How files are read: whole or streamed, and how much memory to spend."""
+
+    streaming: bool = False
+    memory_mode: str = "default"
+
+    def __post_init__(self):
+        """Check the memory mode."""
+        if self.memory_mode not in MEMORY_MODES:
+            raise ValueError(
+                f"Unsupported memory mode: {self.memory_mode}. "
+                f"Supported: {', '.join(MEMORY_MODES)}"
+            )
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> "ReadSettings":
+        """Read the settings from the application configuration.
+
+        Args:
+            settings: Application configuration dictionary
+
+        Returns:
+            ReadSettings
+
+        Raises:
+            ValueError: If the memory mode is not supported
+        """
+        return cls(streaming=settings["streaming"], memory_mode=settings["memory_mode"])
+
+
+@dataclass
+class ExcelSettings:
+    """How workbooks are parsed: backend, sheets and parallel reads."""
+
+    backend: str = "auto"
+    large_file_bytes: int = 10 * 1024 * 1024
+    sheets: SheetSelection = ""
+    sheet_workers: int = 1
+    parallel_read_bytes: int = 50 * 1024 * 1024
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> "ExcelSettings":
+        """Read the settings from the application configuration.
+
+        Args:
+            settings: Application configuration dictionary
+
+        Returns:
+            ExcelSettings
+        """
+        return cls(
+            backend=settings["excel_backend"],
+            large_file_bytes=int(settings["large_file_mb"] * 1024 * 1024),
+            sheets=settings["sheets"],
+            sheet_workers=settings["sheet_workers"],
+            parallel_read_bytes=int(settings["parallel_read_mb"] * 1024 * 1024),
+        )
+
+
+class BatchProgress:
+    """Thread-safe tracker for batch progress logging and callbacks.
+
+    With adaptive batch sizing the number of batches is only known once the
+    last one is planned, so the batch iterators update ``total_batches``
+    through ``planned`` as batch sizes change.
+    """
+
+    def __init__(self, total_batches: int, callback: Optional[ProgressCallback] = None):
+        """Initialize the tracker.
+
+        Args:
+            total_batches: Number of batches to be written (an estimate
+                until the batch iterator calls ``planned``)
+            callback: Called after every written batch
+        """
+        self.total_batches = total_batches
+        self.callback = callback
+        self.batches_written = 0
+        self.rows_written = 0
+        self._lock = threading.Lock()
+
+    def planned(self, batch_number: int, remaining_rows: int, batch_size: int) -> None:
+        """Re-estimate the total from the batch being planned.
 
-    def __init__(self):
-        """Initialize the Excel ingestion processor."""
+        Args:
+            batch_number: 1-based number of the batch just planned
+            remaining_rows: Rows left after that batch
+            batch_size: Rows per batch the remaining ones are expected to have
+        """
+        total = batch_number + -(-max(remaining_rows, 0) // max(batch_size, 1))
+        with self._lock:
+            self.total_batches = total
+
+    def batch_written(self, batch_number: int, rows: int) -> None:
+        """Record a successfully written batch.
+
+        Args:
+            batch_number: 1-based batch number
+            rows: Number of rows in the batch
+        """
+        with self._lock:
+            self.batches_written += 1
+            self.rows_written += rows
+            batches_written, rows_written = self.batches_written, self.rows_written
+            total_batches = self.total_batches
+        logger.info(f"Inserted batch {batch_number}/{total_batches} with {rows} rows")
+        if self.callback:
+            self.callback(batches_written, total_batches, rows_written)
+
+
+class BronzeIngestor(FileIngestion):
+    """Base for file ingestion processors writing to the Bronze layer.
+
+    Subclasses read their format into DataFrames (``read_file``,
+    ``read_chunks`` and ``preview``); everything after the read is shared:
+    the ledger, checkpoints, schema contracts, incremental mode, payload
+    serialization, batching and bulk loads. ``ingest_excel`` is the entry
+    point for every format.
+    """
+
+    # Whether a file can hold several sheets (see ingest_excel's ``sheets``)
+    multi_sheet = False
+
+    # Sheets ingested when ``ingest_excel`` gets none; only multi-sheet
+    # formats set a default
+    sheets: Optional[SheetSelection] = None
+
+    # Processing kwargs consumed by write_data rather than the reader
+    write_options = (
+        "original_filename",
+        "progress_callback",
+        "checkpoint",
+        "validator",
+    )
+
+    def __init__(self, connector=None):
+        """Initialize the shared write path from the application config.
+
+        Args:
+            connector: Connector used for writes (defaults to the shared
+                SnowflakeConnector)
+        """
         super().__init__()
-        self.supported_extensions = [".xlsx", ".xls"]
+        self.connector = connector or snowflake_connector
         self.batch_size = config.get_batch_size()
         self.bronze_table = config.get_bronze_table()
 
-    def read_file(self, file_path: str, **kwargs) -> pd.DataFrame:
-        """Read Excel file into DataFrame.
+        app_config = config.get_application_config()
+        self.write_settings = WriteSettings.from_config(app_config)
+        self.read_settings = ReadSettings.from_config(app_config)
+        self.incremental_settings = IncrementalSettings.from_config(app_config)
+        self.contract_settings = ContractSettings.from_config(app_config)
+        self.profile_settings = ProfileSettings.from_config(app_config)
+        self.retry_policy = create_retry_policy(app_config)
+        self.batch_sizer = create_batch_sizer(app_config)
+        self.ledger = create_ledger(app_config, self.connector)
+        self.journal = create_journal(app_config)
+        self.fingerprints = self.incremental_settings.create_index()
+        self.contracts = load_contracts(app_config)
+        self.stage_loader = create_stage_loader(
+            app_config, self.connector, self.bronze_table, self.batch_size
+        )
+
+    @abstractmethod
+    def preview(
+        self,
+        file_path: Source,
+        original_filename: Optional[str] = None,
+        nrows: int = PREVIEW_ROWS,
+    ) -> pd.DataFrame:
+        """Read only the first rows of a file, e.g. to display an upload.
+
+        In-memory content is rewound afterwards and can be passed on to
+        ``ingest_excel`` unchanged.
 
         Args:
-            file_path: Path to Excel file
-            **kwargs: Additional arguments for pd.read_excel
+            file_path: Path to the file or its in-memory content
+            original_filename: Original filename (required for in-memory
+                content)
+            nrows: Number of data rows to read
 
         Returns:
-            DataFrame with Excel data
+            DataFrame with at most ``nrows`` rows
         """
-        try:
-            # Remove 'original_filename' from kwargs if present
-            excel_kwargs = kwargs.copy()
-            if "original_filename" in excel_kwargs:
-                del excel_kwargs["original_filename"]
+        pass
+
+    def compact_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Downcast string columns of a freshly read sheet in ``low`` memory mode.
 
-            df = pd.read_excel(file_path, **excel_kwargs)
-            logger.info(f"Read {len(df)} rows from {file_path}")
+        Args:
+            df: DataFrame as read from the file
+
+        Returns:
+            DataFrame to ingest (``df`` itself unless the memory mode is low)
+        """
+        if self.read_settings.memory_mode != "low":
             return df
-        except Exception as e:
-            logger.error(f"Failed to read Excel file {file_path}: {e}")
-            raise DataIngestionError(f"Excel file read error: {str(e)}") from e
+        return DataSerializer.downcast_strings(df)
 
-    def prepare_data(self, df: pd.DataFrame, filename: str) -> List[Tuple]:
+    def prepare_data(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        sheet_name: Optional[str] = None,
+        written_schemas: Optional[Set[str]] = None,
+    ) -> List[Tuple]:
         """Prepare DataFrame for insertion into bronze table.
 
+        Row ids are the DataFrame's index labels, i.e. the row positions in
+        the file, so they stay stable for chunks and filtered frames.
+
+        In the ``compact`` payload format rows carry only a ``schema_id`` and
+        their values in column order; the column names and dtypes go into a
+        manifest row that is prepended unless its schema is already in
+        ``written_schemas``.
+
         Args:
             df: DataFrame to prepare
             filename: Original filename to store
+            sheet_name: Sheet name to record in each row's metadata
+            written_schemas: Schema ids whose manifest row was already
+                prepared for this file; updated in place
 
         Returns:
             List of tuples ready for insertion
         """
-        # Add unique ID for each row
-        df = DataSerializer.add_metadata(df, {"id": lambda df: df.index.astype(str)})
+        extra_metadata = {"sheet_name": sheet_name} if sheet_name is not None else {}
+        rows: List[Tuple] = []
+
+        with metrics.timer("serialize_seconds"):
+            # Add unique ID for each row
+            ids = df.index.astype(str)
+            df = DataSerializer.add_metadata(df, {"id": ids})
+
+            compact = self.write_settings.payload_format == "compact"
+            if compact:
+                manifest, schema_id = self.compact_schema(df)
+                extra_metadata = {"schema_id": schema_id, **extra_metadata}
+                if written_schemas is None or schema_id not in written_schemas:
+                    rows.append(self.manifest_row(filename, schema_id, manifest))
+                    if written_schemas is not None:
+                        written_schemas.add(schema_id)
+
+            # Convert DataFrame rows to JSON strings
+            raw_data = DataSerializer.serialize_rows(
+                df,
+                json_backend=self.write_settings.json_backend,
+                extra_metadata=extra_metadata or None,
+                compact=compact,
+            )
 
-        # Convert DataFrame rows to JSON strings
-        raw_data_series = DataSerializer.serialize_dataframe(df)
+        metrics.increment("rows_serialized_total", len(raw_data))
+        if metrics.enabled:
+            metrics.increment("serialized_bytes_total", sum(map(len, raw_data)))
 
         # Create list of tuples for batch insertion
-        return [
-            (str(idx), filename, raw_data)
-            for idx, raw_data in enumerate(raw_data_series)
-        ]
+        rows.extend(zip(ids, repeat(filename), raw_data))
+        return rows
+
+    @staticmethod
+    def compact_schema(df: pd.DataFrame) -> Tuple[Dict[str, Any], str]:
+        """Get the schema manifest and id of rows in the compact payload format.
+
+        Args:
+            df: DataFrame whose metadata columns were already added
+
+        Returns:
+            Tuple of (manifest, schema id)
+        """
+        manifest = DataSerializer.schema_manifest(df)
+        return manifest, DataSerializer.schema_id(manifest)
+
+    def manifest_row(
+        self, filename: str, schema_id: str, manifest: Dict[str, Any]
+    ) -> Tuple:
+        """Build the bronze row holding a compact payload's schema.
+
+        Args:
+            filename: Original filename to store
+            schema_id: Hash from ``DataSerializer.schema_id``
+            manifest: Dictionary from ``DataSerializer.schema_manifest``
+
+        Returns:
+            Tuple of (id, filename, raw_data) ready for insertion
+        """
+        raw_data = json.dumps(
+            {
+                "metadata": {"manifest": True, "schema_id": schema_id, **manifest},
+                "data": None,
+            },
+            default=str,
+        )
+        return f"schema:{schema_id}", filename, raw_data
+
+    def payload_view_sql(self, view_name: str) -> str:
+        """Build a view rejoining compact rows with their schema manifests.
+
+        The view has one row per data row in either payload format. Compact
+        rows get their column names and dtypes from the manifest and their
+        ``data`` object rebuilt with FLATTEN and OBJECT_AGG, so no UDF is
+        needed; manifest rows themselves are left out.
+
+        Args:
+            view_name: Name of the view to create
+
+        Returns:
+            CREATE VIEW statement
+        """
+        # Table and view names come from config, not user input
+        # nosec
+        # B608: SQL injection is not possible as table name is fixed
+        return f"""
+            CREATE OR REPLACE VIEW {view_name} AS
+            WITH parsed AS (
+                SELECT id, filename, uploaded_at, PARSE_JSON(raw_data) AS payload
+                FROM {self.bronze_table}
+            ),
+            manifests AS (
+                SELECT payload:metadata:schema_id::STRING AS schema_id,
+                       ANY_VALUE(payload:metadata) AS schema
+                FROM parsed
+                WHERE payload:metadata:manifest::BOOLEAN
+                GROUP BY 1
+            )
+            SELECT id, filename, uploaded_at,
+                   payload:metadata:sheet_name::STRING AS sheet_name,
+                   payload:metadata:column_names AS column_names,
+                   payload:metadata:dtypes AS dtypes,
+                   payload:data AS data
+            FROM parsed
+            WHERE payload:metadata:schema_id IS NULL
+            UNION ALL
+            SELECT ANY_VALUE(r.id), ANY_VALUE(r.filename), ANY_VALUE(r.uploaded_at),
+                   ANY_VALUE(r.payload:metadata:sheet_name::STRING),
+                   ANY_VALUE(m.schema:column_names),
+                   ANY_VALUE(m.schema:dtypes),
+                   OBJECT_AGG(m.schema:column_names[f.index]::STRING, f.value)
+            FROM parsed r
+            JOIN manifests m ON m.schema_id = r.payload:metadata:schema_id::STRING,
+                 LATERAL FLATTEN(input => r.payload:data) f
+            WHERE NOT COALESCE(r.payload:metadata:manifest::BOOLEAN, FALSE)
+            GROUP BY f.seq
+        """
+
+    @property
+    def insert_sql(self) -> str:
+        """Parameterized INSERT statement for the bronze table.
+
+        With a checkpoint journal configured, rows also get a ``load_id``
+        identifying the batch that wrote them.
+        """
+        # Insert SQL statement - table name from config, not user input
+        # nosec
+        # B608: SQL injection is not possible as table name is fixed
+        if self.journal is not None:
+            return f"""
+                INSERT INTO {self.bronze_table}
+                    (id, filename, uploaded_at, raw_data, load_id)
+                VALUES (%s, %s, CURRENT_TIMESTAMP(), %s, %s)
+            """
+        return f"""
+            INSERT INTO {self.bronze_table} (id, filename, uploaded_at, raw_data)
+            VALUES (%s, %s, CURRENT_TIMESTAMP(), %s)
+        """
 
     def write_data(self, df: pd.DataFrame, **kwargs) -> bool:
         """Write DataFrame to Snowflake bronze table.
 
         Args:
             df: DataFrame to write
-            **kwargs: Additional arguments including filename
+            **kwargs: Additional arguments including filename,
+                progress_callback and the file's contract ``validator``
 
         Returns:
             True if successful
@@ -87,29 +533,53 @@ class ExcelIngestor(FileIngestion):
                 "original_filename", kwargs.get("filename", "unknown.xlsx")
             )
 
-            # Prepare data for insertion
-            rows_to_insert = self.prepare_data(df, filename)
+            # Batches are numbered from the first row of the frame, so streamed
+            # chunks each get their own checkpoint scope
+            checkpoint = None
+            if kwargs.get("checkpoint") is not None:
+                start = df.index[0] if len(df) else 0
+                checkpoint = kwargs["checkpoint"].scope(f"rows:{start}")
 
-            # Insert SQL statement - table name from config, not user input
-            # nosec
-            # B608: SQL injection is not possible as table name is fixed
-            insert_sql = f"""
-                INSERT INTO {self.bronze_table} (id, filename, uploaded_at, raw_data)
-                VALUES (%s, %s, CURRENT_TIMESTAMP(), %s)
-            """
+            # Rows breaking the file's schema contract are set aside
+            validator = kwargs.get("validator") or self.contract_validator(filename)
+            if validator is not None:
+                df, quarantined = self.check_contract(
+                    df, filename, validator, kwargs.get("sheet_name")
+                )
+                self.write_quarantine(quarantined, filename, checkpoint)
 
-            # Process in batches
-            total_batches = (
-                len(rows_to_insert) + self.batch_size - 1
-            ) // self.batch_size
+            # Incremental mode: only ship rows that are new or changed
+            diff = None
+            if self.fingerprints is not None:
+                sheet = str(kwargs.get("sheet_name") or 0)
+                diff = self.diff_rows(df, filename, sheet)
+                df = df[diff.changed]
 
-            for i in range(0, len(rows_to_insert), self.batch_size):
-                batch = rows_to_insert[i : i + self.batch_size]
-                snowflake_connector.execute_batch(insert_sql, batch)
-                logger.info(
-                    f"Inserted batch {i // self.batch_size + 1}/{total_batches} "
-                    f"with {len(batch)} rows"
+            # Process in batches, serializing each one just before it is sent
+            if self.write_settings.load_method == "arrow":
+                with metrics.timer(
+                    "write_seconds", method=self.write_settings.load_method
+                ):
+                    loaded = self.stage_loader.load_frame(df, filename)
+                BatchProgress(1, kwargs.get("progress_callback")).batch_written(
+                    1, loaded
                 )
+            else:
+                progress = self.batch_progress(len(df), kwargs.get("progress_callback"))
+                with metrics.timer(
+                    "write_seconds", method=self.write_settings.load_method
+                ):
+                    self.write_batches(
+                        self.iter_batches(
+                            df, filename, checkpoint=checkpoint, progress=progress
+                        ),
+                        progress,
+                        filename,
+                        checkpoint,
+                    )
+
+            if diff is not None:
+                self.apply_diff(diff, filename, sheet, checkpoint=checkpoint)
 
             logger.info(f"Successfully ingested {filename} to bronze layer")
             return True
@@ -118,14 +588,617 @@ class ExcelIngestor(FileIngestion):
             logger.error(f"Failed to write data to bronze layer: {e}")
             raise DataIngestionError(f"Bronze layer write error: {str(e)}") from e
 
+    def batch_progress(
+        self, rows: int, progress_callback: Optional[ProgressCallback] = None
+    ) -> BatchProgress:
+        """Create the progress tracker for writing rows in batches.
+
+        Args:
+            rows: Number of rows to write, including any in batches that a
+                checkpoint skips because they were already committed
+            progress_callback: Called after every written batch
+
+        Returns:
+            BatchProgress starting from the fixed-size batch count
+        """
+        total_batches = (rows + self.batch_size - 1) // self.batch_size
+        return BatchProgress(total_batches, progress_callback)
+
+    def write_batches(
+        self,
+        batches: Iterator[Tuple[int, List[Tuple]]],
+        progress: BatchProgress,
+        filename: str,
+        checkpoint: Optional[BatchCheckpoint] = None,
+    ) -> None:
+        """Write prepared batches with the configured load method.
+
+        Args:
+            batches: Iterator of (batch number, rows), e.g. from
+                ``iter_batches`` or ``split_batches`` given the same
+                ``progress``
+            progress: Progress tracker for logging and callbacks
+            filename: Original filename, used for logging
+            checkpoint: Journal state recording each inserted batch (a
+                single COPY INTO is atomic, so bulk loads do not use it)
+        """
+        # Rows that are already serialized (e.g. streamed chunks) go through
+        # the JSON stage files when the arrow load method is configured
+        if self.write_settings.load_method in STAGE_LOAD_METHODS:
+            loaded = self.stage_loader.load_rows(batches, filename)
+            BatchProgress(1, progress.callback).batch_written(1, loaded)
+            return
+
+        if self.write_settings.workers > 1 and self.read_settings.memory_mode != "low":
+            self.write_batches_concurrently(
+                self.insert_sql, batches, progress, checkpoint
+            )
+        else:
+            for batch_number, batch in batches:
+                self.insert_batch(self.insert_sql, batch, batch_number, checkpoint)
+                progress.batch_written(batch_number, len(batch))
+
+    def diff_rows(self, df: pd.DataFrame, filename: str, sheet: str) -> RowDiff:
+        """Compare a sheet with its previous upload in incremental mode.
+
+        Args:
+            df: DataFrame as read from the file
+            filename: Original filename
+            sheet: Sheet key in the fingerprint index
+
+        Returns:
+            RowDiff describing new/changed and deleted rows
+        """
+        diff = self.fingerprints.diff(
+            df, filename, sheet, self.incremental_settings.key_columns
+        )
+        logger.info(
+            f"{int(diff.changed.sum())} new or changed and {len(diff.deleted)} "
+            f"deleted rows in {filename} ({sheet})"
+        )
+        return diff
+
+    def apply_diff(
+        self,
+        diff: RowDiff,
+        filename: str,
+        sheet: str,
+        sheet_name: Optional[str] = None,
+        checkpoint: Optional[BatchCheckpoint] = None,
+    ) -> None:
+        """Emit tombstones and store fingerprints once a sheet was written.
+
+        Args:
+            diff: Diff returned by ``diff_rows``
+            filename: Original filename
+            sheet: Sheet key in the fingerprint index
+            sheet_name: Sheet name to record in the tombstones' metadata
+            checkpoint: Journal state of the sheet; tombstones are written
+                as its batch 0
+        """
+        if self.incremental_settings.emit_tombstones and diff.deleted:
+            if checkpoint is None or not checkpoint.done(0):
+                self.insert_batch(
+                    self.insert_sql,
+                    diff.tombstones(filename, sheet_name),
+                    0,
+                    checkpoint,
+                )
+                logger.info(f"Inserted {len(diff.deleted)} tombstone rows")
+        self.fingerprints.apply(filename, sheet, diff)
+
+    def contract_validator(
+        self, filename: str, sheet_name: Optional[str] = None
+    ) -> Optional[ContractValidator]:
+        """Create a validator for the first contract matching a file or sheet.
+
+        Args:
+            filename: Original filename
+            sheet_name: Sheet name, when sheets are ingested by name
+
+        Returns:
+            ContractValidator, or None if no contract applies
+        """
+        contract = find_contract(self.contracts, filename, sheet_name)
+        return contract.validator() if contract is not None else None
+
+    def check_contract(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        validator: ContractValidator,
+        sheet_name: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, List[Tuple]]:
+        """Split a frame into the rows satisfying its contract and the rest.
+
+        Args:
+            df: DataFrame as read from the file
+            filename: Original filename to store
+            validator: Validator of the file's contract
+            sheet_name: Sheet name to record in quarantined rows' metadata
+
+        Returns:
+            Tuple of (rows to load, quarantine rows from prepare_quarantine)
+
+        Raises:
+            DataIngestionError: If rows fail and ``contract_action`` is fail
+        """
+        result = validator.validate(df)
+        for rule, seconds in result.timings.items():
+            metrics.observe("contract_rule_seconds", seconds, rule=rule)
+        if not result.failed:
+            logger.info(f"{filename}: {result.summary()}")
+            return df, []
+
+        metrics.increment("rows_quarantined_total", result.failed)
+        if self.contract_settings.action == "fail":
+            raise DataIngestionError(f"{filename}: {result.summary()}")
+        logger.warning(f"{filename}: {result.summary()}; quarantining them")
+        quarantined = self.prepare_quarantine(
+            df[~result.valid], filename, result.violations(), sheet_name
+        )
+        return df[result.valid], quarantined
+
+    def prepare_quarantine(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        violations: List[List[str]],
+        sheet_name: Optional[str] = None,
+    ) -> List[Tuple]:
+        """Prepare rows that broke a contract for the quarantine.
+
+        The payload is the one the row would have had in the bronze table,
+        always in the ``full`` format so it stands on its own.
+
+        Args:
+            df: Failing rows
+            filename: Original filename to store
+            violations: Rules broken by each row
+            sheet_name: Sheet name to record in each row's metadata
+
+        Returns:
+            List of tuples of (id, filename, raw_data, violations as JSON)
+        """
+        ids = df.index.astype(str)
+        raw_data = DataSerializer.serialize_rows(
+            DataSerializer.add_metadata(df, {"id": ids}),
+            json_backend=self.write_settings.json_backend,
+            extra_metadata={"sheet_name": sheet_name} if sheet_name else None,
+        )
+        return list(zip(ids, repeat(filename), raw_data, map(json.dumps, violations)))
+
+    @property
+    def quarantine_sql(self) -> str:
+        """Parameterized INSERT statement for the quarantine table."""
+        # nosec
+        # B608: SQL injection is not possible as table name is fixed
+        return f"""
+            INSERT INTO {self.contract_settings.quarantine_table}
+                (id, filename, uploaded_at, raw_data, violations)
+            VALUES (%s, %s, CURRENT_TIMESTAMP(), %s, %s)
+        """
+
+    def write_quarantine(
+        self,
+        rows: List[Tuple],
+        filename: str,
+        checkpoint: Optional[BatchCheckpoint] = None,
+    ) -> None:
+        """Write quarantined rows to ``quarantine_table`` or ``quarantine_dir``.
+
+        In a table, batches are retried like untagged bronze batches: only
+        after errors known not to have committed. Otherwise rows
+        are appended as JSON lines to ``<quarantine_dir>/<filename>.ndjson``.
+        Quarantined rows are written before the first batch of their scope,
+        so they are not written again when a load resumes past it.
+
+        Args:
+            rows: Rows from prepare_quarantine
+            filename: Original filename
+            checkpoint: Journal state of the rows' scope
+        """
+        if not rows or (checkpoint is not None and checkpoint.done(1)):
+            return
+        if self.contract_settings.quarantine_table:
+            for start in range(0, len(rows), self.batch_size):
+                batch = rows[start : start + self.batch_size]
+                for attempt in count():
+                    try:
+                        self.connector.execute_batch(self.quarantine_sql, batch)
+                        break
+                    except Exception as e:
+                        if may_have_committed(e) or not (
+                            self.retry_policy.should_retry(e, attempt)
+                        ):
+                            raise
+                        time.sleep(self.retry_policy.delay(attempt))
+            destination = self.contract_settings.quarantine_table
+        else:
+            os.makedirs(self.contract_settings.quarantine_dir, exist_ok=True)
+            destination = os.path.join(
+                self.contract_settings.quarantine_dir,
+                f"{os.path.basename(filename)}.ndjson",
+            )
+            quarantined_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+            with open(destination, "a") as f:
+                for row_id, name, raw_data, violations in rows:
+                    f.write(
+                        f'{{"id": {json.dumps(row_id)}, "filename": '
+                        f'{json.dumps(name)}, "quarantined_at": "{quarantined_at}", '
+                        f'"violations": {violations}, "raw_data": {raw_data}}}\n'
+                    )
+        logger.info(f"Quarantined {len(rows)} rows of {filename} in {destination}")
+
+    def iter_batches(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        sheet_name: Optional[str] = None,
+        checkpoint: Optional[BatchCheckpoint] = None,
+        progress: Optional[BatchProgress] = None,
+    ) -> Iterator[Tuple[int, List[Tuple]]]:
+        """Prepare DataFrame for insertion one batch at a time.
+
+        Args:
+            df: DataFrame to prepare
+            filename: Original filename to store
+            sheet_name: Sheet name to record in each row's metadata
+            checkpoint: Journal state; batches it marks as committed are
+                skipped without being serialized
+            progress: Progress tracker whose total follows the batch sizes
+
+        Yields:
+            Tuples of (1-based batch number, rows ready for insertion)
+        """
+        written_schemas: Set[str] = set()
+        # Journaled batch numbers only line up with fixed-size batches
+        sizer = self.batch_sizer if checkpoint is None else None
+        row_bytes = self.estimate_row_bytes(df) if sizer is not None else None
+
+        start, batch_number = 0, 0
+        while start < len(df):
+            size = sizer.next_size(row_bytes) if sizer is not None else self.batch_size
+            batch_number += 1
+            if progress is not None:
+                progress.planned(batch_number, len(df) - start - size, size)
+            if checkpoint is not None and checkpoint.done(batch_number):
+                logger.info(f"Skipping batch {batch_number}: already committed")
+                if self.write_settings.payload_format == "compact":
+                    # The committed batch carried any manifest its rows needed
+                    batch = df.iloc[start : start + size]
+                    written_schemas.add(
+                        self.compact_schema(
+                            DataSerializer.add_metadata(
+                                batch, {"id": batch.index.astype(str)}
+                            )
+                        )[1]
+                    )
+            else:
+                rows = self.prepare_data(
+                    df.iloc[start : start + size], filename, sheet_name, written_schemas
+                )
+                if sizer is not None:
+                    row_bytes = self.row_bytes(rows)
+                yield batch_number, rows
+            start += size
+
+    def split_batches(
+        self,
+        rows: List[Tuple],
+        checkpoint: Optional[BatchCheckpoint] = None,
+        progress: Optional[BatchProgress] = None,
+    ) -> Iterator[Tuple[int, List[Tuple]]]:
+        """Split prepared rows into batches.
+
+        Args:
+            rows: Rows from prepare_data
+            checkpoint: Journal state; batches it marks as committed are
+                skipped
+            progress: Progress tracker whose total follows the batch sizes
+
+        Yields:
+            Tuples of (1-based batch number, rows ready for insertion)
+        """
+        sizer = self.batch_sizer if checkpoint is None else None
+        row_bytes = self.row_bytes(rows) if sizer is not None else None
+
+        start, batch_number = 0, 0
+        while start < len(rows):
+            size = sizer.next_size(row_bytes) if sizer is not None else self.batch_size
+            batch_number += 1
+            if progress is not None:
+                progress.planned(batch_number, len(rows) - start - size, size)
+            if checkpoint is None or not checkpoint.done(batch_number):
+                yield batch_number, rows[start : start + size]
+            start += size
+
+    @staticmethod
+    def row_bytes(rows: List[Tuple]) -> float:
+        """Get the average serialized size of prepared rows."""
+        if not rows:
+            return 0.0
+        return sum(len(raw_data) for _, _, raw_data in rows) / len(rows)
+
+    def estimate_row_bytes(self, df: pd.DataFrame) -> float:
+        """Estimate the serialized size of a frame's rows from a small sample.
+
+        Args:
+            df: DataFrame to be prepared
+
+        Returns:
+            Average payload size of the first rows, in bytes
+        """
+        sample = df.iloc[:WIDTH_SAMPLE_ROWS]
+        raw_data = DataSerializer.serialize_rows(
+            DataSerializer.add_metadata(sample, {"id": sample.index.astype(str)}),
+            json_backend=self.write_settings.json_backend,
+            compact=self.write_settings.payload_format == "compact",
+        )
+        return sum(map(len, raw_data)) / len(raw_data) if raw_data else 0.0
+
+    def insert_batch(
+        self,
+        insert_sql: str,
+        batch: List[Tuple],
+        batch_number: int,
+        checkpoint: Optional[BatchCheckpoint] = None,
+        first_attempt: int = 0,
+    ):
+        """Insert one batch, retrying transient errors per ``retry_policy``.
+
+        Errors classified as fatal (e.g. SQL or data errors) are raised right
+        away; transient ones are retried with jittered exponential backoff
+        and, with adaptive batching, shrink the following batches. A batch
+        that timed out is then retried in two halves, since resending it
+        whole would most likely time out again; the halves share the
+        remaining retries, so splitting never exceeds the retry limit.
+
+        Under autocommit a failed ``execute_batch`` may still have been
+        committed, e.g. when the connection drops before the server's
+        acknowledgement arrives. When the table has a ``load_id`` column (a
+        checkpoint journal is configured) every batch's rows carry a key, its
+        checkpoint key or a random one, and rows stored under it are deleted
+        before a retry or resumed insert. Without the column only errors known
+        not to have committed (see ``connectors.retry.may_have_committed``)
+        are retried; others are raised rather than risk duplicate rows. With
+        a checkpoint the batch is journaled once committed.
+
+        Args:
+            insert_sql: Parameterized INSERT statement
+            batch: Rows to insert
+            batch_number: 1-based batch number, used for logging
+            checkpoint: Journal state of the batch's scope
+            first_attempt: Retries already spent on the rows, by a batch this
+                one was split from
+        """
+        key = None
+        params = batch
+        if checkpoint is not None:
+            key = checkpoint.key(batch_number)
+        elif self.journal is not None:
+            key = f"batch:{uuid.uuid4().hex}"
+        if key is not None:
+            params = [row + (key,) for row in batch]
+
+        for attempt in count(first_attempt):
+            started = time.perf_counter()
+            try:
+                with metrics.timer("batch_seconds"):
+                    if key is not None and (
+                        attempt > first_attempt
+                        or (checkpoint is not None and checkpoint.resumed)
+                    ):
+                        self.connector.execute_query(
+                            delete_load_sql(self.bronze_table), {"load_id": key}
+                        )
+                    self.connector.execute_batch(insert_sql, params)
+            except Exception as e:
+                retryable = is_retryable(e)
+                if retryable and self.batch_sizer is not None:
+                    self.batch_sizer.failed()
+                if key is None and may_have_committed(e):
+                    metrics.increment("batch_failures_total")
+                    logger.error(
+                        f"Batch {batch_number} failed ({e}) but may have been "
+                        "committed; not retrying it, as its rows carry no load_id"
+                    )
+                    raise
+                if not self.retry_policy.should_retry(e, attempt):
+                    metrics.increment("batch_failures_total")
+                    if not retryable:
+                        logger.error(f"Batch {batch_number} failed permanently: {e}")
+                    raise
+                if (
+                    self.batch_sizer is not None
+                    and is_timeout(e)
+                    and checkpoint is None
+                    and len(batch) > 1
+                ):
+                    if key is not None and may_have_committed(e):
+                        self.connector.execute_query(
+                            delete_load_sql(self.bronze_table), {"load_id": key}
+                        )
+                    self.insert_split_batch(
+                        insert_sql, batch, batch_number, attempt + 1
+                    )
+                    return
+                metrics.increment("batch_retries_total")
+                delay = self.retry_policy.delay(attempt)
+                logger.warning(
+                    f"Batch {batch_number} failed ({e}); retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+            else:
+                if self.batch_sizer is not None:
+                    self.batch_sizer.succeeded(
+                        len(batch), time.perf_counter() - started
+                    )
+                if checkpoint is not None:
+                    checkpoint.commit(batch_number, len(batch))
+                metrics.increment("rows_written_total", len(batch))
+                if metrics.enabled:
+                    sent = sum(len(raw_data) for _, _, raw_data in batch)
+                    metrics.increment("bytes_sent_total", sent)
+                    metrics.observe("batch_bytes", sent)
+                return
+
+    def insert_split_batch(
+        self,
+        insert_sql: str,
+        batch: List[Tuple],
+        batch_number: int,
+        first_attempt: int,
+    ) -> None:
+        """Insert a batch that timed out as two smaller batches.
+
+        Args:
+            insert_sql: Parameterized INSERT statement
+            batch: Rows to insert
+            batch_number: 1-based batch number, used for logging
+            first_attempt: Attempt number the halves start at, so they only
+                use the retries the timed-out batch had left
+        """
+        half = len(batch) // 2
+        logger.warning(
+            f"Batch {batch_number} timed out; splitting it into batches of "
+            f"{half} and {len(batch) - half} rows"
+        )
+        metrics.increment("batch_splits_total")
+        self.insert_batch(
+            insert_sql, batch[:half], batch_number, first_attempt=first_attempt
+        )
+        self.insert_batch(
+            insert_sql, batch[half:], batch_number, first_attempt=first_attempt
+        )
+
+    def write_batches_concurrently(
+        self,
+        insert_sql: str,
+        batches: Iterator[Tuple[int, List[Tuple]]],
+        progress: "BatchProgress",
+        checkpoint: Optional[BatchCheckpoint] = None,
+    ) -> None:
+        """Insert batches on a bounded worker pool.
+
+        At most ``write_workers`` batches are in flight; the next batch is
+        serialized on the calling thread while earlier ones are inserted, and
+        serialization pauses whenever all workers are busy. After a failure no
+        new batches are submitted, in-flight batches are allowed to finish and
+        the error of the lowest-numbered failed batch is raised.
+
+        Args:
+            insert_sql: Parameterized INSERT statement
+            batches: Iterator of (batch number, rows) from iter_batches
+            progress: Progress tracker for logging and callbacks
+            checkpoint: Journal state recording each inserted batch
+        """
+        errors: Dict[int, Exception] = {}
+        pending: Dict[Future, Tuple[int, int]] = {}
+
+        def collect(done) -> None:
+            for future in done:
+                batch_number, batch_rows = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    errors[batch_number] = error
+                else:
+                    progress.batch_written(batch_number, batch_rows)
+
+        with ThreadPoolExecutor(
+            max_workers=self.write_settings.workers, thread_name_prefix="bronze-writer"
+        ) as executor:
+            for batch_number, batch in batches:
+                future = executor.submit(
+                    self.insert_batch, insert_sql, batch, batch_number, checkpoint
+                )
+                pending[future] = (batch_number, len(batch))
+
+                # Backpressure: wait for a free worker before serializing more
+                if len(pending) >= self.write_settings.workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                if errors:
+                    break
+
+            collect(wait(pending).done)
+
+        if errors:
+            first_failed = min(errors)
+            raise DataIngestionError(
+                f"Batch {first_failed}/{progress.total_batches} failed: "
+                f"{errors[first_failed]}"
+            ) from errors[first_failed]
+
+    def process_file(
+        self,
+        file_path: Source,
+        _sheets: Optional[SheetSelection],
+        streaming: bool,
+        **kwargs,
+    ) -> bool:
+        """Read and write a file the way ``ingest_excel`` settled on.
+
+        Single-table formats are processed whole or streamed in
+        ``batch_size`` chunks; multi-sheet formats override this to handle
+        their sheet selection.
+
+        Args:
+            file_path: Path to the file, its in-memory content or a DataFrame
+            _sheets: Sheet selection; ignored by single-table formats
+            streaming: Read the file in constant memory
+            **kwargs: Processing arguments including original_filename,
+                progress_callback and checkpoint
+
+        Returns:
+            True if successful
+
+        Raises:
+            DataIngestionError: If processing fails
+        """
+        if streaming:
+            # One validator checks uniqueness across all chunks
+            return self.process_stream(
+                file_path,
+                self.batch_size,
+                validator=self.contract_validator(kwargs["original_filename"]),
+                **kwargs,
+            )
+        return self.process(file_path, **kwargs)
+
     def ingest_excel(
-        self, file_path: str, original_filename: Optional[str] = None
+        self,
+        file_path: Source,
+        original_filename: Optional[str] = None,
+        streaming: Optional[bool] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        force: bool = False,
+        sheets: Optional[SheetSelection] = None,
     ) -> bool:
-        """Ingest Excel file into bronze layer.
+        """Ingest a file into the bronze layer.
+
+        Besides a path, the file can be passed as in-memory content
+        (bytes, memoryview or a file-like object such as an upload) or as a
+        DataFrame that was already parsed, avoiding a temporary file and a
+        second parse. Both require ``original_filename``; in-memory content
+        is read whole rather than streamed, and a DataFrame is ingested as a
+        single sheet.
 
         Args:
-            file_path: Path to Excel file
+            file_path: Path to the file, its in-memory content or a DataFrame
             original_filename: Original filename to preserve
+            streaming: Read the file in constant memory, one batch at a time
+                (defaults to the ``streaming`` application setting)
+            progress_callback: Called with (batches written, total batches,
+                rows written) for the whole file after every inserted batch;
+                the total is 0 when it is not known up front (streamed chunks
+                or several sheets)
+            force: Ingest even if the ledger shows identical content was
+                already loaded into the bronze table
+            sheets: Sheets to ingest from multi-sheet formats: ``"*"``,
+                ``"re:<pattern>"`` or a list of names (defaults to the
+                ``sheets`` application setting for Excel files; empty ingests
+                the first sheet only)
 
         Returns:
             True if successful
@@ -133,14 +1206,610 @@ class ExcelIngestor(FileIngestion):
         Raises:
             DataIngestionError: If ingestion fails
         """
+        in_memory = isinstance(file_path, pd.DataFrame) or is_buffer(file_path)
+        if in_memory and not original_filename:
+            raise DataIngestionError(
+                "original_filename is required for in-memory sources"
+            )
+        if is_buffer(file_path):
+            file_path = as_file_like(file_path)
+
         # Use provided original filename or extract from path
         filename = original_filename or os.path.basename(file_path)
 
-        # Process the file, passing the original_filename as a parameter
-        result = self.process(file_path, original_filename=filename)
+        if sheets is None:
+            sheets = self.sheets
+        if sheets and not self.multi_sheet:
+            logger.warning(f"{filename} holds a single table; ignoring sheets")
+            sheets = None
+
+        # Consult the ledger before doing any parsing
+        content_hash, sheet_hashes = None, None
+        if self.ledger is not None and (
+            is_buffer(file_path) or (not in_memory and os.path.isfile(file_path))
+        ):
+            content_hash, sheet_hashes = hash_file(file_path), hash_sheets(file_path)
+            if not force:
+                previous = self.ledger.lookup(
+                    content_hash,
+                    self.bronze_table,
+                    sheet_signature(sheet_hashes),
+                    sheet_selection_key(sheets),
+                )
+                if previous:
+                    logger.info(
+                        f"Skipping {filename}: identical content was already "
+                        f"ingested into {self.bronze_table} as {previous}"
+                    )
+                    metrics.increment("files_skipped_total")
+                    return True
+
+        if streaming is None:
+            streaming = self.read_settings.streaming
+        if streaming and self.fingerprints is not None:
+            # Detecting deleted rows needs the whole sheet at once
+            logger.warning("Incremental mode reads the whole file; not streaming")
+            streaming = False
+        if sheets and streaming:
+            logger.warning("Multi-sheet ingestion reads whole sheets; not streaming")
+        if in_memory and streaming:
+            logger.warning("In-memory sources are read whole; not streaming")
+            streaming = False
+        if sheets and isinstance(file_path, pd.DataFrame):
+            logger.warning("A DataFrame holds a single sheet; ignoring sheets")
+            sheets = None
+
+        # A COPY INTO is a single atomic statement, so bulk loads need no journal
+        checkpoint = None
+        if (
+            self.journal is not None
+            and self.write_settings.load_method == "insert"
+            and (in_memory or os.path.isfile(file_path))
+        ):
+            checkpoint = begin_checkpoint(
+                self.journal,
+                self.connector,
+                file_path,
+                filename,
+                self.bronze_table,
+                self.batch_size,
+                content_hash,
+            )
+
+        try:
+            with profile_run(
+                filename,
+                self.profile_settings.directory,
+                self.profile_settings.profiler,
+            ):
+                result = self.process_file(
+                    file_path,
+                    sheets,
+                    streaming,
+                    original_filename=filename,
+                    progress_callback=progress_callback,
+                    checkpoint=checkpoint,
+                )
+        finally:
+            metrics.flush()
+
+        if result and content_hash:
+            self.ledger.record(
+                content_hash,
+                self.bronze_table,
+                filename,
+                sheet_hashes,
+                sheet_selection_key(sheets),
+            )
+        if result and checkpoint is not None:
+            self.journal.finish(checkpoint.load_id)
 
         return result
 
+
+@register_ingestor
+class ExcelIngestor(BronzeIngestor):
+    """Excel file ingestion processor for the Bronze layer."""
+
+    extensions = (".xlsx", ".xls")
+
+    multi_sheet = True
+
+    def __init__(self, connector=None):
+        """Initialize the Excel ingestion processor.
+
+        Args:
+            connector: Connector used for writes (defaults to the shared
+                SnowflakeConnector)
+        """
+        super().__init__(connector)
+        self.excel_settings = ExcelSettings.from_config(config.get_application_config())
+
+    @property
+    def sheets(self) -> SheetSelection:
+        """Sheets ingested when ``ingest_excel`` gets none."""
+        return self.excel_settings.sheets
+
+    def read_file(self, file_path: Source, **kwargs) -> pd.DataFrame:
+        """Read Excel file into DataFrame.
+
+        Args:
+            file_path: Path to Excel file, or its content as bytes,
+                memoryview or a file-like object (then ``original_filename``
+                must be passed to identify the format)
+            **kwargs: Additional arguments for pd.read_excel
+
+        Returns:
+            DataFrame with Excel data
+        """
+        name = kwargs.get("original_filename") or describe_source(file_path)
+        try:
+            # Remove write-side options from kwargs if present
+            excel_kwargs = {
+                key: value
+                for key, value in kwargs.items()
+                if key not in self.write_options
+            }
+
+            source = as_file_like(file_path)
+            backend = self.select_backend(source, kwargs.get("original_filename"))
+            with metrics.timer("read_seconds", backend=backend.name):
+                df = backend.read(source, **excel_kwargs)
+            metrics.increment("rows_read_total", len(df))
+            logger.info(f"Read {len(df)} rows from {name} with {backend.name}")
+            return self.compact_frame(df)
+        except Exception as e:
+            logger.error(f"Failed to read Excel file {name}: {e}")
+            raise DataIngestionError(f"Excel file read error: {str(e)}") from e
+
+    def preview(
+        self,
+        file_path: Source,
+        original_filename: Optional[str] = None,
+        nrows: int = PREVIEW_ROWS,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Read only the first rows of a sheet, e.g. to display an upload.
+
+        The parser stops after ``nrows`` rows, so this is cheap even for
+        large workbooks. In-memory content is rewound afterwards and can be
+        passed on to ``ingest_excel`` unchanged.
+
+        Args:
+            file_path: Path to Excel file or its in-memory content
+            original_filename: Original filename (required for in-memory
+                content)
+            nrows: Number of data rows to read
+            **kwargs: Additional arguments for pd.read_excel
+
+        Returns:
+            DataFrame with at most ``nrows`` rows
+        """
+        source = as_file_like(file_path)
+        try:
+            backend = self.select_backend(source, original_filename)
+            return backend.read(source, nrows=nrows, **kwargs)
+        except Exception as e:
+            raise DataIngestionError(f"Excel file read error: {str(e)}") from e
+        finally:
+            as_file_like(source)
+
+    def select_backend(
+        self, file_path: Source, original_filename: Optional[str] = None
+    ) -> ExcelBackend:
+        """Pick the parsing backend for a file.
+
+        Uses the ``excel_backend`` setting unless it is ``auto``, in which
+        case the backend is chosen by extension and file size.
+
+        Args:
+            file_path: Path to Excel file or its in-memory content
+            original_filename: Original filename, whose extension is used
+                for in-memory content
+
+        Returns:
+            Backend from the registry in ``backends``
+        """
+        if is_buffer(file_path):
+            return select_backend(
+                original_filename or "",
+                override=self.excel_settings.backend,
+                large_file_bytes=self.excel_settings.large_file_bytes,
+                size=source_size(file_path),
+            )
+        return select_backend(
+            file_path,
+            override=self.excel_settings.backend,
+            large_file_bytes=self.excel_settings.large_file_bytes,
+        )
+
+    def read_chunks(
+        self, file_path: str, chunk_size: int, **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """Stream Excel file as DataFrame chunks using openpyxl/xlrd row iterators.
+
+        Args:
+            file_path: Path to Excel file
+            chunk_size: Maximum number of rows per chunk
+            **kwargs: Additional arguments; only ``sheet_name`` is used
+
+        Yields:
+            DataFrame chunks of at most ``chunk_size`` rows
+        """
+        try:
+            yield from iter_excel_chunks(
+                file_path, chunk_size, sheet_name=kwargs.get("sheet_name")
+            )
+        except Exception as e:
+            logger.error(f"Failed to read Excel file {file_path}: {e}")
+            raise DataIngestionError(f"Excel file read error: {str(e)}") from e
+
+    def process_file(
+        self,
+        file_path: Source,
+        sheets: Optional[SheetSelection],
+        streaming: bool,
+        **kwargs,
+    ) -> bool:
+        """Ingest the selected sheets, or the first sheet as a single table.
+
+        Several sheets go through ``process_sheets``; a large first sheet
+        that is not streamed may be parsed in row ranges (see
+        ``use_row_ranges``).
+
+        Args:
+            file_path: Path to Excel file, its in-memory content or a
+                DataFrame
+            sheets: Sheet selection, empty for the first sheet only
+            streaming: Read the sheet in constant memory
+            **kwargs: Processing arguments including original_filename,
+                progress_callback and checkpoint
+
+        Returns:
+            True if successful
+
+        Raises:
+            DataIngestionError: If processing fails
+        """
+        if sheets:
+            return self.process_sheets(file_path, sheets, **kwargs)
+        if not streaming and self.use_row_ranges(
+            file_path, kwargs["original_filename"]
+        ):
+            return self.process_ranges(file_path, **kwargs)
+        return super().process_file(file_path, sheets, streaming, **kwargs)
+
+    def prepare_sheet(
+        self, source, sheet_name: str, filename: str
+    ) -> Optional[Tuple[Any, Optional[RowDiff], List[Tuple]]]:
+        """Parse and serialize one sheet of a workbook.
+
+        Args:
+            source: Path to Excel file, its content or a workbook opened by
+                its backend
+            sheet_name: Sheet to read
+            filename: Original filename to store
+
+        Returns:
+            Tuple of (rows ready for insertion, incremental diff or None,
+            rows breaking the sheet's contract for the quarantine), or None
+            if the sheet is empty. With the ``arrow`` load method the
+            DataFrame to load is returned in place of the rows.
+        """
+        if isinstance(source, pd.ExcelFile):
+            with metrics.timer("read_seconds", backend=source.engine):
+                df = self.compact_frame(source.parse(sheet_name))
+            metrics.increment("rows_read_total", len(df))
+            logger.info(f"Read {len(df)} rows from sheet {sheet_name}")
+        else:
+            df = self.read_file(
+                source, sheet_name=sheet_name, original_filename=filename
+            )
+        if df.empty:
+            return None
+
+        quarantined: List[Tuple] = []
+        validator = self.contract_validator(filename, sheet_name)
+        if validator is not None:
+            df, quarantined = self.check_contract(df, filename, validator, sheet_name)
+
+        diff = None
+        if self.fingerprints is not None:
+            diff = self.diff_rows(df, filename, sheet_name)
+            df = df[diff.changed]
+        if self.write_settings.load_method == "arrow":
+            return df, diff, quarantined
+        return self.prepare_data(df, filename, sheet_name), diff, quarantined
+
+    def process_sheets(
+        self, file_path: Source, sheets: SheetSelection, **kwargs
+    ) -> bool:
+        """Ingest several sheets of a workbook.
+
+        The workbook is opened once to resolve the selection. With more than
+        one sheet and ``sheet_workers`` > 1, sheets are parsed and serialized
+        in worker processes while this process writes the finished sheets in
+        workbook order; otherwise they are read from the open workbook one
+        after another. Every row records its sheet name in the metadata block
+        and empty sheets are skipped.
+
+        Args:
+            file_path: Path to Excel file or its in-memory content
+            sheets: Sheet selection (see ``select_sheets``)
+            **kwargs: Additional arguments including original_filename and
+                progress_callback
+
+        Returns:
+            True if successful
+
+        Raises:
+            DataIngestionError: If processing fails
+        """
+        filename = kwargs.get("original_filename") or os.path.basename(file_path)
+        progress_callback = kwargs.get("progress_callback")
+        load_checkpoint = kwargs.get("checkpoint")
+
+        def write_sheets(names, prepared_sheets) -> Tuple[int, int]:
+            written, total_rows = 0, 0
+            # Report batches and rows for the whole workbook, not per sheet
+            callback = progress_callback
+            if callback and len(names) > 1:
+                callback = FileProgress(callback)
+            for name, prepared in zip(names, prepared_sheets):
+                if prepared is None:
+                    logger.info(f"Skipping empty sheet {name} in {filename}")
+                    continue
+                rows, diff, quarantined = prepared
+                checkpoint = None
+                if load_checkpoint is not None:
+                    checkpoint = load_checkpoint.scope(f"sheet:{name}")
+                self.write_quarantine(quarantined, filename, checkpoint)
+                if self.write_settings.load_method == "arrow":
+                    loaded = self.stage_loader.load_frame(
+                        rows, filename, sheet_name=name
+                    )
+                    BatchProgress(1, callback).batch_written(1, loaded)
+                else:
+                    progress = self.batch_progress(len(rows), callback)
+                    batches = self.split_batches(rows, checkpoint, progress)
+                    self.write_batches(batches, progress, filename, checkpoint)
+                if isinstance(callback, FileProgress):
+                    callback.chunk_finished()
+                if diff is not None:
+                    self.apply_diff(
+                        diff, filename, name, sheet_name=name, checkpoint=checkpoint
+                    )
+                written += 1
+                total_rows += len(rows)
+                logger.info(f"Ingested sheet {name} of {filename}")
+            return written, total_rows
+
+        started = time.perf_counter()
+        try:
+            self.validate_source(file_path, filename)
+
+            # Workers receive in-memory content as bytes, which pickle
+            shared = file_path
+            if is_buffer(file_path) and self.excel_settings.sheet_workers > 1:
+                shared = as_file_like(file_path).read()
+            workbook_source = as_file_like(file_path)
+            backend = self.select_backend(workbook_source, filename)
+            with backend.open(workbook_source) as workbook:
+                names = select_sheets(workbook.sheet_names, sheets)
+                if not names:
+                    raise DataIngestionError(f"No sheets match {sheets!r}")
+
+                workers = min(self.excel_settings.sheet_workers, len(names))
+                logger.info(
+                    f"Ingesting {len(names)} sheets of {filename} "
+                    f"with {workers} worker(s)"
+                )
+                if workers > 1:
+                    with ProcessPoolExecutor(max_workers=workers) as executor:
+                        futures = [
+                            executor.submit(_prepare_sheet, shared, name, filename)
+                            for name in names
+                        ]
+                        try:
+                            written, total_rows = write_sheets(
+                                names, (future.result() for future in futures)
+                            )
+                        except Exception:
+                            for future in futures:
+                                future.cancel()
+                            raise
+                else:
+                    written, total_rows = write_sheets(
+                        names,
+                        (
+                            self.prepare_sheet(workbook, name, filename)
+                            for name in names
+                        ),
+                    )
+
+            if written == 0:
+                raise DataIngestionError("All selected sheets are empty")
+            metrics.file_ingested(time.perf_counter() - started, total_rows)
+            return True
+
+        except Exception as e:
+            metrics.increment("files_failed_total")
+            logger.error(f"Error processing file {filename}: {str(e)}")
+            raise DataIngestionError(f"Failed to process file: {str(e)}") from e
+
+    def use_row_ranges(self, file_path: Source, filename: str) -> bool:
+        """Whether to parse a single sheet in row ranges on several processes.
+
+        Applies to .xlsx files of at least ``parallel_read_mb`` read with
+        openpyxl, when ``sheet_workers`` > 1 and neither incremental mode, the
+        ``arrow`` load method, the ``low`` memory mode nor a schema contract
+        is used.
+
+        Args:
+            file_path: Path to Excel file, its in-memory content or a
+                DataFrame
+            filename: Original filename
+
+        Returns:
+            True if ``process_ranges`` should be used
+        """
+        if (
+            self.excel_settings.parallel_read_bytes <= 0
+            or self.excel_settings.sheet_workers <= 1
+            or isinstance(file_path, pd.DataFrame)
+            or self.fingerprints is not None
+            or self.write_settings.load_method == "arrow"
+            or self.read_settings.memory_mode == "low"
+            or not filename.lower().endswith(".xlsx")
+            or find_contract(self.contracts, filename) is not None
+        ):
+            return False
+        size = source_size(file_path)
+        if size is None or size < self.excel_settings.parallel_read_bytes:
+            return False
+        return self.select_backend(file_path, filename).name == "openpyxl"
+
+    def prepare_ranges(
+        self, file_path: Source, filename: str
+    ) -> Optional[Tuple[Optional[Tuple], List[Tuple]]]:
+        """Parse and serialize the first sheet in row ranges on worker processes.
+
+        The sheet XML is indexed once and split into ``sheet_workers`` row
+        ranges. Workers parse their range, then serialize it once the column
+        types of the whole sheet are known (see ``sheet_ranges``), so row ids
+        and ``raw_data`` match a serial parse.
+
+        Args:
+            file_path: Path to Excel file or its in-memory content
+            filename: Original filename to store
+
+        Returns:
+            Tuple of (compact schema manifest row or None, rows ready for
+            insertion), or None if the sheet has to be parsed serially
+        """
+        # Workers receive in-memory content as bytes, which pickle
+        shared = file_path
+        if is_buffer(file_path):
+            shared = as_file_like(file_path).read()
+        index = index_sheet(shared, parts=self.excel_settings.sheet_workers)
+        if index is None or len(index.ranges) <= 1:
+            return None
+
+        spool_dir = tempfile.mkdtemp(prefix="excel_ranges_")
+        try:
+            with ProcessPoolExecutor(
+                max_workers=len(index.ranges),
+                initializer=init_range_worker,
+                initargs=(index, shared),
+            ) as executor:
+                starts, ends, first_rows = zip(*index.ranges)
+                try:
+                    summaries = list(
+                        executor.map(
+                            parse_range,
+                            count(),
+                            starts,
+                            ends,
+                            first_rows,
+                            first_rows[1:] + (None,),
+                            repeat(spool_dir),
+                        )
+                    )
+                except RangeParseError as e:
+                    logger.warning(f"{e}; parsing {filename} serially")
+                    return None
+                plan = plan_ranges(summaries)
+                if plan is None:
+                    return None
+                numbers = [number for number, kept in enumerate(plan["keep"]) if kept]
+                results = list(
+                    executor.map(
+                        _prepare_range,
+                        numbers,
+                        repeat(spool_dir),
+                        repeat(plan),
+                        repeat(filename),
+                    )
+                )
+        finally:
+            shutil.rmtree(spool_dir, ignore_errors=True)
+
+        if len({dtypes for _, _, dtypes in results}) > 1:
+            logger.warning(
+                f"Row ranges of {filename} inferred different column types; "
+                "parsing it serially"
+            )
+            return None
+        manifest = next((row for row, _, _ in results if row is not None), None)
+        rows = [row for _, range_rows, _ in results for row in range_rows]
+        logger.info(
+            f"Read {len(rows)} rows from {filename} with openpyxl "
+            f"in {len(index.ranges)} row ranges"
+        )
+        return manifest, rows
+
+    def process_ranges(self, file_path: Source, **kwargs) -> bool:
+        """Ingest the first sheet of a large workbook parsed in row ranges.
+
+        Batches are numbered and checkpointed like ``process``, which is used
+        instead when the sheet cannot be split.
+
+        Args:
+            file_path: Path to Excel file or its in-memory content
+            **kwargs: Additional arguments including original_filename,
+                progress_callback and checkpoint
+
+        Returns:
+            True if successful
+
+        Raises:
+            DataIngestionError: If processing fails
+        """
+        filename = kwargs.get("original_filename") or os.path.basename(file_path)
+        started = time.perf_counter()
+        try:
+            self.validate_source(file_path, filename)
+            with metrics.timer("read_seconds", backend="openpyxl"):
+                prepared = self.prepare_ranges(file_path, filename)
+
+            if prepared is not None:
+                manifest, rows = prepared
+                metrics.increment("rows_read_total", len(rows))
+                checkpoint = None
+                if kwargs.get("checkpoint") is not None:
+                    checkpoint = kwargs["checkpoint"].scope("rows:0")
+
+                progress = self.batch_progress(
+                    len(rows), kwargs.get("progress_callback")
+                )
+
+                def batches() -> Iterator[Tuple[int, List[Tuple]]]:
+                    # The compact schema manifest goes with the first batch
+                    for batch_number, batch in self.split_batches(
+                        rows, checkpoint, progress
+                    ):
+                        if batch_number == 1 and manifest is not None:
+                            yield batch_number, [manifest, *batch]
+                        else:
+                            yield batch_number, batch
+
+                with metrics.timer(
+                    "write_seconds", method=self.write_settings.load_method
+                ):
+                    self.write_batches(batches(), progress, filename, checkpoint)
+                logger.info(f"Successfully ingested {filename} to bronze layer")
+                metrics.file_ingested(time.perf_counter() - started, len(rows))
+
+        except Exception as e:
+            metrics.increment("files_failed_total")
+            logger.error(f"Error processing file {filename}: {str(e)}")
+            raise DataIngestionError(f"Failed to process file: {str(e)}") from e
+
+        if prepared is None:
+            logger.info(f"Parsing {filename} serially")
+            return self.process(file_path, **kwargs)
+        return True
+
     @staticmethod
     def ingest_excel_file(
         file_path: str, original_filename: Optional[str] = None
@@ -156,3 +1825,32 @@ class ExcelIngestor(FileIngestion):
         """
         ingestor = ExcelIngestor()
         return ingestor.ingest_excel(file_path, original_filename)
+
+
+@lru_cache(maxsize=None)
+def _get_sheet_ingestor() -> ExcelIngestor:
+    """Get the ingestor reused by every sheet handled in this process."""
+    return ExcelIngestor()
+
+
+def _prepare_sheet(file_path: Source, sheet_name: str, filename: str):
+    """Parse and serialize one sheet in a worker process."""
+    return _get_sheet_ingestor().prepare_sheet(file_path, sheet_name, filename)
+
+
+def _prepare_range(number: int, spool_dir: str, plan: Dict[str, Any], filename: str):
+    """Serialize one row range of a sheet in a worker process.
+
+    Returns:
+        Tuple of (compact schema manifest row or None, rows ready for
+        insertion, column dtypes)
+    """
+    df = read_range_frame(number, spool_dir, plan)
+    dtypes = tuple(map(str, df.dtypes))
+    if df.empty:
+        return None, [], dtypes
+    rows = _get_sheet_ingestor().prepare_data(df, filename)
+    manifest = None
+    if rows[0][0].startswith("schema:"):
+        manifest, rows = rows[0], rows[1:]
+    return manifest, rows, dtypes
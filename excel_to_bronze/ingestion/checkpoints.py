@@ -0,0 +1,317 @@
+"""Local journal of committed batches, so interrupted loads can resume."""
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import IO, Dict, Optional, Set, Union
+
+import pandas as pd
+
+from excel_to_bronze.ingestion.ledger import hash_file
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+
+def load_key(content_hash: str, target_table: str) -> str:
+    """Derive the id of loading one file content into one table.
+
+    Args:
+        content_hash: Hash of the file content (see ``ledger.hash_file``)
+        target_table: Bronze table the file is loaded into
+
+    Returns:
+        Hex string that is identical for every attempt at the same load
+    """
+    payload = f"{content_hash}\0{target_table}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:32]
+
+
+def hash_frame(df: pd.DataFrame) -> str:
+    """Compute a content hash of a DataFrame, for sources without file bytes.
+
+    Args:
+        df: DataFrame to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(",".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class BatchCheckpoint:
+    """Commit state of the batches of one scope (sheet or chunk) of a load.
+
+    Batches are identified by their 1-based number within the scope, so the
+    batch size must not change between attempts (``CheckpointJournal.begin``
+    restarts a load whose batch size changed).
+    """
+
+    def __init__(
+        self,
+        journal: "CheckpointJournal",
+        load_id: str,
+        scope: str,
+        resumed: bool,
+    ):
+        """Initialize the checkpoint.
+
+        Args:
+            journal: Journal recording the commits
+            load_id: Id from ``load_key``
+            scope: Part of the file the batch numbers refer to
+            resumed: Whether an earlier attempt of the load may have written
+                rows that are not journaled yet
+        """
+        self.journal = journal
+        self.load_id = load_id
+        self.scope = scope
+        self.resumed = resumed
+        self.committed = journal.committed(load_id, scope)
+
+    def key(self, batch_number: int) -> str:
+        """Get the value stored in the ``load_id`` column of a batch's rows."""
+        return f"{self.load_id}:{self.scope}:{batch_number}"
+
+    def done(self, batch_number: int) -> bool:
+        """Whether a batch was committed by an earlier attempt."""
+        return batch_number in self.committed
+
+    def commit(self, batch_number: int, rows: int) -> None:
+        """Record a batch whose rows were committed to the bronze table."""
+        self.journal.commit(self.load_id, self.scope, batch_number, rows)
+        self.committed.add(batch_number)
+
+
+class LoadCheckpoint:
+    """Journal state of one load, handed from ``ingest_excel`` to the writers."""
+
+    def __init__(self, journal: "CheckpointJournal", load_id: str, resumed: bool):
+        """Initialize the checkpoint.
+
+        Args:
+            journal: Journal recording the commits
+            load_id: Id from ``load_key``
+            resumed: Whether an earlier attempt of the load was journaled
+        """
+        self.journal = journal
+        self.load_id = load_id
+        self.resumed = resumed
+
+    def scope(self, scope: str) -> BatchCheckpoint:
+        """Get the checkpoint of the batches of one sheet or chunk."""
+        return BatchCheckpoint(self.journal, self.load_id, scope, self.resumed)
+
+
+class CheckpointJournal:
+    """SQLite journal of the batches committed for each load.
+
+    A load is begun before the first batch is written and finished once the
+    whole file was ingested; the journal of a failed load is kept, so the
+    next attempt skips the batches it already committed.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the journal, creating the database if needed.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn, conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS loads (
+                    load_id TEXT PRIMARY KEY,
+                    filename TEXT,
+                    target_table TEXT NOT NULL,
+                    batch_size INTEGER NOT NULL,
+                    started_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS batches (
+                    load_id TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    batch INTEGER NOT NULL,
+                    rows INTEGER NOT NULL,
+                    committed_at REAL NOT NULL,
+                    PRIMARY KEY (load_id, scope, batch)
+                )
+                """
+            )
+
+    def _connect(self):
+        """Open a connection; one per operation keeps the journal process-safe."""
+        return closing(sqlite3.connect(self.path, timeout=30))
+
+    def begin(
+        self, load_id: str, filename: str, target_table: str, batch_size: int
+    ) -> Optional[int]:
+        """Start a load, or continue the journal of an earlier attempt.
+
+        Args:
+            load_id: Id from ``load_key``
+            filename: Original filename
+            target_table: Bronze table the file is loaded into
+            batch_size: Rows per batch
+
+        Returns:
+            Batch size of the earlier attempt, or None for a new load
+        """
+        with self._connect() as conn, conn:
+            row = conn.execute(
+                "SELECT batch_size FROM loads WHERE load_id = ?", (load_id,)
+            ).fetchone()
+            if row is None:
+                conn.execute(
+                    "INSERT INTO loads VALUES (?, ?, ?, ?, ?)",
+                    (load_id, filename, target_table, batch_size, time.time()),
+                )
+                return None
+            return row[0]
+
+    def committed(self, load_id: str, scope: str) -> Set[int]:
+        """Get the numbers of the batches committed for a scope of a load."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT batch FROM batches WHERE load_id = ? AND scope = ?",
+                (load_id, scope),
+            )
+            return {batch for (batch,) in rows}
+
+    def commit(self, load_id: str, scope: str, batch: int, rows: int) -> None:
+        """Record a committed batch.
+
+        Args:
+            load_id: Id from ``load_key``
+            scope: Sheet or chunk the batch belongs to
+            batch: 1-based batch number within the scope
+            rows: Rows in the batch
+        """
+        with self._connect() as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO batches VALUES (?, ?, ?, ?, ?)",
+                (load_id, scope, batch, rows, time.time()),
+            )
+
+    def progress(self, load_id: str) -> Dict[str, int]:
+        """Summarize the committed batches of a load.
+
+        Args:
+            load_id: Id from ``load_key``
+
+        Returns:
+            Dictionary with the number of committed ``batches`` and ``rows``
+        """
+        with self._connect() as conn:
+            batches, rows = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(rows), 0) FROM batches "
+                "WHERE load_id = ?",
+                (load_id,),
+            ).fetchone()
+        return {"batches": batches, "rows": rows}
+
+    def finish(self, load_id: str) -> None:
+        """Forget a load, after it completed or its rows were removed.
+
+        Args:
+            load_id: Id from ``load_key``
+        """
+        with self._connect() as conn, conn:
+            conn.execute("DELETE FROM batches WHERE load_id = ?", (load_id,))
+            conn.execute("DELETE FROM loads WHERE load_id = ?", (load_id,))
+
+
+def create_journal(settings: Dict) -> Optional[CheckpointJournal]:
+    """Create the journal configured by the ``checkpoint_path`` setting.
+
+    Args:
+        settings: Application configuration dictionary
+
+    Returns:
+        CheckpointJournal, or None when ``checkpoint_path`` is empty
+    """
+    if not settings.get("checkpoint_path"):
+        return None
+    return CheckpointJournal(settings["checkpoint_path"])
+
+
+def delete_load_sql(target_table: str, prefix: bool = False) -> str:
+    """Build a parameterized DELETE of the rows written by a batch or a load.
+
+    Args:
+        target_table: Bronze table the rows were loaded into
+        prefix: Match ``load_id`` values starting with the parameter
+            rather than equal to it
+
+    Returns:
+        DELETE statement taking a ``load_id`` parameter
+    """
+    operator = "LIKE" if prefix else "="
+    # nosec
+    # B608: SQL injection is not possible as table name is fixed
+    return f"DELETE FROM {target_table} WHERE load_id {operator} %(load_id)s"
+
+
+def begin_checkpoint(
+    journal: CheckpointJournal,
+    connector,
+    source: Union[str, IO[bytes], pd.DataFrame],
+    filename: str,
+    target_table: str,
+    batch_size: int,
+    content_hash: Optional[str] = None,
+) -> LoadCheckpoint:
+    """Start journaling a load, or resume an interrupted one.
+
+    Loads are identified by content hash and target table, so rerunning a
+    failed file (under any name) picks up its journal. If the batch size
+    changed since, batch numbers no longer line up: the rows written by
+    the earlier attempt are deleted and the load starts over.
+
+    Args:
+        journal: Journal recording the commits
+        connector: Connector used to delete the rows of a restarted load
+        source: File path, rewound in-memory content or DataFrame
+        filename: Original filename
+        target_table: Bronze table the file is loaded into
+        batch_size: Rows per batch
+        content_hash: Hash from ``ledger.hash_file``, if already computed
+
+    Returns:
+        LoadCheckpoint of the load
+    """
+    if content_hash is None:
+        if isinstance(source, pd.DataFrame):
+            content_hash = hash_frame(source)
+        else:
+            content_hash = hash_file(source)
+
+    load_id = load_key(content_hash, target_table)
+    previous = journal.begin(load_id, filename, target_table, batch_size)
+    if previous is not None and previous != batch_size:
+        logger.warning(
+            f"Batch size changed from {previous} since the interrupted load "
+            f"of {filename}; deleting its rows and starting over"
+        )
+        connector.execute_query(
+            delete_load_sql(target_table, prefix=True), {"load_id": f"{load_id}:%"}
+        )
+        journal.finish(load_id)
+        journal.begin(load_id, filename, target_table, batch_size)
+        previous = None
+    elif previous is not None:
+        done = journal.progress(load_id)
+        logger.info(
+            f"Resuming {filename}: {done['batches']} batches with "
+            f"{done['rows']} rows were already committed"
+        )
+    return LoadCheckpoint(journal, load_id, resumed=previous is not None)
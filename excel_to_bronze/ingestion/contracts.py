@@ -0,0 +1,485 @@
+"""Declarative schema contracts checked with vectorized masks before loading.
+
+A contract applies to files whose name matches its ``pattern`` and lists
+per-column rules::
+
+    contracts:
+      - name: orders
+        pattern: "orders_*.xlsx"
+        columns:
+          order_id: {type: int, required: true, nullable: false, unique: true}
+          amount: {type: float, min: 0, max: 1000000}
+          email: {regex: "[^@ ]+@[^@ ]+"}
+          status: {allowed: [open, shipped, closed]}
+        unique: [[order_id, line]]
+
+Every rule yields a boolean mask over the rows from pandas/NumPy operations,
+so checking a million rows costs milliseconds per rule rather than a Python
+call per row. Rows failing any rule are quarantined together with the names
+of the rules they broke.
+"""
+import fnmatch
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+COLUMN_TYPES = ("int", "float", "number", "str", "bool", "datetime")
+COLUMN_RULES = (
+    "type",
+    "required",
+    "nullable",
+    "min",
+    "max",
+    "regex",
+    "allowed",
+    "unique",
+)
+CONTRACT_KEYS = ("name", "pattern", "sheets", "columns", "unique")
+
+# What happens to rows breaking a contract: "quarantine" loads the other rows
+# and sets them aside; "fail" rejects the whole file
+CONTRACT_ACTIONS = ("quarantine", "fail")
+
+# Rules listed in the log summary of a file, slowest first
+SLOWEST_RULES = 3
+
+# First pandas major version with pd.to_datetime(format="mixed")
+MIXED_FORMAT_PANDAS = 2
+
+# pd.to_datetime options parsing every value on its own. Newer pandas infers
+# one format from the first value unless told the formats are mixed; earlier
+# versions lack format="mixed" but parse each value separately by default.
+MIXED_DATETIMES = (
+    {"format": "mixed"}
+    if int(pd.__version__.split(".")[0]) >= MIXED_FORMAT_PANDAS
+    else {}
+)
+
+
+def _numeric(series: pd.Series) -> pd.Series:
+    """Values as numbers; values that are not numbers become NaN."""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series
+    return pd.to_numeric(series, errors="coerce")
+
+
+def null_violations(series: pd.Series) -> np.ndarray:
+    """Find missing values (empty cells and NA markers such as "NA")."""
+    return series.isna().to_numpy()
+
+
+def type_violations(series: pd.Series, type_name: str) -> np.ndarray:
+    """Find present values that cannot be read as ``type_name``.
+
+    Typed columns pass or fail as a whole from their dtype; only object
+    columns are inspected value by value. Numeric text counts as a number and
+    integral floats (e.g. an integer column with gaps) as integers.
+
+    Args:
+        series: Column to check
+        type_name: One of ``COLUMN_TYPES``
+
+    Returns:
+        Boolean mask of violating rows
+    """
+    present = series.notna().to_numpy()
+    dtype = series.dtype
+    if type_name in ("float", "number", "int"):
+        if pd.api.types.is_integer_dtype(dtype):
+            return np.zeros(len(series), dtype=bool)
+        numbers = _numeric(series).to_numpy(dtype=float, na_value=np.nan)
+        bad = np.isnan(numbers)
+        if type_name == "int":
+            with np.errstate(invalid="ignore"):
+                bad = bad | np.isfinite(numbers) & (np.mod(numbers, 1) != 0)
+            bad = bad | np.isinf(numbers)
+        return present & bad
+    if type_name == "str":
+        if isinstance(dtype, pd.StringDtype):
+            return np.zeros(len(series), dtype=bool)
+        if dtype != object:
+            return present
+        if pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty"):
+            return np.zeros(len(series), dtype=bool)
+        try:
+            # Only strings have a length through the .str accessor
+            lengths = series.str.len()
+        except AttributeError:
+            return present
+        return present & lengths.isna().to_numpy()
+    if type_name == "bool":
+        if pd.api.types.is_bool_dtype(dtype):
+            return np.zeros(len(series), dtype=bool)
+        return present & ~series.isin([True, False]).to_numpy()
+    if type_name == "datetime":
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return np.zeros(len(series), dtype=bool)
+        parsed = pd.to_datetime(series, errors="coerce", **MIXED_DATETIMES)
+        return present & parsed.isna().to_numpy()
+    raise ValueError(f"Unknown column type: {type_name}")
+
+
+def range_violations(
+    series: pd.Series, low: Optional[Any] = None, high: Optional[Any] = None
+) -> np.ndarray:
+    """Find present values outside ``[low, high]``; values that are not
+    numbers (or dates, for datetime columns) are outside too.
+
+    Args:
+        series: Column to check
+        low: Smallest allowed value
+        high: Largest allowed value
+
+    Returns:
+        Boolean mask of violating rows
+    """
+    present = series.notna().to_numpy()
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        values = series
+        low = None if low is None else pd.Timestamp(low)
+        high = None if high is None else pd.Timestamp(high)
+    else:
+        values = _numeric(series)
+    bad = values.isna().to_numpy()
+    if low is not None:
+        bad = bad | (values < low).to_numpy(dtype=bool, na_value=False)
+    if high is not None:
+        bad = bad | (values > high).to_numpy(dtype=bool, na_value=False)
+    return present & bad
+
+
+def pattern_violations(series: pd.Series, pattern: str) -> np.ndarray:
+    """Find present values whose text does not fully match ``pattern``."""
+    present = series.notna().to_numpy()
+    matched = series.astype("string").str.fullmatch(pattern)
+    return present & ~matched.to_numpy(dtype=bool, na_value=False)
+
+
+def allowed_violations(series: pd.Series, allowed: Sequence[Any]) -> np.ndarray:
+    """Find present values that are not in ``allowed``."""
+    return series.notna().to_numpy() & ~series.isin(list(allowed)).to_numpy()
+
+
+class SchemaContract:
+    """Rules that the rows of matching files must satisfy."""
+
+    def __init__(
+        self,
+        name: str,
+        pattern: str = "*",
+        columns: Optional[Dict[str, Dict[str, Any]]] = None,
+        unique: Optional[Iterable[Sequence[str]]] = None,
+        sheets: str = "*",
+    ):
+        """Initialize the contract.
+
+        Args:
+            name: Name used in logs and metrics
+            pattern: Glob matched against the file name
+            columns: Rules per column name (see ``COLUMN_RULES``)
+            unique: Column combinations whose values must be unique
+            sheets: Glob matched against the sheet name when sheets are
+                ingested by name
+
+        Raises:
+            ValueError: If a rule is unknown or malformed
+        """
+        self.name = name
+        self.pattern = pattern
+        self.sheets = sheets
+        self.columns: Dict[str, Dict[str, Any]] = {}
+        self.unique: List[List[str]] = [list(keys) for keys in unique or ()]
+
+        for column, spec in (columns or {}).items():
+            rules = dict(spec or {})
+            unknown = set(rules) - set(COLUMN_RULES)
+            if unknown:
+                raise ValueError(
+                    f"Contract {name}: unknown rules for {column}: "
+                    f"{', '.join(sorted(unknown))}"
+                )
+            if "type" in rules and rules["type"] not in COLUMN_TYPES:
+                raise ValueError(
+                    f"Contract {name}: unknown type {rules['type']!r} for {column}. "
+                    f"Supported: {', '.join(COLUMN_TYPES)}"
+                )
+            if "regex" in rules:
+                try:
+                    re.compile(rules["regex"])
+                except re.error as e:
+                    raise ValueError(
+                        f"Contract {name}: invalid regex for {column}: {e}"
+                    ) from e
+            if rules.pop("unique", False):
+                self.unique.append([column])
+            self.columns[str(column)] = rules
+
+    @classmethod
+    def from_dict(cls, spec: Dict[str, Any]) -> "SchemaContract":
+        """Create a contract from its configuration entry.
+
+        Raises:
+            ValueError: If the entry has unknown keys or rules
+        """
+        unknown = set(spec) - set(CONTRACT_KEYS)
+        if unknown:
+            raise ValueError(
+                f"Unknown contract keys: {', '.join(sorted(unknown))}. "
+                f"Supported: {', '.join(CONTRACT_KEYS)}"
+            )
+        pattern = spec.get("pattern", "*")
+        return cls(
+            name=spec.get("name") or pattern,
+            pattern=pattern,
+            columns=spec.get("columns"),
+            unique=spec.get("unique"),
+            sheets=spec.get("sheets", "*"),
+        )
+
+    def matches(self, filename: str, sheet_name: Optional[str] = None) -> bool:
+        """Whether the contract applies to a file (and sheet, if named)."""
+        if not fnmatch.fnmatch(os.path.basename(filename), self.pattern):
+            return False
+        return sheet_name is None or fnmatch.fnmatch(str(sheet_name), self.sheets)
+
+    def validator(self) -> "ContractValidator":
+        """Create a validator for one file, or one sheet of a workbook."""
+        return ContractValidator(self)
+
+
+class ValidationResult:
+    """Rows of a frame that broke a contract, per rule."""
+
+    def __init__(
+        self,
+        contract: SchemaContract,
+        rows: int,
+        failures: Dict[str, np.ndarray],
+        timings: Dict[str, float],
+    ):
+        """Initialize the result.
+
+        Args:
+            contract: Contract that was checked
+            rows: Number of rows checked
+            failures: Mask of violating rows per rule that any row broke
+            timings: Seconds spent per rule
+        """
+        self.contract = contract
+        self.rows = rows
+        self.failures = failures
+        self.timings = timings
+        self.valid = np.ones(rows, dtype=bool)
+        for mask in failures.values():
+            self.valid &= ~mask
+
+    @property
+    def failed(self) -> int:
+        """Number of rows breaking at least one rule."""
+        return self.rows - int(self.valid.sum())
+
+    def violations(self) -> List[List[str]]:
+        """Rules broken by each failing row, in row order."""
+        if not self.failures:
+            return []
+        names = list(self.failures)
+        matrix = np.vstack([self.failures[name] for name in names])[:, ~self.valid]
+        return [[names[i] for i in np.flatnonzero(row)] for row in matrix.T]
+
+    def summary(self) -> str:
+        """One-line description of the failures and the slowest rules."""
+        counts = ", ".join(
+            f"{name} {int(mask.sum())}" for name, mask in self.failures.items()
+        )
+        slowest = sorted(self.timings.items(), key=lambda item: item[1], reverse=True)
+        timing = ", ".join(
+            f"{name} {seconds * 1000:.1f} ms"
+            for name, seconds in slowest[:SLOWEST_RULES]
+        )
+        text = f"{self.failed} of {self.rows} rows failed contract {self.contract.name}"
+        if counts:
+            text += f" ({counts})"
+        return (
+            f"{text}; {len(self.timings)} rules took "
+            f"{sum(self.timings.values()) * 1000:.1f} ms ({timing})"
+        )
+
+
+class ContractValidator:
+    """Checks the frames of one file against a contract.
+
+    Uniqueness holds across every frame validated, so a file streamed in
+    chunks is checked like one read whole: the first row with a key passes
+    and later rows repeating it fail.
+    """
+
+    def __init__(self, contract: SchemaContract):
+        """Initialize the validator.
+
+        Args:
+            contract: Contract to check
+        """
+        self.contract = contract
+        # Hashes of the keys of earlier frames, per unique rule
+        self.seen: Dict[str, List[np.ndarray]] = {}
+
+    def duplicates(self, df: pd.DataFrame, keys: List[str], rule: str) -> np.ndarray:
+        """Find rows whose key repeats an earlier row's; null keys are ignored.
+
+        Keys are compared by their 64-bit hashes, with pandas' hash tables
+        rather than sorting.
+        """
+        hashes = pd.util.hash_pandas_object(df[keys], index=False)
+        present = df[keys].notna().all(axis=1).to_numpy()
+        repeated = hashes.duplicated(keep="first").to_numpy()
+        seen = self.seen.setdefault(rule, [])
+        if seen:
+            earlier = seen[0] if len(seen) == 1 else np.concatenate(seen)
+            repeated = repeated | hashes.isin(earlier).to_numpy()
+        seen.append(hashes.to_numpy()[present])
+        return present & repeated
+
+    def validate(self, df: pd.DataFrame) -> ValidationResult:
+        """Check a frame against the contract.
+
+        A missing required column fails every row; rules of other missing
+        columns are skipped.
+
+        Args:
+            df: DataFrame as read from the file
+
+        Returns:
+            ValidationResult with the failing rows per rule and rule timings
+        """
+        failures: Dict[str, np.ndarray] = {}
+        timings: Dict[str, float] = {}
+        rows = len(df)
+
+        def check(rule: str, evaluate, *args) -> None:
+            started = time.perf_counter()
+            mask = evaluate(*args)
+            timings[rule] = time.perf_counter() - started
+            if mask.any():
+                failures[rule] = mask
+
+        for column, rules in self.contract.columns.items():
+            if column not in df.columns:
+                if rules.get("required"):
+                    check(f"required:{column}", np.ones, rows, bool)
+                continue
+            series = df[column]
+            if rules.get("nullable") is False:
+                check(f"not_null:{column}", null_violations, series)
+            if "type" in rules:
+                check(f"type:{column}", type_violations, series, rules["type"])
+            if "min" in rules or "max" in rules:
+                check(
+                    f"range:{column}",
+                    range_violations,
+                    series,
+                    rules.get("min"),
+                    rules.get("max"),
+                )
+            if "regex" in rules:
+                check(f"regex:{column}", pattern_violations, series, rules["regex"])
+            if "allowed" in rules:
+                check(f"allowed:{column}", allowed_violations, series, rules["allowed"])
+
+        for keys in self.contract.unique:
+            rule = f"unique:{','.join(keys)}"
+            missing = [key for key in keys if key not in df.columns]
+            if missing:
+                logger.warning(
+                    f"Contract {self.contract.name}: skipping {rule}, "
+                    f"columns not found: {', '.join(missing)}"
+                )
+                continue
+            check(rule, self.duplicates, df, keys, rule)
+
+        return ValidationResult(self.contract, rows, failures, timings)
+
+
+@dataclass
+class ContractSettings:
+    """What happens to rows breaking a contract, and where they are kept."""
+
+    action: str = "quarantine"
+    quarantine_table: Optional[str] = None
+    quarantine_dir: str = "quarantine"
+
+    def __post_init__(self):
+        """Check the contract action."""
+        if self.action not in CONTRACT_ACTIONS:
+            raise ValueError(
+                f"Unsupported contract action: {self.action}. "
+                f"Supported: {', '.join(CONTRACT_ACTIONS)}"
+            )
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> "ContractSettings":
+        """Read the settings from the application configuration.
+
+        Args:
+            settings: Application configuration dictionary
+
+        Returns:
+            ContractSettings
+
+        Raises:
+            ValueError: If ``contract_action`` is not supported
+        """
+        return cls(
+            action=settings["contract_action"],
+            quarantine_table=settings["quarantine_table"],
+            quarantine_dir=settings["quarantine_dir"],
+        )
+
+
+def load_contracts(settings: Dict[str, Any]) -> List[SchemaContract]:
+    """Load the contracts configured by the application settings.
+
+    Contracts come from the ``contracts`` list of the configuration file and
+    from the YAML file at ``contracts_path`` (a mapping with a ``contracts``
+    list, or the list itself), in that order.
+
+    Args:
+        settings: Application configuration dictionary
+
+    Returns:
+        Contracts in the order they are matched
+
+    Raises:
+        ValueError: If a contract is malformed
+    """
+    specs = list(settings.get("contracts") or [])
+    path = settings.get("contracts_path")
+    if path:
+        import yaml
+
+        with open(path) as f:
+            loaded = yaml.safe_load(f) or []
+        if isinstance(loaded, dict):
+            loaded = loaded.get("contracts") or []
+        specs.extend(loaded)
+    return [SchemaContract.from_dict(spec) for spec in specs]
+
+
+def find_contract(
+    contracts: Sequence[SchemaContract],
+    filename: str,
+    sheet_name: Optional[str] = None,
+) -> Optional[SchemaContract]:
+    """Get the first contract applying to a file, or None."""
+    for contract in contracts:
+        if contract.matches(filename, sheet_name):
+            return contract
+    return None
@@ -0,0 +1,240 @@
+"""Row fingerprints for incremental (new/changed rows only) ingestion."""
+import json
+import os
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+
+def row_fingerprints(
+    df: pd.DataFrame, key_columns: Optional[Sequence[str]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute stable per-row keys and content fingerprints.
+
+    Hashing is vectorized with ``pd.util.hash_pandas_object`` and ignores the
+    index, so a row keeps its fingerprint when it moves within the sheet.
+    Without key columns a row is identified by its content alone, which
+    means edits show up as a new row plus a deleted one. Rows sharing a key
+    (e.g. identical rows) are told apart by their occurrence: every
+    occurrence after the first gets ``#<n>`` appended to its key, so adding
+    or removing a copy is detected.
+
+    Args:
+        df: DataFrame as read from the file
+        key_columns: Columns identifying a row across uploads
+
+    Returns:
+        Tuple of (keys, fingerprints) as arrays of hex strings
+    """
+    fingerprints = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    if key_columns:
+        missing = [col for col in key_columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Key columns not found: {', '.join(map(str, missing))}")
+        keys = pd.util.hash_pandas_object(df[list(key_columns)], index=False)
+        keys = keys.to_numpy()
+    else:
+        keys = fingerprints
+
+    def to_hex(values: np.ndarray) -> np.ndarray:
+        return np.char.mod("%016x", values.astype(np.uint64))
+
+    hex_keys = to_hex(keys)
+    occurrence = pd.Series(keys).groupby(keys, sort=False).cumcount().to_numpy()
+    repeated = occurrence > 0
+    if repeated.any():
+        hex_keys = hex_keys.astype(object)
+        hex_keys[repeated] = [
+            f"{key}#{n}" for key, n in zip(hex_keys[repeated], occurrence[repeated])
+        ]
+    return hex_keys, to_hex(fingerprints)
+
+
+class RowDiff:
+    """Result of comparing a sheet's rows with the previous upload."""
+
+    def __init__(
+        self,
+        changed: np.ndarray,
+        entries: List[Tuple[str, str, str]],
+        deleted: List[Tuple[str, str]],
+    ):
+        """Initialize the diff.
+
+        Args:
+            changed: Boolean mask of new or changed rows
+            entries: (key, fingerprint, row id) for every current row
+            deleted: (key, row id) of rows missing from this upload
+        """
+        self.changed = changed
+        self.entries = entries
+        self.deleted = deleted
+
+    def tombstones(
+        self, filename: str, sheet_name: Optional[str] = None
+    ) -> List[Tuple]:
+        """Build bronze rows marking deleted rows.
+
+        Args:
+            filename: Original filename to store
+            sheet_name: Sheet name to record in the metadata
+
+        Returns:
+            Tuples of (id, filename, raw_data) ready for insertion
+        """
+        metadata = {"tombstone": True}
+        if sheet_name is not None:
+            metadata["sheet_name"] = sheet_name
+        return [
+            (
+                row_id,
+                filename,
+                json.dumps({"metadata": {**metadata, "row_key": key}, "data": None}),
+            )
+            for key, row_id in self.deleted
+        ]
+
+
+class FingerprintIndex:
+    """Local SQLite index of row fingerprints per (filename, sheet)."""
+
+    def __init__(self, path: str):
+        """Initialize the index, creating the database if needed.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn, conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS row_fingerprints (
+                    filename TEXT NOT NULL,
+                    sheet TEXT NOT NULL,
+                    row_key TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    row_id TEXT NOT NULL,
+                    PRIMARY KEY (filename, sheet, row_key)
+                )
+                """
+            )
+
+    def _connect(self):
+        """Open a connection; one per operation keeps the index process-safe."""
+        return closing(sqlite3.connect(self.path, timeout=30))
+
+    def load(self, filename: str, sheet: str) -> Dict[str, Tuple[str, str]]:
+        """Load the fingerprints recorded for a sheet.
+
+        Args:
+            filename: Original filename
+            sheet: Sheet name
+
+        Returns:
+            Mapping of row key to (fingerprint, row id)
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT row_key, fingerprint, row_id FROM row_fingerprints "
+                "WHERE filename = ? AND sheet = ?",
+                (filename, sheet),
+            )
+            return {key: (fingerprint, row_id) for key, fingerprint, row_id in rows}
+
+    def diff(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        sheet: str,
+        key_columns: Optional[Sequence[str]] = None,
+    ) -> RowDiff:
+        """Compare a sheet with the fingerprints of its previous upload.
+
+        Args:
+            df: DataFrame as read from the file (index holds the row ids)
+            filename: Original filename
+            sheet: Sheet name
+            key_columns: Columns identifying a row across uploads
+
+        Returns:
+            RowDiff describing new/changed and deleted rows
+        """
+        keys, fingerprints = row_fingerprints(df, key_columns)
+        previous = self.load(filename, sheet)
+        row_ids = df.index.astype(str)
+
+        if previous:
+            previous_fingerprints = np.array(
+                [previous.get(key, ("",))[0] for key in keys], dtype=object
+            )
+            changed = previous_fingerprints != fingerprints
+        else:
+            changed = np.ones(len(df), dtype=bool)
+
+        current = set(keys.tolist())
+        deleted = [
+            (key, row_id) for key, (_, row_id) in previous.items() if key not in current
+        ]
+        entries = list(zip(keys.tolist(), fingerprints.tolist(), row_ids))
+        return RowDiff(changed, entries, deleted)
+
+    def apply(self, filename: str, sheet: str, diff: RowDiff) -> None:
+        """Replace a sheet's fingerprints once its rows were written.
+
+        Args:
+            filename: Original filename
+            sheet: Sheet name
+            diff: Diff returned by ``diff``
+        """
+        with self._connect() as conn, conn:
+            conn.execute(
+                "DELETE FROM row_fingerprints WHERE filename = ? AND sheet = ?",
+                (filename, sheet),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO row_fingerprints VALUES (?, ?, ?, ?, ?)",
+                (
+                    (filename, sheet, key, fingerprint, row_id)
+                    for key, fingerprint, row_id in diff.entries
+                ),
+            )
+
+
+@dataclass
+class IncrementalSettings:
+    """Settings of incremental mode, which loads only new or changed rows."""
+
+    enabled: bool = False
+    key_columns: List[str] = field(default_factory=list)
+    emit_tombstones: bool = False
+    index_path: str = "config/row_fingerprints.db"
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> "IncrementalSettings":
+        """Read the settings from the application configuration.
+
+        Args:
+            settings: Application configuration dictionary
+
+        Returns:
+            IncrementalSettings
+        """
+        return cls(
+            enabled=settings["incremental"],
+            key_columns=list(settings["incremental_key_columns"]),
+            emit_tombstones=settings["emit_tombstones"],
+            index_path=settings["fingerprint_index_path"],
+        )
+
+    def create_index(self) -> Optional[FingerprintIndex]:
+        """Open the fingerprint index, or get None when the mode is off."""
+        return FingerprintIndex(self.index_path) if self.enabled else None
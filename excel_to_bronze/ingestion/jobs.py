@@ -0,0 +1,306 @@
+"""Background ingestion jobs with progress reporting, for interactive front ends."""
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from excel_to_bronze.config import config
+from excel_to_bronze.ingestion.base import Source, as_file_like, describe_source
+from excel_to_bronze.ingestion.pipeline import (
+    IngestionResult,
+    _init_worker,
+    ingest_file,
+)
+from excel_to_bronze.ingestion.readers import SheetSelection
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Per-process worker state; holds the progress event queue in job workers
+_worker_state: Dict = {}
+
+
+class Job:
+    """State of one background ingestion job."""
+
+    def __init__(self, job_id: str, file_path: str, filename: str):
+        """Initialize the job.
+
+        Args:
+            job_id: Unique job identifier
+            file_path: Path of the file to ingest
+            filename: Original filename stored in the bronze table
+        """
+        self.job_id = job_id
+        self.file_path = file_path
+        self.filename = filename
+        self.status = QUEUED
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.batches_written = 0
+        self.total_batches = 0
+        self.rows = 0
+        self.error: Optional[str] = None
+        self.result: Optional[IngestionResult] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished, successfully or not."""
+        return self.status in (SUCCEEDED, FAILED)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the job started running (until it finished)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        """Average write throughput so far."""
+        elapsed = self.elapsed
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def fraction(self) -> float:
+        """Share of batches written, between 0 and 1 (0 while the total is unknown)."""
+        if self.done:
+            return 1.0
+        if not self.total_batches:
+            return 0.0
+        return min(1.0, self.batches_written / self.total_batches)
+
+    def to_dict(self) -> Dict:
+        """Get the job state as a dictionary."""
+        return {
+            "job_id": self.job_id,
+            "filename": self.filename,
+            "status": self.status,
+            "rows": self.rows,
+            "batches_written": self.batches_written,
+            "total_batches": self.total_batches,
+            "seconds": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        return f"Job({self.to_dict()})"
+
+
+def _init_job_worker(max_connections: int, events) -> None:
+    """Set up a job worker process: connection pool and progress queue.
+
+    Workers ignore SIGINT/SIGTERM sent to the whole process group (e.g. Ctrl+C),
+    so running jobs finish; the manager decides when they stop.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    _init_worker(max_connections)
+    _worker_state["events"] = events
+
+
+def _run_job(
+    job_id: str,
+    file_path: Source,
+    filename: str,
+    streaming: Optional[bool],
+    force: bool,
+    sheets: Optional[SheetSelection],
+) -> IngestionResult:
+    """Ingest a file in a worker process, publishing progress events."""
+    events = _worker_state["events"]
+    events.put((job_id, "started", time.time()))
+
+    def on_progress(batches_written: int, total_batches: int, rows: int) -> None:
+        events.put((job_id, "progress", (batches_written, total_batches, rows)))
+
+    return ingest_file(
+        file_path, filename, streaming, force, sheets, on_progress=on_progress
+    )
+
+
+class JobManager:
+    """Runs ingestion jobs on a pool of worker processes.
+
+    ``submit`` queues a file and returns a job id right away; callers poll
+    ``get`` for status, per-batch progress and throughput. Several jobs run
+    at once (up to ``workers``) and the rest wait in the pool's queue.
+    Workers send progress events over a multiprocessing queue that a
+    listener thread applies to the jobs, so polling never blocks on a
+    running ingestion.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_writers: Optional[int] = None,
+        on_finish: Optional[Callable[[Job], None]] = None,
+    ):
+        """Initialize the manager.
+
+        Args:
+            workers: Number of worker processes (defaults to
+                ``pipeline_workers``)
+            max_writers: Total Snowflake connections across workers (defaults
+                to ``max_writers``)
+            on_finish: Called with each job once it has finished
+        """
+        app_config = config.get_application_config()
+        self.workers = max(1, workers or app_config["pipeline_workers"])
+        max_writers = max_writers or app_config["max_writers"]
+        self.jobs: Dict[str, Job] = {}
+        self.on_finish = on_finish
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._events = multiprocessing.Queue()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_job_worker,
+            initargs=(max(1, max_writers // self.workers), self._events),
+        )
+        self._listener = threading.Thread(
+            target=self._listen, name="job-events", daemon=True
+        )
+        self._listener.start()
+
+    def _listen(self) -> None:
+        """Apply progress events from the workers until shutdown."""
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            job_id, kind, payload = event
+            with self._lock:
+                job = self.jobs.get(job_id)
+                if job is None or job.done:
+                    continue
+                if kind == "started":
+                    job.status = RUNNING
+                    job.started_at = payload
+                elif kind == "progress":
+                    batches_written, total_batches, rows = payload
+                    job.batches_written = max(job.batches_written, batches_written)
+                    job.total_batches = total_batches
+                    # Events of concurrently written batches may arrive out of order
+                    job.rows = max(job.rows, rows)
+
+    def submit(
+        self,
+        file_path: Source,
+        original_filename: Optional[str] = None,
+        streaming: Optional[bool] = None,
+        force: bool = False,
+        sheets: Optional[SheetSelection] = None,
+        delete_file: bool = False,
+    ) -> str:
+        """Queue a file for ingestion.
+
+        Args:
+            file_path: Path to Excel file, or its in-memory content (e.g. the
+                bytes of an upload) together with ``original_filename``; the
+                content is sent to the worker without a temporary file
+            original_filename: Original filename to preserve
+            streaming: Read the file in constant memory (see ExcelIngestor)
+            force: Ingest even if the ledger shows the content was already loaded
+            sheets: Sheets to ingest (see ExcelIngestor.ingest_excel)
+            delete_file: Delete ``file_path`` once the job has finished, e.g.
+                for temporary copies of uploads
+
+        Returns:
+            Job id
+        """
+        # Worker processes receive in-memory content as picklable bytes
+        if isinstance(file_path, memoryview):
+            file_path = file_path.tobytes()
+        elif hasattr(file_path, "read"):
+            file_path = as_file_like(file_path).read()
+
+        job_id = uuid.uuid4().hex
+        label = file_path if isinstance(file_path, str) else describe_source(file_path)
+        job = Job(job_id, label, original_filename or os.path.basename(label))
+        with self._lock:
+            self.jobs[job_id] = job
+
+        future = self._executor.submit(
+            _run_job, job_id, file_path, job.filename, streaming, force, sheets
+        )
+        delete_file = delete_file and isinstance(file_path, str)
+        with self._lock:
+            self._futures[job_id] = future
+        future.add_done_callback(lambda future: self._finish(job, future, delete_file))
+        logger.info(f"Queued job {job_id} for {job.filename}")
+        return job_id
+
+    def _finish(self, job: Job, future: Future, delete_file: bool) -> None:
+        """Record the outcome of a job."""
+        try:
+            result = future.result()
+        except Exception as e:  # Worker process died or the job was cancelled
+            result = IngestionResult(job.file_path, job.filename)
+            result.error = str(e) or type(e).__name__
+
+        with self._lock:
+            self._futures.pop(job.job_id, None)
+            job.result = result
+            job.rows = result.rows
+            job.error = result.error
+            job.started_at = job.started_at or job.submitted_at
+            job.finished_at = time.time()
+            job.status = SUCCEEDED if result.success else FAILED
+
+        if delete_file:
+            try:
+                os.unlink(job.file_path)
+            except OSError as e:
+                logger.warning(f"Could not delete {job.file_path}: {e}")
+        logger.info(f"Job {job.job_id} for {job.filename} {job.status}")
+        if self.on_finish:
+            self.on_finish(job)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id, or None if it is unknown."""
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def active(self) -> List[Job]:
+        """Get the jobs that are queued or running."""
+        with self._lock:
+            return [job for job in self.jobs.values() if not job.done]
+
+    def forget(self, job_id: str) -> None:
+        """Drop a finished job from the registry."""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is not None and job.done:
+                del self.jobs[job_id]
+
+    def cancel_queued(self) -> int:
+        """Cancel the jobs that have not started yet; running jobs continue.
+
+        Returns:
+            Number of cancelled jobs
+        """
+        with self._lock:
+            futures = list(self._futures.values())
+        return sum(future.cancel() for future in futures)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers; queued jobs are cancelled unless ``wait``.
+
+        Args:
+            wait: Wait for queued and running jobs to finish
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        self._events.put(None)
+        self._listener.join()
@@ -0,0 +1,355 @@
+"""Persistent ledger of ingested workbooks keyed by content hash."""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zipfile
+from contextlib import closing
+from typing import IO, Dict, Optional, Sequence, Union
+
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Workbook parts whose content determines the parsed sheet data: the sheets,
+# their strings and number formats, and the workbook part with its
+# relationships, which hold the sheet names and order and the 1900/1904 date
+# system
+_SHEET_PARTS = (
+    "xl/worksheets/",
+    "xl/sharedStrings.xml",
+    "xl/styles.xml",
+    "xl/workbook.xml",
+    "xl/_rels/workbook.xml.rels",
+)
+
+
+def hash_file(file_path: Union[str, IO[bytes]]) -> str:
+    """Compute the SHA-256 hash of a file's content.
+
+    Args:
+        file_path: Path to file, or a seekable file-like object (read from
+            its start and rewound afterwards)
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    if hasattr(file_path, "read"):
+        file_path.seek(0)
+        for chunk in iter(lambda: file_path.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        file_path.seek(0)
+        return digest.hexdigest()
+
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_sheets(file_path: Union[str, IO[bytes]]) -> Dict[str, str]:
+    """Get per-sheet hashes of an .xlsx workbook without parsing it.
+
+    Uses the CRC-32 stored in the zip directory for each worksheet part and
+    for the shared-strings, styles and workbook parts the sheets depend on,
+    so renaming a sheet or switching the date system changes them. Legacy
+    .xls files and unreadable archives yield an empty mapping.
+
+    Args:
+        file_path: Path to Excel file, or a seekable file-like object
+
+    Returns:
+        Mapping of workbook part name to CRC hex string
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            return {
+                info.filename: f"{info.CRC:08x}"
+                for info in archive.infolist()
+                if info.filename.startswith(_SHEET_PARTS)
+            }
+    except (zipfile.BadZipFile, OSError):
+        return {}
+    finally:
+        if hasattr(file_path, "seek"):
+            file_path.seek(0)
+
+
+def sheet_signature(sheet_hashes: Dict[str, str]) -> Optional[str]:
+    """Combine per-sheet hashes into one signature.
+
+    Two workbooks with the same signature hold identical sheet data even if
+    other parts (e.g. document properties written on save) differ.
+
+    Args:
+        sheet_hashes: Mapping returned by ``hash_sheets``
+
+    Returns:
+        Hex digest, or None when no sheet hashes are available
+    """
+    if not sheet_hashes:
+        return None
+    payload = json.dumps(sorted(sheet_hashes.items()))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def sheet_selection_key(sheets: Union[str, Sequence[str], None]) -> str:
+    """Normalize a sheet selection for use in the ledger key.
+
+    Patterns (``"*"``, ``"re:<pattern>"``) are kept as given, as the content
+    hash pins the workbook they resolve against; listed names are deduplicated
+    and sorted, since their order does not change which rows are loaded.
+
+    Args:
+        sheets: Sheet selection as accepted by ``select_sheets``
+
+    Returns:
+        Selection key, empty for the default (first sheet only)
+    """
+    if not sheets:
+        return ""
+    if isinstance(sheets, str):
+        if sheets == "*" or sheets.startswith("re:"):
+            return sheets
+        sheets = sheets.split(",")
+    names = sorted({str(name).strip() for name in sheets} - {""})
+    return json.dumps(names) if names else ""
+
+
+class IngestionLedger:
+    """SQLite ledger recording which workbooks were loaded into which table.
+
+    Entries expire after ``ttl_seconds`` and the least recently seen entries
+    are evicted beyond ``max_entries``. When ``snowflake_table`` is set the
+    ledger is also mirrored to (and consulted in) that Snowflake table, so
+    several machines share it.
+
+    Loads of different sheet selections from the same workbook are recorded
+    separately: the selection key is appended to the target table, so entries
+    of the default selection keep the plain table name.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        connector=None,
+        snowflake_table: Optional[str] = None,
+    ):
+        """Initialize the ledger, creating the database if needed.
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Forget entries older than this (None keeps them)
+            max_entries: Keep at most this many entries (None is unbounded)
+            connector: SnowflakeConnector for the optional Snowflake backing
+            snowflake_table: Snowflake table mirroring the ledger
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.connector = connector
+        self.snowflake_table = snowflake_table
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn, conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ingestions (
+                    content_hash TEXT NOT NULL,
+                    target_table TEXT NOT NULL,
+                    sheet_signature TEXT,
+                    sheet_hashes TEXT,
+                    filename TEXT,
+                    ingested_at REAL NOT NULL,
+                    last_seen REAL NOT NULL,
+                    PRIMARY KEY (content_hash, target_table)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ingestions_signature "
+                "ON ingestions (sheet_signature, target_table)"
+            )
+
+    @staticmethod
+    def _target(target_table: str, sheets: str) -> str:
+        """Scope a target table to a sheet selection key."""
+        return f"{target_table}#sheets={sheets}" if sheets else target_table
+
+    def _connect(self):
+        """Open a connection; one per operation keeps the ledger process-safe."""
+        return closing(sqlite3.connect(self.path, timeout=30))
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired entries and trim to ``max_entries`` by last use."""
+        if self.ttl_seconds is not None:
+            conn.execute(
+                "DELETE FROM ingestions WHERE ingested_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+        if self.max_entries is not None:
+            conn.execute(
+                """
+                DELETE FROM ingestions WHERE rowid NOT IN (
+                    SELECT rowid FROM ingestions ORDER BY last_seen DESC LIMIT ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def lookup(
+        self,
+        content_hash: str,
+        target_table: str,
+        signature: Optional[str] = None,
+        sheets: str = "",
+    ) -> Optional[str]:
+        """Find a previous ingestion of the same content into a table.
+
+        Matches on the content hash or, for .xlsx files, on the sheet
+        signature, among ingestions of the same sheet selection. A hit
+        refreshes the entry's last-used time.
+
+        Args:
+            content_hash: Hash from ``hash_file``
+            target_table: Bronze table the file would be loaded into
+            signature: Signature from ``sheet_signature``
+            sheets: Key from ``sheet_selection_key``
+
+        Returns:
+            Filename recorded for the previous ingestion, or None
+        """
+        target_table = self._target(target_table, sheets)
+        with self._connect() as conn, conn:
+            self._evict(conn)
+            row = conn.execute(
+                """
+                SELECT content_hash, filename FROM ingestions
+                WHERE target_table = ?
+                  AND (content_hash = ? OR (? IS NOT NULL AND sheet_signature = ?))
+                LIMIT 1
+                """,
+                (target_table, content_hash, signature, signature),
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE ingestions SET last_seen = ? "
+                    "WHERE content_hash = ? AND target_table = ?",
+                    (time.time(), row[0], target_table),
+                )
+                return row[1]
+
+        if self.snowflake_table and self.connector:
+            return self._lookup_snowflake(content_hash, target_table)
+        return None
+
+    def record(
+        self,
+        content_hash: str,
+        target_table: str,
+        filename: str,
+        sheet_hashes: Optional[Dict[str, str]] = None,
+        sheets: str = "",
+    ) -> None:
+        """Record a successful ingestion.
+
+        Args:
+            content_hash: Hash from ``hash_file``
+            target_table: Bronze table the file was loaded into
+            filename: Original filename
+            sheet_hashes: Mapping from ``hash_sheets``
+            sheets: Key from ``sheet_selection_key``
+        """
+        target_table = self._target(target_table, sheets)
+        now = time.time()
+        sheet_hashes = sheet_hashes or {}
+        with self._connect() as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ingestions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    content_hash,
+                    target_table,
+                    sheet_signature(sheet_hashes),
+                    json.dumps(sheet_hashes),
+                    filename,
+                    now,
+                    now,
+                ),
+            )
+            self._evict(conn)
+
+        if self.snowflake_table and self.connector:
+            self._record_snowflake(content_hash, target_table, filename)
+
+    def forget(self, content_hash: str, target_table: str, sheets: str = "") -> None:
+        """Remove an entry, e.g. after the bronze rows were deleted.
+
+        Args:
+            content_hash: Hash from ``hash_file``
+            target_table: Bronze table the file was loaded into
+            sheets: Key from ``sheet_selection_key``
+        """
+        target_table = self._target(target_table, sheets)
+        with self._connect() as conn, conn:
+            conn.execute(
+                "DELETE FROM ingestions WHERE content_hash = ? AND target_table = ?",
+                (content_hash, target_table),
+            )
+
+    def _lookup_snowflake(self, content_hash: str, target_table: str):
+        """Look up an ingestion in the Snowflake ledger table."""
+        # Ledger table name comes from config, not user input
+        # nosec
+        # B608: SQL injection is not possible as table name is fixed
+        rows = self.connector.execute_query(
+            f"""
+            SELECT filename FROM {self.snowflake_table}
+            WHERE content_hash = %(content_hash)s
+              AND target_table = %(target_table)s
+            LIMIT 1
+            """,
+            {"content_hash": content_hash, "target_table": target_table},
+        )
+        return rows[0][0] if rows else None
+
+    def _record_snowflake(self, content_hash: str, target_table: str, filename: str):
+        """Mirror an ingestion to the Snowflake ledger table."""
+        # nosec
+        # B608: SQL injection is not possible as table name is fixed
+        self.connector.execute_batch(
+            f"""
+            INSERT INTO {self.snowflake_table}
+                (content_hash, target_table, filename, ingested_at)
+            VALUES (%s, %s, %s, CURRENT_TIMESTAMP())
+            """,
+            [(content_hash, target_table, filename)],
+        )
+
+
+def create_ledger(settings: Dict, connector=None) -> Optional[IngestionLedger]:
+    """Create the ledger configured by ``ledger_*`` application settings.
+
+    Args:
+        settings: Application configuration dictionary
+        connector: SnowflakeConnector for the optional Snowflake backing
+
+    Returns:
+        IngestionLedger, or None when ``ledger_path`` is empty
+    """
+    if not settings.get("ledger_path"):
+        return None
+    ttl_days = settings.get("ledger_ttl_days")
+    return IngestionLedger(
+        settings["ledger_path"],
+        ttl_seconds=float(ttl_days) * 86400 if ttl_days else None,
+        max_entries=settings.get("ledger_max_entries"),
+        connector=connector,
+        snowflake_table=settings.get("ledger_table"),
+    )
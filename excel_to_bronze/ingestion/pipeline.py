@@ -0,0 +1,293 @@
+"""Multi-file ingestion pipeline running files in parallel worker processes."""
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional
+
+from excel_to_bronze.config import config
+from excel_to_bronze.connectors.pool import create_pool
+from excel_to_bronze.connectors.snowflake import snowflake_connector
+from excel_to_bronze.ingestion.base import (
+    INGESTORS,
+    Source,
+    describe_source,
+    source_size,
+)
+from excel_to_bronze.ingestion.bronze import ProgressCallback
+from excel_to_bronze.ingestion.readers import SheetSelection
+from excel_to_bronze.ingestion.tabular import create_ingestor
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+# Extensions with a registered ingestor: Excel, CSV/TSV and Parquet
+DEFAULT_EXTENSIONS = tuple(INGESTORS)
+
+
+class IngestionResult:
+    """Outcome of ingesting a single file."""
+
+    def __init__(self, file_path: str, filename: str):
+        """Initialize the result.
+
+        Args:
+            file_path: Path of the ingested file
+            filename: Original filename stored in the bronze table
+        """
+        self.file_path = file_path
+        self.filename = filename
+        self.rows = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the file was ingested without error."""
+        return self.error is None
+
+    def to_dict(self) -> Dict:
+        """Get the result as a dictionary."""
+        return {
+            "file_path": self.file_path,
+            "filename": self.filename,
+            "success": self.success,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 3),
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        return f"IngestionResult({self.to_dict()})"
+
+
+def expand_sources(
+    sources: Iterable[str], extensions: Iterable[str] = DEFAULT_EXTENSIONS
+) -> List[str]:
+    """Expand files, directories and glob patterns into a list of files.
+
+    Directories contribute their (non-recursive) files with a supported
+    extension; glob patterns may use ``**`` to recurse. Duplicates are removed
+    and the original order is kept.
+
+    Args:
+        sources: File paths, directory paths or glob patterns
+        extensions: File extensions to pick up from directories and globs
+
+    Returns:
+        List of file paths
+    """
+    extensions = tuple(ext.lower() for ext in extensions)
+    files: List[str] = []
+    for source in sources:
+        if os.path.isdir(source):
+            candidates = sorted(
+                os.path.join(source, name) for name in os.listdir(source)
+            )
+        elif glob.has_magic(source):
+            candidates = sorted(glob.glob(source, recursive=True))
+        else:
+            # Plain files are passed through so validation reports problems
+            files.append(source)
+            continue
+        files.extend(
+            path
+            for path in candidates
+            if os.path.isfile(path)
+            and path.lower().endswith(extensions)
+            and not os.path.basename(path).startswith("~$")  # Excel lock files
+        )
+    return list(dict.fromkeys(files))
+
+
+def _init_worker(max_connections: int) -> None:
+    """Give a worker process its own connection pool with a capped size.
+
+    Pools inherited from the parent process must not be shared across
+    processes, so each worker starts with a fresh one. Files already run in
+    parallel, so workers parse the sheets of a workbook one after another.
+    """
+    config.get_application_config()["sheet_workers"] = 1
+    settings = dict(config.get_application_config())
+    settings["pool_max_size"] = max_connections
+    settings["pool_min_size"] = min(settings["pool_min_size"], max_connections)
+    snowflake_connector.connection_pool = create_pool(
+        snowflake_connector._connect, settings
+    )
+
+
+def get_worker_ingestor(filename: str):
+    """Get the ingestor reused by every file of a format handled in this process.
+
+    Args:
+        filename: Filename whose extension picks the ingestor
+    """
+    return _get_format_ingestor(os.path.splitext(filename)[1].lower())
+
+
+@lru_cache(maxsize=None)
+def _get_format_ingestor(extension: str):
+    """Create the ingestor registered for an extension, once per process."""
+    return create_ingestor(extension)
+
+
+def ingest_file(
+    file_path: Source,
+    original_filename: Optional[str] = None,
+    streaming: Optional[bool] = None,
+    force: bool = False,
+    sheets: Optional[SheetSelection] = None,
+    on_progress: Optional[ProgressCallback] = None,
+):
+    """Ingest one file and report rows, bytes, duration and errors.
+
+    Errors are captured in the result instead of raised, so one bad file does
+    not stop the others.
+
+    Args:
+        file_path: Path to an Excel, CSV or Parquet file, or its in-memory
+            content or a DataFrame
+            together with ``original_filename``
+        original_filename: Original filename to preserve
+        streaming: Read the file in constant memory (see ExcelIngestor)
+        force: Ingest even if the ledger shows the content was already loaded
+        sheets: Sheets to ingest (see ExcelIngestor.ingest_excel)
+        on_progress: Called after every written batch with (batches written,
+            total batches or 0 if not yet known, rows written) for the whole
+            file
+
+    Returns:
+        IngestionResult for the file
+    """
+    label = file_path if isinstance(file_path, str) else describe_source(file_path)
+    result = IngestionResult(label, original_filename or os.path.basename(label))
+    started = time.perf_counter()
+
+    def track_progress(batches_written: int, total_batches: int, rows: int) -> None:
+        # Events of concurrently written batches may arrive out of order
+        result.rows = max(result.rows, rows)
+        if on_progress:
+            on_progress(batches_written, total_batches, rows)
+
+    try:
+        result.bytes = source_size(file_path) or 0
+        get_worker_ingestor(result.filename).ingest_excel(
+            file_path,
+            result.filename,
+            streaming=streaming,
+            progress_callback=track_progress,
+            force=force,
+            sheets=sheets,
+        )
+    except Exception as e:
+        logger.error(f"Failed to ingest {result.filename}: {e}")
+        result.error = str(e)
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def ingest_files(
+    sources: Iterable[str],
+    workers: Optional[int] = None,
+    max_writers: Optional[int] = None,
+    original_filenames: Optional[Dict[str, str]] = None,
+    on_result: Optional[Callable[[IngestionResult], None]] = None,
+    streaming: Optional[bool] = None,
+    force: bool = False,
+    sheets: Optional[SheetSelection] = None,
+) -> List[IngestionResult]:
+    """Ingest many files in parallel worker processes.
+
+    Parsing and serializing Excel is CPU-bound, so files are spread across
+    processes. The Snowflake connections opened by all workers together are
+    capped at ``max_writers``.
+
+    Args:
+        sources: File paths, directory paths or glob patterns
+        workers: Number of worker processes (defaults to ``pipeline_workers``)
+        max_writers: Total Snowflake connections across workers (defaults to
+            ``max_writers``)
+        original_filenames: Original filename to store, keyed by file path
+        on_result: Called with each result as soon as its file finishes
+        streaming: Read files in constant memory (see ExcelIngestor)
+        force: Ingest files even if the ledger shows they were already loaded
+        sheets: Sheets to ingest from every workbook
+
+    Returns:
+        One IngestionResult per file, in input order
+    """
+    app_config = config.get_application_config()
+    files = expand_sources(sources)
+    original_filenames = original_filenames or {}
+    workers = max(1, min(workers or app_config["pipeline_workers"], len(files) or 1))
+    max_writers = max_writers or app_config["max_writers"]
+
+    logger.info(f"Ingesting {len(files)} files with {workers} worker(s)")
+    results: Dict[str, IngestionResult] = {}
+
+    if workers == 1:
+        for path in files:
+            results[path] = ingest_file(
+                path, original_filenames.get(path), streaming, force, sheets
+            )
+            if on_result:
+                on_result(results[path])
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(max(1, max_writers // workers),),
+        ) as executor:
+            futures = {
+                executor.submit(
+                    ingest_file,
+                    path,
+                    original_filenames.get(path),
+                    streaming,
+                    force,
+                    sheets,
+                ): path
+                for path in files
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    results[path] = future.result()
+                except Exception as e:  # Worker process died
+                    results[path] = IngestionResult(
+                        path, original_filenames.get(path, os.path.basename(path))
+                    )
+                    results[path].error = str(e)
+                if on_result:
+                    on_result(results[path])
+
+    return [results[path] for path in files]
+
+
+def format_summary(results: List[IngestionResult]) -> str:
+    """Format per-file results as a plain-text table.
+
+    Args:
+        results: Results returned by ingest_files
+
+    Returns:
+        Summary table including a totals line
+    """
+    lines = [f"{'file':<40} {'status':<7} {'rows':>10} {'MB':>9} {'seconds':>8}"]
+    for result in results:
+        status = "ok" if result.success else "FAILED"
+        lines.append(
+            f"{result.filename[:40]:<40} {status:<7} {result.rows:>10} "
+            f"{result.bytes / 1e6:>9.2f} {result.seconds:>8.2f}"
+        )
+        if result.error:
+            lines.append(f"    error: {result.error}")
+    failed = sum(not result.success for result in results)
+    lines.append(
+        f"{len(results)} files, {failed} failed, "
+        f"{sum(result.rows for result in results)} rows"
+    )
+    return "\n".join(lines)
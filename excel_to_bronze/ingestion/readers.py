@@ -0,0 +1,258 @@
+"""Streaming Excel readers yielding constant-size DataFrame chunks."""
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Union
+
+import pandas as pd
+
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+SheetName = Union[str, int, None]
+
+# Sheet selection: "*" for all sheets, "re:<pattern>", or a list of names
+SheetSelection = Union[str, Sequence[str], None]
+
+
+def _is_empty(row: Sequence[Any]) -> bool:
+    """Check whether every cell of a row is empty."""
+    return all(value in (None, "") for value in row)
+
+
+def make_header(row: Sequence[Any]) -> List[str]:
+    """Build column names from a header row the way pd.read_excel does.
+
+    Empty header cells become ``Unnamed: <position>`` and duplicate names get
+    a ``.<n>`` suffix.
+
+    Args:
+        row: Values of the header row
+
+    Returns:
+        List of unique column names
+    """
+    header = []
+    seen: dict = {}
+    for position, value in enumerate(row):
+        name = f"Unnamed: {position}" if value in (None, "") else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        header.append(name)
+    return header
+
+
+def select_sheets(sheet_names: Sequence[str], selection: SheetSelection) -> List[str]:
+    """Resolve a sheet selection against a workbook's sheet names.
+
+    Args:
+        sheet_names: Sheet names in workbook order
+        selection: ``"*"`` for all sheets, ``"re:<pattern>"`` for sheets whose
+            name matches the regular expression, or a list (or comma-separated
+            string) of sheet names; empty selects the first sheet
+
+    Returns:
+        Selected sheet names in workbook order, or in the given order for lists
+
+    Raises:
+        ValueError: If a listed sheet does not exist
+    """
+    if not selection:
+        return list(sheet_names[:1])
+    if isinstance(selection, str):
+        if selection == "*":
+            return list(sheet_names)
+        if selection.startswith("re:"):
+            pattern = re.compile(selection[3:])
+            return [name for name in sheet_names if pattern.search(name)]
+        selection = [name.strip() for name in selection.split(",") if name.strip()]
+
+    missing = [name for name in selection if name not in sheet_names]
+    if missing:
+        raise ValueError(f"Sheets not found: {', '.join(missing)}")
+    return list(dict.fromkeys(selection))
+
+
+def align_dtypes(
+    chunk: pd.DataFrame, dtypes: Dict[Any, Any], drifted: Set[Any]
+) -> pd.DataFrame:
+    """Give a streamed chunk the column types of the first chunk where possible.
+
+    A column is cast when no value changes: to ``object``, from integers to
+    floats, or when the chunk holds no values in it at all. Those are the
+    types a whole-sheet read infers in these cases, so such chunks serialize
+    as they would in a serial read. Other mismatches (e.g. an integer column
+    that gains decimals or blanks) cannot be cast; the column keeps the type
+    inferred for the chunk and a warning is logged once.
+
+    Args:
+        chunk: Chunk as built from the rows
+        dtypes: Column types of the first chunk
+        drifted: Columns already reported as drifting; updated in place
+
+    Returns:
+        Chunk with aligned column types
+    """
+    casts = {}
+    for column, dtype in chunk.dtypes.items():
+        target = dtypes.get(column)
+        if target is None or dtype == target:
+            continue
+        widened = pd.api.types.is_float_dtype(target) and (
+            pd.api.types.is_integer_dtype(dtype)
+        )
+        # Integer and boolean columns cannot hold missing values
+        empty = chunk[column].isna().all() and not (
+            pd.api.types.is_integer_dtype(target) or pd.api.types.is_bool_dtype(target)
+        )
+        if target == object or widened or empty:
+            casts[column] = target
+        elif column not in drifted:
+            drifted.add(column)
+            logger.warning(
+                f"Streamed column {column!r} changed from {target} to {dtype} "
+                "after the first chunk; its later rows are typed as read, "
+                "unlike a whole-sheet read"
+            )
+    return chunk.astype(casts) if casts else chunk
+
+
+def iter_openpyxl_rows(file_path: str, sheet_name: SheetName = None) -> Iterator[tuple]:
+    """Iterate over worksheet rows of an .xlsx file in read-only mode.
+
+    Args:
+        file_path: Path to Excel file
+        sheet_name: Sheet name or position (defaults to the first sheet)
+
+    Yields:
+        Tuples of cell values
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        if isinstance(sheet_name, str):
+            worksheet = workbook[sheet_name]
+        else:
+            worksheet = workbook.worksheets[sheet_name or 0]
+        yield from worksheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_xlrd_rows(file_path: str, sheet_name: SheetName = None) -> Iterator[list]:
+    """Iterate over worksheet rows of a legacy .xls file.
+
+    Args:
+        file_path: Path to Excel file
+        sheet_name: Sheet name or position (defaults to the first sheet)
+
+    Yields:
+        Lists of cell values with dates and integral numbers converted
+    """
+    import xlrd
+
+    book = xlrd.open_workbook(file_path, on_demand=True)
+    try:
+        if isinstance(sheet_name, str):
+            sheet = book.sheet_by_name(sheet_name)
+        else:
+            sheet = book.sheet_by_index(sheet_name or 0)
+        for index in range(sheet.nrows):
+            values = []
+            for cell in sheet.row(index):
+                if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+                    values.append(None)
+                elif cell.ctype == xlrd.XL_CELL_DATE:
+                    values.append(xlrd.xldate_as_datetime(cell.value, book.datemode))
+                elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
+                    values.append(bool(cell.value))
+                elif cell.ctype == xlrd.XL_CELL_NUMBER and cell.value == int(
+                    cell.value
+                ):
+                    values.append(int(cell.value))
+                else:
+                    values.append(cell.value)
+            yield values
+    finally:
+        book.release_resources()
+
+
+def iter_excel_chunks(
+    file_path: str, chunk_size: int, sheet_name: SheetName = None
+) -> Iterator[pd.DataFrame]:
+    """Read an Excel sheet as a stream of DataFrame chunks.
+
+    Only one chunk of rows is held in memory at a time. The first row is used
+    as the header, trailing empty rows are dropped and each chunk carries a
+    RangeIndex continuing from the previous one, so row positions match a
+    full ``pd.read_excel`` of the same sheet. Later chunks take the column
+    types of the first one where that changes no value (see
+    ``align_dtypes``), so a column does not switch between e.g. integers and
+    floats from chunk to chunk.
+
+    Args:
+        file_path: Path to Excel file
+        chunk_size: Maximum number of rows per chunk
+        sheet_name: Sheet name or position (defaults to the first sheet)
+
+    Yields:
+        DataFrame chunks of at most ``chunk_size`` rows
+    """
+    _, ext = os.path.splitext(file_path)
+    if ext.lower() == ".xls":
+        rows: Iterator[Sequence[Any]] = iter_xlrd_rows(file_path, sheet_name)
+    else:
+        rows = iter_openpyxl_rows(file_path, sheet_name)
+
+    header: Optional[List[str]] = None
+    buffer: List[Sequence[Any]] = []
+    pending_empty: List[Sequence[Any]] = []
+    offset = 0
+    dtypes: Dict[Any, Any] = {}
+    drifted: Set[Any] = set()
+
+    def make_chunk(chunk_rows: List[Sequence[Any]]) -> pd.DataFrame:
+        width = len(header)
+        normalized = [(tuple(row) + (None,) * width)[:width] for row in chunk_rows]
+        chunk = pd.DataFrame(
+            normalized,
+            columns=header,
+            index=pd.RangeIndex(offset, offset + len(normalized)),
+        )
+        if not dtypes:
+            dtypes.update(chunk.dtypes.items())
+            return chunk
+        return align_dtypes(chunk, dtypes, drifted)
+
+    for row in rows:
+        if header is None:
+            if _is_empty(row):
+                continue
+            header_row = list(row)
+            while header_row and header_row[-1] in (None, ""):
+                header_row.pop()
+            header = make_header(header_row)
+            continue
+
+        # Hold back empty rows until we know they are not trailing
+        if _is_empty(row):
+            pending_empty.append(row)
+            continue
+        buffer.extend(pending_empty)
+        pending_empty.clear()
+        buffer.append(row)
+
+        while len(buffer) >= chunk_size:
+            chunk = make_chunk(buffer[:chunk_size])
+            del buffer[:chunk_size]
+            offset += len(chunk)
+            yield chunk
+
+    if header is not None and buffer:
+        yield make_chunk(buffer)
+
+    logger.debug(f"Finished streaming {file_path}")
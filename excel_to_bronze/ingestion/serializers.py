@@ -1,10 +1,59 @@
 """Data serialization utilities for ingestion pipeline."""
+import hashlib
 import json
-from datetime import datetime, timedelta
-from typing import Any, Dict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
+# Numpy dtype kinds whose values unbox to a single Python type per column
+_NATIVE_KINDS = "iufb"
+
+# String columns with at most this share of distinct values become categoricals
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def get_json_dumps(backend: Optional[str] = None) -> Callable[[Any], str]:
+    """Get a JSON encoding function for the requested backend.
+
+    The default ``json`` backend produces the canonical ``raw_data`` format.
+    ``orjson`` and ``ujson`` emit compact (semantically identical) JSON and are
+    only used when explicitly requested; ``auto`` picks the fastest one
+    installed.
+
+    Args:
+        backend: One of ``json``, ``orjson``, ``ujson`` or ``auto``
+
+    Returns:
+        Function encoding a Python object to a JSON string
+    """
+    backend = (backend or "json").lower()
+    candidates = ["orjson", "ujson", "json"] if backend == "auto" else [backend]
+
+    for name in candidates:
+        if name == "json":
+            return json.dumps
+        try:
+            if name == "orjson":
+                import orjson
+
+                return lambda obj: orjson.dumps(
+                    obj, option=orjson.OPT_NON_STR_KEYS
+                ).decode("utf-8")
+            if name == "ujson":
+                import ujson
+
+                return ujson.dumps
+        except ImportError:
+            continue
+        raise ValueError(f"Unknown JSON backend: {backend}")
+
+    if backend == "auto":
+        return json.dumps
+    raise ValueError(f"JSON backend '{backend}' is not installed")
+
 
 class DataSerializer:
     """Handles serialization of DataFrame data to JSON format."""
@@ -21,10 +70,13 @@ class DataSerializer:
         """
         if pd.isna(value):
             return None
-        elif isinstance(value, (pd.Timestamp, datetime)):
+        elif isinstance(value, (pd.Timestamp, datetime, date, time)):
             return value.isoformat()
         elif isinstance(value, (pd.Timedelta, timedelta)):
             return str(value)
+        elif isinstance(value, Decimal):
+            # Kept as text so decimal columns (e.g. from Parquet) lose no digits
+            return str(value)
         elif hasattr(value, "item"):  # Handle numpy types
             return value.item()
         return value
@@ -49,21 +101,227 @@ class DataSerializer:
         return json.dumps(row_dict)
 
     @classmethod
-    def serialize_dataframe(cls, df: pd.DataFrame) -> pd.Series:
+    def convert_column(cls, source: pd.Series, values: np.ndarray) -> List[Any]:
+        """Convert a whole column to JSON-serializable values.
+
+        Args:
+            source: Original DataFrame column, used for its dtype
+            values: The column as it appears in the row-wise (interleaved) array
+
+        Returns:
+            List of JSON-serializable values, one per row
+        """
+        kind = source.dtype.kind if isinstance(source.dtype, np.dtype) else "O"
+
+        if kind in _NATIVE_KINDS:
+            converted = values.tolist()
+            if kind == "f":
+                for i in np.flatnonzero(pd.isna(source.to_numpy())):
+                    converted[i] = None
+            return converted
+
+        if kind == "M" and source.dt.tz is None:
+            raw = source.to_numpy()
+            missing = np.isnat(raw)
+            seconds = raw.astype("datetime64[s]")
+            # Timestamp.isoformat() omits the fraction for whole seconds, which
+            # is exactly what numpy renders at second resolution
+            if (seconds.astype(raw.dtype) == raw)[~missing].all():
+                converted = np.datetime_as_string(seconds, unit="s").tolist()
+                for i in np.flatnonzero(missing):
+                    converted[i] = None
+                return converted
+
+        return [cls.convert_value(v) for v in values]
+
+    @staticmethod
+    def column_type_names(source: pd.Series, values: np.ndarray) -> List[str]:
+        """Get the per-row type names recorded in the ``dtypes`` metadata.
+
+        Args:
+            source: Original DataFrame column, used for its dtype
+            values: The column as it appears in the row-wise (interleaved) array
+
+        Returns:
+            List of type names, one per row
+        """
+        if len(values) and isinstance(source.dtype, np.dtype):
+            if source.dtype.kind in _NATIVE_KINDS:
+                return [type(values[0]).__name__] * len(values)
+        return [type(v).__name__ for v in values]
+
+    @classmethod
+    def serialize_dataframe(
+        cls,
+        df: pd.DataFrame,
+        json_backend: Optional[str] = None,
+        extra_metadata: Optional[Dict[str, Any]] = None,
+        compact: bool = False,
+    ) -> pd.Series:
         """Serialize a DataFrame to a Series of JSON strings.
 
+        See ``serialize_rows``, which returns the strings as a plain list.
+
         Args:
             df: DataFrame to serialize
+            json_backend: JSON backend name (see ``get_json_dumps``)
+            extra_metadata: Additional keys for every row's metadata block
+            compact: Use the compact payload layout
 
         Returns:
-            Series of JSON strings
+            Series of JSON strings indexed like ``df``
         """
-        return df.apply(cls.row_to_json, axis=1)
+        rows = cls.serialize_rows(df, json_backend, extra_metadata, compact)
+        return pd.Series(rows, index=df.index, dtype=object)
+
+    @classmethod
+    def serialize_rows(
+        cls,
+        df: pd.DataFrame,
+        json_backend: Optional[str] = None,
+        extra_metadata: Optional[Dict[str, Any]] = None,
+        compact: bool = False,
+    ) -> List[str]:
+        """Serialize a DataFrame to a list of JSON strings, one per row.
+
+        Works column by column: each column is converted once based on its
+        dtype and the shared metadata block is encoded once per distinct set
+        of row types. With the default backend the output is byte-identical to
+        applying ``row_to_json`` to every row.
+
+        Args:
+            df: DataFrame to serialize
+            json_backend: JSON backend name (see ``get_json_dumps``)
+            extra_metadata: Additional keys for every row's metadata block,
+                e.g. the sheet name
+            compact: Leave column names and dtypes out of the metadata block
+                (which then holds only ``extra_metadata``) and store ``data``
+                as a list of values in column order; the columns are
+                described once by ``schema_manifest`` instead
+
+        Returns:
+            List of JSON strings in row order
+        """
+        dumps = get_json_dumps(json_backend)
+        if df.empty:
+            return []
+
+        # Row-wise values as pandas presents them to row_to_json, whose rows
+        # share the frame's common dtype: all-numeric numpy frames are
+        # interleaved (and upcast) into one array; a common extension dtype
+        # (e.g. Int64 for Int64 and int64 columns) is applied column by
+        # column; otherwise every column is boxed on its own, which is what
+        # the object interleave would hold, without materializing the whole
+        # frame as objects
+        columns = [df.iloc[:, j] for j in range(df.shape[1])]
+        row_dtype = df.iloc[0].dtype
+        values = None
+        extension_rows = not isinstance(row_dtype, np.dtype)
+        if extension_rows:
+            columns = [
+                col if col.dtype == row_dtype else col.astype(row_dtype)
+                for col in columns
+            ]
+        elif row_dtype.kind in _NATIVE_KINDS:
+            values = df.to_numpy()
+
+        keys = [str(col) for col in df.columns]
+        data_columns: List[List[Any]] = []
+        type_columns: List[List[str]] = []
+        for j, col in enumerate(columns):
+            if values is not None:
+                column_values = values[:, j]
+            elif extension_rows:
+                # Boxed element by element, as indexing the row would
+                column_values = np.fromiter(col.array, dtype=object, count=len(col))
+            else:
+                # Boxes datetimes as Timestamps
+                column_values = col.to_numpy(dtype=object)
+            data_columns.append(cls.convert_column(col, column_values))
+            if not compact:
+                type_columns.append(cls.column_type_names(col, column_values))
+
+        if dumps is json.dumps:
+            prefix, separator, suffix = '{"metadata": ', ', "data": ', "}"
+        else:
+            prefix, separator, suffix = '{"metadata":', ',"data":', "}"
+
+        if compact:
+            metadata = prefix + dumps(extra_metadata or {}) + separator
+            return [
+                metadata + dumps(list(row_values)) + suffix
+                for row_values in zip(*data_columns)
+            ]
+
+        column_names = df.columns.tolist()
+        metadata_cache: Dict[tuple, str] = {}
+
+        def metadata_json(type_names: tuple) -> str:
+            encoded = metadata_cache.get(type_names)
+            if encoded is None:
+                encoded = dumps(
+                    {
+                        "column_names": column_names,
+                        "dtypes": dict(zip(df.columns, type_names)),
+                        **(extra_metadata or {}),
+                    }
+                )
+                metadata_cache[type_names] = encoded
+            return encoded
+
+        return [
+            prefix
+            + metadata_json(type_names)
+            + separator
+            + dumps(dict(zip(keys, row_values)))
+            + suffix
+            for type_names, row_values in zip(zip(*type_columns), zip(*data_columns))
+        ]
+
+    @staticmethod
+    def schema_manifest(df: pd.DataFrame) -> Dict[str, Any]:
+        """Describe a DataFrame's columns once, for compact payloads.
+
+        Args:
+            df: DataFrame to describe
+
+        Returns:
+            Dictionary with ``column_names`` and the pandas ``dtypes`` per
+            column (categoricals are described by their categories' dtype)
+        """
+        return {
+            "column_names": df.columns.tolist(),
+            "dtypes": {
+                str(col): str(
+                    dtype.categories.dtype
+                    if isinstance(dtype, pd.CategoricalDtype)
+                    else dtype
+                )
+                for col, dtype in df.dtypes.items()
+            },
+        }
+
+    @staticmethod
+    def schema_id(manifest: Dict[str, Any]) -> str:
+        """Get a short, stable hash identifying a schema manifest.
+
+        Args:
+            manifest: Dictionary returned by ``schema_manifest``
+
+        Returns:
+            16-character hex digest
+        """
+        payload = json.dumps(manifest, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
     @staticmethod
     def add_metadata(df: pd.DataFrame, metadata: Dict[str, Any]) -> pd.DataFrame:
         """Add metadata columns to DataFrame.
 
+        The result is a shallow copy: it shares the existing columns' data
+        with ``df`` instead of duplicating the frame, and ``df`` itself is
+        left unchanged.
+
         Args:
             df: DataFrame to enhance
             metadata: Dictionary of metadata to add
@@ -71,10 +329,55 @@ class DataSerializer:
         Returns:
             Enhanced DataFrame with metadata columns
         """
-        df_copy = df.copy()
+        df_copy = df.copy(deep=False)
         for key, value in metadata.items():
             if callable(value):
                 df_copy[key] = value(df_copy)
             else:
                 df_copy[key] = value
         return df_copy
+
+    @staticmethod
+    def downcast_strings(
+        df: pd.DataFrame, max_unique_ratio: float = CATEGORY_MAX_UNIQUE_RATIO
+    ) -> pd.DataFrame:
+        """Store string columns compactly without changing serialized output.
+
+        Columns holding only strings (and missing values) become categoricals
+        when at most ``max_unique_ratio`` of their values are distinct, so
+        repeated labels are stored once. Other all-string object columns
+        become pyarrow-backed strings with NaN for missing values where
+        pandas supports that dtype. Mixed-type columns are left alone.
+
+        Args:
+            df: DataFrame to downcast
+            max_unique_ratio: Largest share of distinct values for categoricals
+
+        Returns:
+            Shallow copy of ``df`` with converted columns
+        """
+        converted = {}
+        for position in range(df.shape[1]):
+            column = df.iloc[:, position]
+            if not (
+                pd.api.types.is_object_dtype(column.dtype)
+                or pd.api.types.is_string_dtype(column.dtype)
+            ) or isinstance(column.dtype, pd.CategoricalDtype):
+                continue
+            if pd.api.types.infer_dtype(column, skipna=True) != "string":
+                continue
+            if column.nunique() <= max_unique_ratio * len(column):
+                converted[position] = column.astype("category")
+            elif pd.api.types.is_object_dtype(column.dtype):
+                try:
+                    dtype = pd.StringDtype("pyarrow", na_value=np.nan)
+                except (ImportError, TypeError):  # pandas < 2.1 or no pyarrow
+                    continue
+                converted[position] = column.astype(dtype)
+
+        if not converted:
+            return df
+        df = df.copy(deep=False)
+        for position, column in converted.items():
+            df.isetitem(position, column)
+        return df
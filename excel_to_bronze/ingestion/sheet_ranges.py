@@ -0,0 +1,604 @@
+"""Parallel parsing of one large .xlsx worksheet, split by row range.
+
+The worksheet XML inside the zip is scanned once for row offsets and split
+into byte ranges that start at a ``<row>`` tag. Worker processes decompress
+their range, parse it with openpyxl's worksheet parser (sharing the
+workbook's shared-strings table and date styles) and convert cells the way
+pandas' openpyxl reader does.
+
+pandas infers each column's dtype from the whole column, so ranges cannot
+simply be parsed on their own. A first pass records, per column, one
+representative value of each kind found (integer, decimal, numeric text,
+date, missing, ...). The second pass runs pandas' own ``TextParser`` on each
+range with those representatives appended, which makes every range infer the
+dtype a serial ``pd.read_excel`` infers for the whole column; the
+representatives are dropped again before the range is serialized.
+"""
+import io
+import os
+import pickle  # nosec B403: only reads files this module wrote
+import re
+import zipfile
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from excel_to_bronze.ingestion.base import Source, as_file_like
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+# TextParser options used by pd.read_excel with its defaults
+PARSE_OPTIONS = {"header": 0, "skip_blank_lines": False}
+
+SCAN_BLOCK_BYTES = 4 * 1024 * 1024
+# Bytes carried over between blocks so tags crossing a boundary are found
+SCAN_OVERLAP_BYTES = 4096
+# The XML before <sheetData> (views, column widths, ...) must fit in this
+MAX_HEAD_BYTES = 64 * 1024 * 1024
+
+_NAME = rb"(?:[A-Za-z_][\w.-]*:)?"
+ROW_TAG = re.compile(rb"<" + _NAME + rb"row\b[^>]*>")
+ROW_NUMBER = re.compile(rb"\sr=[\"'](\d+)[\"']")
+SHEET_DATA_START = re.compile(rb"<" + _NAME + rb"sheetData\b[^>]*>")
+SHEET_DATA_END = re.compile(rb"</" + _NAME + rb"sheetData>")
+ROOT_TAG = re.compile(rb"<([A-Za-z_][\w.:-]*)[\s>/]")
+
+# Text pandas reads as a number; other text Python's float() accepts (" 1",
+# "1_000", "infinity") is classed as text, and if pandas disagrees the ranges
+# end up with different dtypes and the file is parsed serially
+INT_TEXT = re.compile(r"[+-]?\d+")
+FLOAT_TEXT = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+# Text pandas reads as missing by default (``na_values``), as of pandas 3.0;
+# if a later version adds values, ranges may disagree on a column's dtype and
+# the file is parsed serially
+NA_VALUES = frozenset(
+    (
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    )
+)
+
+# Per-process state of range workers: the SheetIndex and the workbook source
+_worker_state: Dict = {}
+
+
+# Keys of the cell dicts yielded by openpyxl's WorkSheetParser
+_CELL_KEYS = frozenset(("column", "value", "data_type"))
+
+
+class RangeParseError(Exception):
+    """openpyxl's private parsing API is missing or changed; parse serially."""
+
+
+class OpenpyxlInternals:
+    """Compatibility shim for the private openpyxl API used to parse ranges.
+
+    openpyxl exposes no public way to parse a piece of worksheet XML, so
+    ranges are parsed with ``openpyxl.worksheet._reader.WorkSheetParser`` and
+    the workbook's private ``_date_formats``/``_timedelta_formats`` and the
+    worksheet's ``_worksheet_path``. Every use goes through this class: when
+    an openpyxl release moves or changes them, ``load`` returns None or
+    ``parse_rows`` raises RangeParseError, and the sheet is read serially.
+    """
+
+    def __init__(self, member: str, date_formats: set, timedelta_formats: set):
+        """Initialize the shim.
+
+        Args:
+            member: Path of the worksheet XML inside the zip
+            date_formats: Style ids formatted as dates
+            timedelta_formats: Style ids formatted as durations
+        """
+        self.member = member
+        self.date_formats = date_formats
+        self.timedelta_formats = timedelta_formats
+
+    @staticmethod
+    def parser_class():
+        """Get openpyxl's worksheet parser, or None if it is not available."""
+        try:
+            from openpyxl.worksheet._reader import WorkSheetParser
+        except ImportError:
+            return None
+        return WorkSheetParser
+
+    @classmethod
+    def load(cls, workbook, worksheet) -> Optional["OpenpyxlInternals"]:
+        """Read the private attributes of an open read-only workbook.
+
+        Args:
+            workbook: Workbook from ``openpyxl.load_workbook``
+            worksheet: Worksheet of that workbook
+
+        Returns:
+            OpenpyxlInternals, or None if this openpyxl lacks them
+        """
+        if cls.parser_class() is None:
+            return None
+        try:
+            return cls(
+                worksheet._worksheet_path,
+                set(workbook._date_formats),
+                set(workbook._timedelta_formats),
+            )
+        except AttributeError:
+            return None
+
+    @classmethod
+    def parse_rows(
+        cls,
+        xml: bytes,
+        shared_strings: List[Any],
+        epoch: datetime,
+        date_formats: set,
+        timedelta_formats: set,
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Parse worksheet XML into rows of cells.
+
+        Args:
+            xml: Worksheet XML holding some of the sheet's rows
+            shared_strings: Shared-strings table of the workbook
+            epoch: Date system of the workbook
+            date_formats: Style ids formatted as dates
+            timedelta_formats: Style ids formatted as durations
+
+        Yields:
+            (row number, cells) with a ``column``, ``value`` and
+            ``data_type`` per cell
+
+        Raises:
+            RangeParseError: If the parser is missing or behaves differently
+        """
+        parser_class = cls.parser_class()
+        if parser_class is None:
+            raise RangeParseError("openpyxl has no WorkSheetParser")
+        try:
+            parser = parser_class(
+                io.BytesIO(xml),
+                shared_strings,
+                data_only=True,
+                epoch=epoch,
+                date_formats=date_formats,
+                timedelta_formats=timedelta_formats,
+            )
+            checked = False
+            for number, cells in parser.parse():
+                if cells and not checked:
+                    missing = _CELL_KEYS - cells[0].keys()
+                    if missing:
+                        raise RangeParseError(
+                            f"openpyxl cells lack {', '.join(sorted(missing))}"
+                        )
+                    checked = True
+                yield number, cells
+        except (TypeError, KeyError, AttributeError) as e:
+            raise RangeParseError(f"openpyxl WorkSheetParser changed: {e}") from e
+
+
+class SheetIndex:
+    """Row ranges of one worksheet and what a worker needs to parse them."""
+
+    def __init__(
+        self,
+        member: str,
+        head: bytes,
+        tail: bytes,
+        ranges: List[Tuple[int, int, int]],
+        shared_strings: List[Any],
+        epoch: datetime,
+        date_formats: set,
+        timedelta_formats: set,
+    ):
+        """Initialize the index.
+
+        Args:
+            member: Path of the worksheet XML inside the zip
+            head: XML up to and including the ``<sheetData>`` start tag
+            tail: Closing ``</sheetData>`` and root tags
+            ranges: (start offset, end offset, first row number) per range
+            shared_strings: Shared-strings table of the workbook
+            epoch: Date system of the workbook
+            date_formats: Style ids formatted as dates
+            timedelta_formats: Style ids formatted as durations
+        """
+        self.member = member
+        self.head = head
+        self.tail = tail
+        self.ranges = ranges
+        self.shared_strings = shared_strings
+        self.epoch = epoch
+        self.date_formats = date_formats
+        self.timedelta_formats = timedelta_formats
+
+
+def index_sheet(
+    source: Source, sheet_name: Optional[str] = None, parts: int = 2
+) -> Optional[SheetIndex]:
+    """Split a worksheet of an .xlsx file into row ranges of similar size.
+
+    Args:
+        source: Path to the workbook or its content
+        sheet_name: Sheet to index (defaults to the first sheet)
+        parts: Number of ranges to aim for
+
+    Returns:
+        SheetIndex, or None if the sheet cannot be split (no rows, row tags
+        without row numbers, or openpyxl internals missing); it should then
+        be parsed serially
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(
+        as_file_like(source), read_only=True, data_only=True, keep_links=False
+    )
+    try:
+        if isinstance(sheet_name, str):
+            worksheet = workbook[sheet_name]
+        else:
+            worksheet = workbook.worksheets[sheet_name or 0]
+        internals = OpenpyxlInternals.load(workbook, worksheet)
+        shared_strings = list(workbook.shared_strings)
+        epoch = workbook.epoch
+    finally:
+        workbook.close()
+    if internals is None:
+        logger.warning(
+            "openpyxl internals for row ranges are missing; parsing serially"
+        )
+        return None
+    member = internals.member
+
+    with zipfile.ZipFile(as_file_like(source)) as archive:
+        size = archive.getinfo(member).file_size
+        with archive.open(member) as stream:
+            layout = _scan_rows(stream, size, parts)
+    if layout is None:
+        return None
+    head, tail, splits, data_end = layout
+
+    numbers = [number for _, number in splits]
+    if numbers != sorted(set(numbers)):
+        return None  # Rows out of order
+    ranges = []
+    for (start, first_row), (end, _) in zip(splits, splits[1:] + [(data_end, 0)]):
+        ranges.append((start, end, first_row))
+    # Rows missing before the first row tag are read as empty rows
+    ranges[0] = (ranges[0][0], ranges[0][1], 1)
+    return SheetIndex(
+        member,
+        head,
+        tail,
+        ranges,
+        shared_strings,
+        epoch,
+        internals.date_formats,
+        internals.timedelta_formats,
+    )
+
+
+def _scan_rows(stream, size: int, parts: int):
+    """Find the XML head and tail and the row tags to split at.
+
+    Returns:
+        Tuple of (head, tail, [(offset, row number)], end of the rows), or
+        None if the sheet has no rows or a split row has no number
+    """
+    head = b""
+    data_start = None
+    data_end = None
+    splits: List[Tuple[int, int]] = []
+    window, window_start = b"", 0
+    target = None
+
+    while True:
+        block = stream.read(SCAN_BLOCK_BYTES)
+        if not block:
+            break
+        window += block
+
+        if data_start is None:
+            match = SHEET_DATA_START.search(window)
+            if match is None:
+                if len(window) > MAX_HEAD_BYTES:
+                    return None
+                continue
+            if match.group().endswith(b"/>"):
+                return None
+            head = window[: match.end()]
+            data_start = match.end()
+            # Aim for ranges of equal size between here and the end
+            step = max(1, (size - data_start) // max(1, parts))
+            target = data_start
+
+        while target is not None:
+            match = ROW_TAG.search(window, max(0, target - window_start))
+            if match is None:
+                break
+            number = ROW_NUMBER.search(match.group())
+            if number is None:
+                return None
+            offset = window_start + match.start()
+            splits.append((offset, int(number.group(1))))
+            target = offset + step if len(splits) < parts else None
+
+        for match in SHEET_DATA_END.finditer(window):
+            data_end = window_start + match.start()
+            close_tag = match.group()
+
+        keep = min(len(window), SCAN_OVERLAP_BYTES)
+        window_start += len(window) - keep
+        window = window[len(window) - keep :]
+
+    if not splits or data_end is None:
+        return None
+    splits = [split for split in splits if split[0] < data_end]
+    root = ROOT_TAG.search(head)
+    tail = close_tag + b"</" + root.group(1) + b">"
+    return head, tail, splits, data_end
+
+
+def convert_cell(value: Any, data_type: str) -> Any:
+    """Convert a parsed cell like pandas' openpyxl reader (``_convert_cell``)."""
+    if value is None:
+        return ""
+    if data_type == "e":
+        return np.nan
+    if data_type == "n":
+        integer = int(value)
+        if integer == value:
+            return integer
+        return float(value)
+    return value
+
+
+def value_kind(value: Any) -> str:
+    """Classify a converted cell by how it affects pandas' dtype inference."""
+    if isinstance(value, str):
+        if value in NA_VALUES:
+            return "missing"
+        if INT_TEXT.fullmatch(value):
+            return "int text"
+        if FLOAT_TEXT.fullmatch(value):
+            return "float text"
+        if value.lower() in ("true", "false"):
+            return f"bool text {value}"
+        return "text"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "nan" if value != value else "float"
+    if isinstance(value, (datetime, date, time, timedelta)):
+        return type(value).__name__
+    return f"other {type(value).__name__}"
+
+
+def _magnitude(value: Any) -> int:
+    return int(value) if isinstance(value, int) else int(value.strip())
+
+
+def _add_samples(samples: Dict[str, list], value: Any) -> None:
+    """Keep the first value of each kind, and the extremes of integers."""
+    kind = value_kind(value)
+    kept = samples.get(kind)
+    if kept is None:
+        samples[kind] = [value, value] if kind in ("int", "int text") else [value]
+    elif kind in ("int", "int text"):
+        if _magnitude(value) < _magnitude(kept[0]):
+            kept[0] = value
+        elif _magnitude(value) > _magnitude(kept[1]):
+            kept[1] = value
+
+
+def init_range_worker(index: SheetIndex, source: Source) -> None:
+    """Set up a range worker process with the sheet index and workbook."""
+    _worker_state["index"] = index
+    _worker_state["source"] = source
+
+
+def _read_range_rows(start: int, end: int, first_row: int, next_row: Optional[int]):
+    """Parse one range into rows of converted cell values.
+
+    Mirrors openpyxl's read-only row iteration: rows missing from the XML
+    become empty rows, and each row is as wide as its last cell.
+
+    Raises:
+        RangeParseError: If openpyxl's parser is missing or changed
+    """
+    index: SheetIndex = _worker_state["index"]
+    with zipfile.ZipFile(as_file_like(_worker_state["source"])) as archive:
+        with archive.open(index.member) as stream:
+            stream.seek(start)
+            body = stream.read(end - start)
+
+    parsed = OpenpyxlInternals.parse_rows(
+        index.head + body + index.tail,
+        index.shared_strings,
+        index.epoch,
+        index.date_formats,
+        index.timedelta_formats,
+    )
+    rows: List[list] = []
+    counter = first_row
+    for number, cells in parsed:
+        for _ in range(counter, number):
+            counter += 1
+            rows.append([])
+        if counter <= number:
+            counter += 1
+            row = []
+            if cells:
+                width = cells[-1]["column"]
+                row = [""] * width
+                for cell in cells:
+                    if 1 <= cell["column"] <= width:
+                        row[cell["column"] - 1] = convert_cell(
+                            cell["value"], cell["data_type"]
+                        )
+            # Trailing empty cells are dropped, as pandas does
+            while row and isinstance(row[-1], str) and not row[-1]:
+                row.pop()
+            rows.append(row)
+    if next_row is not None:
+        rows.extend([] for _ in range(counter, next_row))
+    return rows
+
+
+def parse_range(
+    number: int,
+    start: int,
+    end: int,
+    first_row: int,
+    next_row: Optional[int],
+    spool_dir: str,
+) -> Dict[str, Any]:
+    """First pass over a range: parse it, spool its rows and summarize them.
+
+    The first row of the sheet is the header and is left out of the samples.
+    """
+    rows = _read_range_rows(start, end, first_row, next_row)
+    with open(os.path.join(spool_dir, f"{number}.pickle"), "wb") as f:
+        pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    data_rows = rows[1:] if number == 0 else rows
+    last = max((i for i, row in enumerate(rows) if row), default=-1)
+    samples: List[Dict[str, list]] = []
+    min_width = None
+    for position, row in enumerate(data_rows):
+        if (position + (number == 0)) <= last:
+            min_width = len(row) if min_width is None else min(min_width, len(row))
+        while len(samples) < len(row):
+            samples.append({})
+        for column, value in enumerate(row):
+            _add_samples(samples[column], value)
+    return {
+        "rows": len(rows),
+        "last": last,
+        "width": max(map(len, rows), default=0),
+        "min_width": min_width,
+        "trailing_empty": len(rows) - 1 - last,
+        "header": rows[0] if number == 0 and rows else None,
+        "samples": samples,
+    }
+
+
+def plan_ranges(summaries: Sequence[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Combine first-pass summaries into what every range needs to parse.
+
+    Args:
+        summaries: Results of the first pass, in range order
+
+    Returns:
+        Dictionary with the padded ``header``, the sheet ``width``, the
+        ``samples`` rows appended to every range, and per range the number
+        of rows to ``keep`` and the row ``offsets``; None if the sheet has no
+        data rows
+    """
+    last_range = max(
+        (i for i, summary in enumerate(summaries) if summary["last"] >= 0),
+        default=-1,
+    )
+    if last_range < 0 or summaries[0]["header"] is None:
+        return None
+
+    width = max(summary["width"] for summary in summaries)
+    keep = [
+        summary["rows"] if i < last_range else summary["last"] + 1
+        for i, summary in enumerate(summaries[: last_range + 1])
+    ]
+    keep += [0] * (len(summaries) - len(keep))
+    data_rows = sum(keep) - 1
+    if data_rows <= 0:
+        return None
+
+    # Rows shorter than the sheet are padded with "", i.e. missing values
+    min_width = width
+    for i, summary in enumerate(summaries[: last_range + 1]):
+        interior_empty = i < last_range and summary["trailing_empty"] > 0
+        if interior_empty:
+            min_width = 0
+        elif summary["min_width"] is not None:
+            min_width = min(min_width, summary["min_width"])
+
+    columns: List[List[Any]] = []
+    for column in range(width):
+        merged: Dict[str, list] = {}
+        for summary in summaries[: last_range + 1]:
+            if column < len(summary["samples"]):
+                for value in summary["samples"][column].values():
+                    for sample in value:
+                        _add_samples(merged, sample)
+        values = [sample for kept in merged.values() for sample in kept]
+        if column >= min_width or not values:
+            values.append("")
+        columns.append(values)
+    depth = max(map(len, columns))
+    samples = [
+        [values[min(i, len(values) - 1)] for values in columns] for i in range(depth)
+    ]
+
+    header = list(summaries[0]["header"])
+    offsets, offset = [], 0
+    for i, count in enumerate(keep):
+        offsets.append(offset)
+        offset += count - 1 if i == 0 else count
+    return {
+        "header": header + [""] * (width - len(header)),
+        "width": width,
+        "samples": samples,
+        "keep": keep,
+        "offsets": offsets,
+    }
+
+
+def read_range_frame(number: int, spool_dir: str, plan: Dict[str, Any]) -> pd.DataFrame:
+    """Second pass over a range: build its DataFrame with the sheet's dtypes.
+
+    Args:
+        number: Range number
+        spool_dir: Directory holding the first pass's rows
+        plan: Result of ``plan_ranges``
+
+    Returns:
+        DataFrame of the range's data rows, indexed by row position in the
+        sheet
+    """
+    path = os.path.join(spool_dir, f"{number}.pickle")
+    with open(path, "rb") as f:
+        rows = pickle.load(f)  # nosec B301: written by parse_range
+    os.remove(path)
+
+    rows = rows[1 : plan["keep"][0]] if number == 0 else rows[: plan["keep"][number]]
+    width = plan["width"]
+    data = [plan["header"]]
+    data.extend(row + [""] * (width - len(row)) for row in rows)
+    data.extend(plan["samples"])
+    df = TextParser(data, **PARSE_OPTIONS).read()
+    df = df.iloc[: len(rows)]
+    df.index = pd.RangeIndex(
+        plan["offsets"][number], plan["offsets"][number] + len(rows)
+    )
+    return df
@@ -0,0 +1,168 @@
+"""Bulk loads of bronze rows through a stage (PUT + a single COPY INTO)."""
+import os
+import tempfile
+import uuid
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from excel_to_bronze.connectors.stage import Stage, get_stage, write_stage_file
+from excel_to_bronze.utils.logging import setup_logging
+from excel_to_bronze.utils.metrics import metrics
+
+logger = setup_logging()
+
+# Load methods writing through a stage rather than batched INSERTs
+STAGE_LOAD_METHODS = ("copy", "arrow")
+
+
+class StageLoader:
+    """Writes batches to local files, stages them and loads them at once."""
+
+    def __init__(
+        self,
+        stage: Stage,
+        bronze_table: str,
+        batch_size: int,
+        file_format: str = "ndjson",
+    ):
+        """Initialize the loader.
+
+        Args:
+            stage: Stage the files are uploaded to
+            bronze_table: Table the staged files are copied into
+            batch_size: Rows per file written by ``load_frame``
+            file_format: Stage file format of prepared rows (``ndjson`` or
+                ``parquet``)
+        """
+        self.stage = stage
+        self.bronze_table = bronze_table
+        self.batch_size = batch_size
+        self.file_format = file_format
+
+    def load_rows(
+        self, batches: Iterable[Tuple[int, List[Tuple]]], filename: str
+    ) -> int:
+        """Bulk-load prepared rows with PUT + a single COPY INTO.
+
+        Each batch is written to a compressed file in a temporary directory
+        and uploaded as soon as it is prepared, so only one batch of rows is
+        held in memory; the staged files are then loaded together.
+
+        Args:
+            batches: Iterable of (batch number, rows) with rows as tuples of
+                (id, filename, raw_data) from prepare_data
+            filename: Original filename, used for logging
+
+        Returns:
+            Number of rows loaded
+        """
+
+        def write_files(tmp_dir: str, load_id: str) -> Iterator[str]:
+            for batch_number, batch in batches:
+                if batch:
+                    yield write_stage_file(
+                        batch,
+                        os.path.join(tmp_dir, f"{load_id}_{batch_number - 1:05d}"),
+                        self.file_format,
+                    )
+
+        return self.copy(write_files, self.file_format, filename)
+
+    def load_frame(
+        self, df: pd.DataFrame, filename: str, sheet_name: Optional[str] = None
+    ) -> int:
+        """Bulk-load a DataFrame as typed Parquet, without building JSON strings.
+
+        Each batch is converted to an Arrow table (see ``dataframe_to_arrow``)
+        and written as dictionary-encoded Parquet; COPY INTO turns the typed
+        data struct into the ``raw_data`` JSON on the server, the way
+        ``write_pandas`` stages Parquet and copies it.
+
+        Args:
+            df: DataFrame to load (index holds the row ids)
+            filename: Original filename to store
+            sheet_name: Sheet name to record in the metadata
+
+        Returns:
+            Number of rows loaded
+        """
+        if df.empty:
+            return 0
+        # Imports pyarrow, which only the arrow load method needs
+        from excel_to_bronze.ingestion.arrow import write_arrow_files
+
+        extra_metadata = {"sheet_name": sheet_name} if sheet_name is not None else None
+
+        def write_files(tmp_dir: str, load_id: str) -> Iterator[str]:
+            return write_arrow_files(
+                df, filename, tmp_dir, load_id, self.batch_size, extra_metadata
+            )
+
+        return self.copy(write_files, "arrow", filename)
+
+    def copy(
+        self,
+        write_files: Callable[[str, str], Iterator[str]],
+        file_format: str,
+        filename: str,
+    ) -> int:
+        """Upload locally written files to the stage and COPY them in at once.
+
+        Args:
+            write_files: Called with (temporary directory, load id); yields
+                the paths of the files it wrote there
+            file_format: Stage file format of the files
+            filename: Original filename, used for logging
+
+        Returns:
+            Number of rows loaded
+        """
+        load_id = uuid.uuid4().hex
+        staged: List[str] = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                for file_path in write_files(tmp_dir, load_id):
+                    metrics.increment("bytes_sent_total", os.path.getsize(file_path))
+                    staged.append(self.stage.put(file_path))
+                    os.remove(file_path)
+                    logger.info(f"Staged {file_path} for {filename}")
+                if not staged:
+                    return 0
+
+                with metrics.timer("copy_into_seconds"):
+                    loaded = self.stage.copy_into(
+                        self.bronze_table, staged, file_format
+                    )
+            finally:
+                if staged:
+                    self.stage.remove(staged)
+
+        metrics.increment("rows_written_total", loaded)
+        logger.info(f"Copied {loaded} rows from {len(staged)} staged files")
+        return loaded
+
+
+def create_stage_loader(
+    settings: Dict, connector, bronze_table: str, batch_size: int
+) -> Optional[StageLoader]:
+    """Create the stage loader used by the ``copy`` and ``arrow`` load methods.
+
+    Args:
+        settings: Application configuration dictionary
+        connector: Connector used by a Snowflake stage
+        bronze_table: Table the staged files are copied into
+        batch_size: Rows per file written from a DataFrame
+
+    Returns:
+        StageLoader, or None when rows are inserted in batches instead
+    """
+    if settings["load_method"] not in STAGE_LOAD_METHODS:
+        return None
+    stage = get_stage(
+        connector,
+        bronze_table,
+        stage_name=settings["stage_name"],
+        local_dir=settings["local_stage_dir"],
+    )
+    return StageLoader(stage, bronze_table, batch_size, settings["stage_file_format"])
@@ -0,0 +1,324 @@
+"""CSV and Parquet ingestion processors reading with multithreaded pyarrow readers."""
+import os
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+import pandas as pd
+
+from excel_to_bronze.config import config
+from excel_to_bronze.ingestion.base import (
+    DataIngestionError,
+    Source,
+    as_file_like,
+    describe_source,
+    ingestor_class,
+    register_ingestor,
+)
+from excel_to_bronze.ingestion.bronze import PREVIEW_ROWS, BronzeIngestor
+from excel_to_bronze.utils.logging import setup_logging
+from excel_to_bronze.utils.metrics import metrics
+
+# pyarrow's CSV and Parquet modules are imported on first read, so that
+# importing the registry (e.g. by the pipeline or the app) stays cheap
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = setup_logging()
+
+# Bytes of CSV parsed per block; streamed files infer column types from the
+# first block
+CSV_BLOCK_BYTES = 16 * 1024 * 1024
+
+# Field delimiter by extension, unless ``csv_delimiter`` is set
+CSV_DELIMITERS = {".csv": ",", ".tsv": "\t"}
+
+# Rows per record batch when streaming Parquet
+PARQUET_BATCH_ROWS = 65536
+
+
+def rechunk(
+    batches: "Iterator[pa.RecordBatch]", chunk_size: int
+) -> "Iterator[pa.Table]":
+    """Regroup record batches into tables of exactly ``chunk_size`` rows.
+
+    Only the last table may be shorter. Slicing does not copy the data.
+
+    Args:
+        batches: Record batches of any size
+        chunk_size: Rows per table
+
+    Yields:
+        Arrow tables
+    """
+    import pyarrow as pa
+
+    pending, rows, schema = [], 0, None
+    for batch in batches:
+        schema = batch.schema
+        pending.append(batch)
+        rows += batch.num_rows
+        while rows >= chunk_size:
+            table = pa.Table.from_batches(pending, schema)
+            yield table.slice(0, chunk_size)
+            rest = table.slice(chunk_size)
+            pending, rows = rest.to_batches(), rest.num_rows
+    if rows:
+        yield pa.Table.from_batches(pending, schema)
+
+
+class TabularIngestor(BronzeIngestor):
+    """Base for single-table formats read with pyarrow into the bronze write path.
+
+    Subclasses implement ``read_table`` and ``open_batches``, which receive
+    the keyword arguments from ``read_options``; reading whole files,
+    streaming chunks and previews build on them. Everything after the
+    read (contracts, incremental mode, batching, checkpoints, bulk loads)
+    comes from BronzeIngestor, as for ExcelIngestor.
+    """
+
+    # Format name used in logs, errors and the ``read_seconds`` metric
+    format_name = "tabular"
+
+    def read_options(self, _filename: str) -> Dict[str, Any]:
+        """Get reader options for a file; none by default.
+
+        Args:
+            _filename: Original filename
+
+        Returns:
+            Keyword arguments for ``read_table`` and ``open_batches``
+        """
+        return {}
+
+    @abstractmethod
+    def read_table(self, source: Source, **options) -> "pa.Table":
+        """Read a whole file into an Arrow table.
+
+        Args:
+            source: File path or rewound file-like object
+            **options: Reader options from ``read_options``
+
+        Returns:
+            Arrow table
+        """
+        pass
+
+    @abstractmethod
+    def open_batches(self, source: Source, **options) -> "Iterator[pa.RecordBatch]":
+        """Read a file as a stream of record batches in constant memory.
+
+        Args:
+            source: File path or rewound file-like object
+            **options: Reader options from ``read_options``
+
+        Yields:
+            Record batches in file order
+        """
+        pass
+
+    def to_frame(self, table: "pa.Table", offset: int = 0) -> pd.DataFrame:
+        """Convert an Arrow table to a DataFrame indexed by row position.
+
+        An index written by pandas as columns becomes a regular column again
+        and range indexes are dropped, so row ids are always positions in the
+        file.
+
+        Args:
+            table: Arrow table
+            offset: Position of the table's first row in the file
+
+        Returns:
+            DataFrame with a RangeIndex starting at ``offset``
+        """
+        df = table.to_pandas(split_blocks=True)
+        if not isinstance(df.index, pd.RangeIndex):
+            df = df.reset_index()
+        df.index = pd.RangeIndex(offset, offset + len(df))
+        return df
+
+    def read_file(self, file_path: Source, **kwargs) -> pd.DataFrame:
+        """Read a file into a DataFrame using all cores.
+
+        Args:
+            file_path: Path to the file, or its content as bytes, memoryview
+                or a file-like object
+            **kwargs: Processing arguments; only ``original_filename`` is used
+
+        Returns:
+            DataFrame with the file's rows
+        """
+        name = kwargs.get("original_filename") or describe_source(file_path)
+        try:
+            with metrics.timer("read_seconds", backend=self.format_name):
+                table = self.read_table(
+                    as_file_like(file_path), **self.read_options(name)
+                )
+                df = self.to_frame(table)
+            metrics.increment("rows_read_total", len(df))
+            logger.info(f"Read {len(df)} rows from {name} with pyarrow")
+            return self.compact_frame(df)
+        except Exception as e:
+            logger.error(f"Failed to read {self.format_name} file {name}: {e}")
+            raise DataIngestionError(
+                f"{self.format_name} file read error: {str(e)}"
+            ) from e
+
+    def read_chunks(
+        self, file_path: str, chunk_size: int, **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """Stream a file as DataFrame chunks of exactly ``chunk_size`` rows.
+
+        Args:
+            file_path: Path to the file
+            chunk_size: Maximum number of rows per chunk
+            **kwargs: Processing arguments; only ``original_filename`` is used
+
+        Yields:
+            DataFrame chunks whose index continues across chunks
+        """
+        name = kwargs.get("original_filename") or describe_source(file_path)
+        try:
+            offset = 0
+            batches = self.open_batches(
+                as_file_like(file_path), **self.read_options(name)
+            )
+            for table in rechunk(batches, chunk_size):
+                chunk = self.to_frame(table, offset)
+                offset += len(chunk)
+                metrics.increment("rows_read_total", len(chunk))
+                yield self.compact_frame(chunk)
+        except Exception as e:
+            logger.error(f"Failed to read {self.format_name} file {name}: {e}")
+            raise DataIngestionError(
+                f"{self.format_name} file read error: {str(e)}"
+            ) from e
+
+    def preview(
+        self,
+        file_path: Source,
+        original_filename: Optional[str] = None,
+        nrows: int = PREVIEW_ROWS,
+    ) -> pd.DataFrame:
+        """Read only the first rows of a file, e.g. to display an upload.
+
+        Args:
+            file_path: Path to the file or its in-memory content
+            original_filename: Original filename (required for in-memory
+                content of formats that depend on the extension)
+            nrows: Number of data rows to read
+
+        Returns:
+            DataFrame with at most ``nrows`` rows
+        """
+        source = as_file_like(file_path)
+        try:
+            name = original_filename or describe_source(file_path)
+            batches = self.open_batches(source, **self.read_options(name))
+            return self.to_frame(next(rechunk(batches, nrows)))
+        except StopIteration:
+            return pd.DataFrame()
+        except Exception as e:
+            raise DataIngestionError(
+                f"{self.format_name} file read error: {str(e)}"
+            ) from e
+        finally:
+            as_file_like(source)
+
+
+@register_ingestor
+class CSVIngestor(TabularIngestor):
+    """CSV and TSV ingestion processor using pyarrow's multithreaded CSV reader.
+
+    Empty fields are read as nulls, as pandas does. The delimiter follows
+    the extension unless ``csv_delimiter`` is set.
+    """
+
+    extensions = (".csv", ".tsv")
+    format_name = "CSV"
+
+    def __init__(self, connector=None):
+        """Initialize the CSV ingestion processor.
+
+        Args:
+            connector: Connector used for writes (defaults to the shared
+                SnowflakeConnector)
+        """
+        super().__init__(connector)
+        app_config = config.get_application_config()
+        self.delimiter = app_config["csv_delimiter"]
+        self.encoding = app_config["csv_encoding"]
+
+    def read_options(self, filename: str) -> Dict[str, Any]:
+        """Build the pyarrow read, parse and convert options for a file.
+
+        Args:
+            filename: Original filename, whose extension picks the delimiter
+
+        Returns:
+            Keyword arguments for ``pyarrow.csv.read_csv``/``open_csv``
+        """
+        import pyarrow.csv as pa_csv
+
+        delimiter = self.delimiter or CSV_DELIMITERS.get(
+            os.path.splitext(filename)[1].lower(), ","
+        )
+        return {
+            "read_options": pa_csv.ReadOptions(
+                use_threads=True, block_size=CSV_BLOCK_BYTES, encoding=self.encoding
+            ),
+            "parse_options": pa_csv.ParseOptions(delimiter=delimiter),
+            "convert_options": pa_csv.ConvertOptions(strings_can_be_null=True),
+        }
+
+    def read_table(self, source: Source, **options) -> "pa.Table":
+        """Read a whole CSV file, parsing blocks on all cores."""
+        import pyarrow.csv as pa_csv
+
+        return pa_csv.read_csv(source, **options)
+
+    def open_batches(self, source: Source, **options) -> "Iterator[pa.RecordBatch]":
+        """Stream a CSV file block by block."""
+        import pyarrow.csv as pa_csv
+
+        with pa_csv.open_csv(source, **options) as reader:
+            yield from reader
+
+
+@register_ingestor
+class ParquetIngestor(TabularIngestor):
+    """Parquet ingestion processor reading row groups with pyarrow."""
+
+    extensions = (".parquet",)
+    format_name = "Parquet"
+
+    def read_table(self, source: Source, **options) -> "pa.Table":
+        """Read a whole Parquet file, decoding columns on all cores."""
+        import pyarrow.parquet as pq
+
+        return pq.read_table(source, use_threads=True, **options)
+
+    def open_batches(self, source: Source, **options) -> "Iterator[pa.RecordBatch]":
+        """Stream a Parquet file row group by row group."""
+        import pyarrow.parquet as pq
+
+        with pq.ParquetFile(source, **options) as parquet_file:
+            yield from parquet_file.iter_batches(
+                batch_size=PARQUET_BATCH_ROWS, use_threads=True
+            )
+
+
+def create_ingestor(filename: str, connector=None) -> BronzeIngestor:
+    """Create the ingestor registered for a file's extension.
+
+    Args:
+        filename: File path, original filename or extension
+        connector: Connector used for writes (defaults to the shared
+            SnowflakeConnector)
+
+    Returns:
+        ExcelIngestor, CSVIngestor or ParquetIngestor
+
+    Raises:
+        DataIngestionError: If no ingestor handles the extension
+    """
+    return ingestor_class(filename)(connector)
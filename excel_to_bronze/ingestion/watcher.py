@@ -0,0 +1,343 @@
+"""Long-running watcher ingesting files dropped into directories."""
+import importlib.util
+import os
+import queue
+import signal
+import threading
+import time
+import zipfile
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from excel_to_bronze.config import config
+from excel_to_bronze.ingestion.jobs import Job, JobManager
+from excel_to_bronze.ingestion.pipeline import DEFAULT_EXTENSIONS
+from excel_to_bronze.ingestion.readers import SheetSelection
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+WATCH_BACKENDS = ("auto", "watchdog", "polling")
+
+# With watchdog, directories are still rescanned this often to catch events
+# lost e.g. on network shares
+RESCAN_SECONDS = 60.0
+
+# Bytes closing every complete Parquet file
+PARQUET_MAGIC = b"PAR1"
+
+# (size, modification time in ns) of a file
+Signature = Tuple[int, int]
+
+
+def file_signature(path: str) -> Optional[Signature]:
+    """Get a file's size and modification time, or None if it is gone."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def is_complete(path: str) -> bool:
+    """Check that a settled file can be read and, for .xlsx and .parquet, is whole.
+
+    A partially copied .xlsx lacks the zip directory at its end and a partial
+    .parquet its closing magic bytes, which catches writers that pause longer
+    than the settle time.
+    """
+    try:
+        with open(path, "rb") as f:
+            f.read(1)
+            if path.lower().endswith(".parquet"):
+                f.seek(-len(PARQUET_MAGIC), os.SEEK_END)
+                return f.read() == PARQUET_MAGIC
+    except OSError:
+        return False
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        return zipfile.is_zipfile(path)
+    return True
+
+
+class DirectoryWatcher:
+    """Ingests Excel, CSV and Parquet files as they appear in directories.
+
+    Changes are picked up with watchdog (inotify, FSEvents, ...) when it is
+    installed, otherwise by polling. A file is ingested once its size and
+    modification time have not changed for ``settle_seconds`` and it is a
+    complete workbook, so files still being copied are left alone. Ready
+    files go through a bounded queue to a JobManager, whose worker processes
+    keep warm ingestors and pooled Snowflake connections; at most
+    ``workers`` files are ingested at once and scanning pauses while the
+    queue is full. Files are ingested again when they change; unchanged
+    content is skipped by the ingestion ledger.
+    """
+
+    def __init__(
+        self,
+        directories: Iterable[str],
+        workers: Optional[int] = None,
+        max_writers: Optional[int] = None,
+        settle_seconds: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+        queue_size: Optional[int] = None,
+        backend: Optional[str] = None,
+        recursive: bool = False,
+        streaming: Optional[bool] = None,
+        force: bool = False,
+        sheets: Optional[SheetSelection] = None,
+        on_result: Optional[Callable[[Job], None]] = None,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            directories: Directories to watch
+            workers: Files ingested in parallel (defaults to
+                ``pipeline_workers``)
+            max_writers: Total Snowflake connections across workers (defaults
+                to ``max_writers``)
+            settle_seconds: Time a file must stay unchanged before it is
+                ingested (defaults to ``watch_settle_seconds``)
+            poll_interval: Seconds between checks (defaults to
+                ``watch_poll_interval``)
+            queue_size: Ready files waiting for a worker (defaults to
+                ``watch_queue_size``)
+            backend: ``auto``, ``watchdog`` or ``polling`` (defaults to
+                ``watch_backend``)
+            recursive: Also watch subdirectories
+            streaming: Read files in constant memory (see ExcelIngestor)
+            force: Ingest even if the ledger shows the content was already loaded
+            sheets: Sheets to ingest from every workbook
+            on_result: Called with each finished job
+        """
+        app_config = config.get_application_config()
+        self.directories = [os.path.abspath(path) for path in directories]
+        for directory in self.directories:
+            if not os.path.isdir(directory):
+                raise ValueError(f"Not a directory: {directory}")
+        self.workers = max(1, workers or app_config["pipeline_workers"])
+        self.max_writers = max_writers
+        self.settle_seconds = (
+            app_config["watch_settle_seconds"]
+            if settle_seconds is None
+            else settle_seconds
+        )
+        self.poll_interval = poll_interval or app_config["watch_poll_interval"]
+        self.backend = backend or app_config["watch_backend"]
+        if self.backend not in WATCH_BACKENDS:
+            raise ValueError(
+                f"Unknown watch backend: {self.backend}. "
+                f"Choose from {', '.join(WATCH_BACKENDS)}"
+            )
+        self.recursive = recursive
+        self.streaming = streaming
+        self.force = force
+        self.sheets = sheets
+        self.on_result = on_result
+        self.extensions = DEFAULT_EXTENSIONS
+
+        # Files seen changing: signature and when it last changed
+        self.pending: Dict[str, Tuple[Signature, float]] = {}
+        # Signature of every file at the time it was queued
+        self.queued: Dict[str, Signature] = {}
+        self.queue: "queue.Queue[Optional[str]]" = queue.Queue(
+            maxsize=queue_size or app_config["watch_queue_size"]
+        )
+        self.stopping = threading.Event()
+        self.aborting = threading.Event()
+        self.manager: Optional[JobManager] = None
+        self._slots = threading.Semaphore(self.workers)
+        self._lock = threading.Lock()
+
+    def is_candidate(self, path: str) -> bool:
+        """Whether a path looks like a workbook to ingest."""
+        name = os.path.basename(path)
+        return name.lower().endswith(self.extensions) and not name.startswith(
+            ("~$", ".")
+        )  # Excel lock and hidden files
+
+    def notice(self, path: str) -> None:
+        """Record that a file may have changed; it is queued once it settles.
+
+        Args:
+            path: Path of the file
+        """
+        if not self.is_candidate(path):
+            return
+        signature = file_signature(path)
+        if signature is None:
+            return
+        with self._lock:
+            if self.queued.get(path) == signature:
+                return
+            previous = self.pending.get(path)
+            if previous is None or previous[0] != signature:
+                self.pending[path] = (signature, time.monotonic())
+
+    def scan(self) -> None:
+        """Notice every candidate file in the watched directories."""
+        for directory in self.directories:
+            for root, dirs, files in os.walk(directory):
+                for name in files:
+                    self.notice(os.path.join(root, name))
+                if not self.recursive:
+                    break
+                dirs[:] = [name for name in dirs if not name.startswith(".")]
+
+    def tick(self) -> None:
+        """Queue the pending files that have settled, while the queue has room."""
+        now = time.monotonic()
+        with self._lock:
+            candidates = list(self.pending.items())
+
+        for path, (signature, changed_at) in candidates:
+            current = file_signature(path)
+            if current is None:
+                with self._lock:
+                    self.pending.pop(path, None)
+                continue
+            if current != signature:
+                with self._lock:
+                    self.pending[path] = (current, now)
+                continue
+            if now - changed_at < self.settle_seconds or not is_complete(path):
+                continue
+            try:
+                self.queue.put_nowait(path)
+            except queue.Full:
+                logger.debug("Work queue is full; holding back settled files")
+                return
+            with self._lock:
+                self.pending.pop(path, None)
+                self.queued[path] = signature
+            logger.info(f"Queued {path}")
+
+    def dispatch(self) -> None:
+        """Submit queued files to the job manager, one per free worker."""
+        while True:
+            path = self.queue.get()
+            if path is None or self.aborting.is_set():
+                return
+            self._slots.acquire()
+            if self.aborting.is_set():
+                return
+            self.manager.submit(
+                path, streaming=self.streaming, force=self.force, sheets=self.sheets
+            )
+
+    def _finished(self, job: Job) -> None:
+        """Free a worker slot and report a finished job."""
+        self._slots.release()
+        if job.error:
+            logger.error(f"Failed to ingest {job.file_path}: {job.error}")
+        else:
+            logger.info(f"Ingested {job.file_path}: {job.rows} rows")
+        if self.on_result:
+            self.on_result(job)
+        self.manager.forget(job.job_id)
+
+    def start_observer(self):
+        """Start a watchdog observer, or return None to poll instead."""
+        if self.backend == "polling":
+            return None
+        if importlib.util.find_spec("watchdog") is None:
+            if self.backend == "watchdog":
+                raise ValueError("The watchdog backend requires the watchdog package")
+            logger.info("watchdog is not installed; polling for changes")
+            return None
+
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if not event.is_directory:
+                    # Moves report the new path, e.g. for files renamed after copying
+                    watcher.notice(getattr(event, "dest_path", "") or event.src_path)
+
+        observer = Observer()
+        for directory in self.directories:
+            observer.schedule(Handler(), directory, recursive=self.recursive)
+        observer.start()
+        return observer
+
+    def stop(self, drain: bool = True) -> None:
+        """Stop watching; queued files are ingested first unless ``drain`` is False.
+
+        Files that are being ingested always finish.
+
+        Args:
+            drain: Ingest the files already queued before exiting
+        """
+        self.stopping.set()
+        if drain:
+            return
+        self.aborting.set()
+        with self._lock:
+            self.queued.clear()
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+        if self.manager is not None:
+            cancelled = self.manager.cancel_queued()
+            logger.info(f"Cancelled {cancelled} queued files")
+        self._slots.release()  # Wake the dispatcher if it waits for a worker
+
+    def install_signal_handlers(self) -> None:
+        """Stop gracefully on SIGINT/SIGTERM, and without draining on a second one."""
+
+        def handle(signum, _frame):
+            if self.stopping.is_set():
+                logger.warning("Stopping without draining the queue")
+                self.stop(drain=False)
+            else:
+                logger.info(
+                    f"Received {signal.Signals(signum).name}; finishing queued "
+                    "files (repeat to skip them)"
+                )
+                self.stop()
+
+        signal.signal(signal.SIGINT, handle)
+        signal.signal(signal.SIGTERM, handle)
+
+    def run(self) -> None:
+        """Watch until ``stop`` is called, then drain and shut the workers down."""
+        self.manager = JobManager(self.workers, self.max_writers, self._finished)
+        dispatcher = threading.Thread(
+            target=self.dispatch, name="watch-dispatch", daemon=True
+        )
+        dispatcher.start()
+        observer = self.start_observer()
+        logger.info(
+            f"Watching {', '.join(self.directories)} "
+            f"({'watchdog' if observer else 'polling'}, {self.workers} workers)"
+        )
+
+        try:
+            self.scan()
+            last_scan = time.monotonic()
+            while not self.stopping.is_set():
+                rescan = RESCAN_SECONDS if observer else self.poll_interval
+                if time.monotonic() - last_scan >= rescan:
+                    self.scan()
+                    last_scan = time.monotonic()
+                self.tick()
+                self.stopping.wait(self.poll_interval)
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            logger.info(f"Draining {self.queue.qsize()} queued files")
+            self.queue.put(None)
+            dispatcher.join()
+            self.manager.shutdown(wait=not self.aborting.is_set())
+            logger.info("Watcher stopped")
+
+    def status(self) -> Dict[str, List[str]]:
+        """Get the files waiting to settle and those queued for a worker."""
+        with self._lock:
+            pending = sorted(self.pending)
+        return {"pending": pending, "queued": list(self.queue.queue)}
@@ -0,0 +1,306 @@
+"""Metrics for the ingestion pipeline: counters, timers and histograms."""
+import contextlib
+import os
+import socket
+import threading
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+from excel_to_bronze.config import config
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+# Upper bounds of the histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+THROUGHPUT_BUCKETS = (100, 1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000)
+SIZE_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7, 1e8)
+
+_NULL_TIMER = contextlib.nullcontext()
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class _Timer:
+    """Context manager observing its duration in seconds."""
+
+    __slots__ = ("metrics", "name", "labels", "started")
+
+    def __init__(self, metrics: "Metrics", name: str, labels: Dict[str, str]):
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.observe(
+            self.name, time.perf_counter() - self.started, **self.labels
+        )
+
+
+class Metrics:
+    """Metrics sink that discards everything.
+
+    This is the default; subclasses override ``increment`` and ``observe``
+    and set ``enabled``. Callers skip work that only feeds metrics (e.g.
+    measuring payload sizes) when ``enabled`` is False.
+    """
+
+    enabled = False
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        """Add to a counter.
+
+        Args:
+            name: Metric name
+            value: Amount to add
+            **labels: Label values
+        """
+        pass
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Record a value in a histogram.
+
+        Args:
+            name: Metric name
+            value: Observed value
+            **labels: Label values
+        """
+        pass
+
+    def timer(self, name: str, **labels):
+        """Time a block and record its duration in the ``name`` histogram.
+
+        Args:
+            name: Metric name, conventionally ending in ``_seconds``
+            **labels: Label values
+
+        Returns:
+            Context manager
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def file_ingested(self, seconds: float, rows: int) -> None:
+        """Record a successfully ingested file.
+
+        Args:
+            seconds: Time spent on the file
+            rows: Rows read from the file
+        """
+        self.increment("files_ingested_total")
+        self.increment("rows_ingested_total", rows)
+        self.observe("file_seconds", seconds)
+        if seconds > 0:
+            self.observe("rows_per_second", rows / seconds)
+
+    def flush(self) -> None:
+        """Push or write out buffered metrics."""
+        pass
+
+
+class PrometheusMetrics(Metrics):
+    """Aggregates metrics and renders them in Prometheus text format.
+
+    When ``path`` is set, ``flush`` writes the exposition there atomically,
+    for the node_exporter textfile collector. ``{pid}`` in the path is
+    replaced by the process id, so parallel workers write separate files.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        prefix: str = "excel_to_bronze",
+        buckets: Optional[Dict[str, Sequence[float]]] = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            path: File written by ``flush``
+            prefix: Prefix for every metric name
+            buckets: Histogram buckets by metric name (seconds buckets are
+                used for unlisted histograms)
+        """
+        self.path = path
+        self.prefix = prefix
+        self.buckets = {
+            "rows_per_second": THROUGHPUT_BUCKETS,
+            "batch_bytes": SIZE_BUCKETS,
+            **(buckets or {}),
+        }
+        self.counters: Dict[LabelKey, float] = {}
+        self.histograms: Dict[LabelKey, Tuple[list, list]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, labels: Dict) -> LabelKey:
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        """Add to a counter."""
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Record a value in a histogram."""
+        key = self._key(name, labels)
+        bounds = self.buckets.get(name, DEFAULT_BUCKETS)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                # Bucket counts (plus +Inf) and [count, sum]
+                histogram = self.histograms[key] = ([0] * (len(bounds) + 1), [0, 0.0])
+            counts, totals = histogram
+            for i, bound in enumerate(bounds):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            totals[0] += 1
+            totals[1] += value
+
+    @staticmethod
+    def _labels(pairs, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        pairs = tuple(pairs) + extra
+        if not pairs:
+            return ""
+        escaped = (
+            (key, value.replace("\\", "\\\\").replace('"', '\\"'))
+            for key, value in pairs
+        )
+        return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(
+                (key, (list(counts), list(totals)))
+                for key, (counts, totals) in self.histograms.items()
+            )
+
+        declared = set()
+        for (name, labels), value in counters:
+            full_name = f"{self.prefix}_{name}"
+            if full_name not in declared:
+                lines.append(f"# TYPE {full_name} counter")
+                declared.add(full_name)
+            lines.append(f"{full_name}{self._labels(labels)} {value}")
+
+        for (name, labels), (counts, (count, total)) in histograms:
+            full_name = f"{self.prefix}_{name}"
+            if full_name not in declared:
+                lines.append(f"# TYPE {full_name} histogram")
+                declared.add(full_name)
+            bounds = list(self.buckets.get(name, DEFAULT_BUCKETS)) + ["+Inf"]
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                le = self._labels(labels, (("le", str(bound)),))
+                lines.append(f"{full_name}_bucket{le} {cumulative}")
+            lines.append(f"{full_name}_sum{self._labels(labels)} {total}")
+            lines.append(f"{full_name}_count{self._labels(labels)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+    def flush(self) -> None:
+        """Write the exposition to ``path`` if one is configured."""
+        if not self.path:
+            return
+        path = self.path.format(pid=os.getpid())
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+
+class StatsDMetrics(Metrics):
+    """Sends every metric to a StatsD agent over UDP.
+
+    Counters are sent as ``c``, ``_seconds`` histograms as ``ms`` timers and
+    other histograms as ``h``; labels use the DogStatsD tag extension, which
+    the Datadog agent, Telegraf and the OpenTelemetry collector understand.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 8125,
+        prefix: str = "excel_to_bronze",
+    ):
+        """Initialize the client.
+
+        Args:
+            host: StatsD agent host
+            port: StatsD agent UDP port
+            prefix: Prefix for every metric name
+        """
+        self.address = (host, port)
+        self.prefix = prefix
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def _send(self, name: str, value: float, kind: str, labels: Dict) -> None:
+        message = f"{self.prefix}.{name}:{value}|{kind}"
+        if labels:
+            message += "|#" + ",".join(
+                f"{key}:{value}" for key, value in labels.items()
+            )
+        try:
+            self.socket.sendto(message.encode("utf-8"), self.address)
+        except OSError as e:
+            logger.debug(f"Failed to send metric {name}: {e}")
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        """Send a counter increment."""
+        self._send(name, value, "c", labels)
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Send a timer (for ``_seconds`` metrics) or histogram value."""
+        if name.endswith("_seconds"):
+            self._send(name[: -len("_seconds")], round(value * 1000, 3), "ms", labels)
+        else:
+            self._send(name, value, "h", labels)
+
+
+def create_metrics(settings: Optional[Dict] = None) -> Metrics:
+    """Create the metrics sink configured by ``metrics_*`` application settings.
+
+    Args:
+        settings: Application configuration dictionary
+
+    Returns:
+        Metrics instance; the no-op sink unless ``metrics`` is ``prometheus``
+        or ``statsd``
+    """
+    settings = settings or {}
+    backend = (settings.get("metrics") or "none").lower()
+    prefix = settings.get("metrics_prefix") or "excel_to_bronze"
+    if backend == "prometheus":
+        return PrometheusMetrics(settings.get("metrics_path"), prefix=prefix)
+    if backend == "statsd":
+        return StatsDMetrics(
+            settings.get("statsd_host") or "localhost",
+            int(settings.get("statsd_port") or 8125),
+            prefix=prefix,
+        )
+    if backend != "none":
+        logger.warning(f"Unknown metrics backend {backend}; metrics are disabled")
+    return Metrics()
+
+
+# Default instance
+metrics = create_metrics(config.get_application_config())
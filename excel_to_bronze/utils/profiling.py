@@ -0,0 +1,91 @@
+"""Opt-in per-file profiling of ingestion runs."""
+import os
+import re
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from excel_to_bronze.utils.logging import setup_logging
+
+logger = setup_logging()
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+@dataclass
+class ProfileSettings:
+    """Where ingestion runs are profiled to, and with which profiler."""
+
+    directory: Optional[str] = None
+    profiler: str = "cprofile"
+
+    @classmethod
+    def from_config(cls, settings: Dict[str, Any]) -> "ProfileSettings":
+        """Read the settings from the application configuration.
+
+        Args:
+            settings: Application configuration dictionary
+
+        Returns:
+            ProfileSettings
+        """
+        return cls(directory=settings["profile_dir"], profiler=settings["profiler"])
+
+
+@contextmanager
+def profile_run(name: str, directory: Optional[str], profiler: str = "cprofile"):
+    """Profile a block and dump the result to ``directory``.
+
+    Does nothing when ``directory`` is empty. cProfile writes a ``.prof``
+    file for ``pstats``/snakeviz; pyinstrument (if installed) writes an HTML
+    report.
+
+    Args:
+        name: Name of the profiled run, e.g. the ingested filename
+        directory: Directory for profile dumps
+        profiler: ``cprofile`` or ``pyinstrument``
+    """
+    if not directory:
+        yield
+        return
+
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unknown profiler: {profiler}. Choose from {PROFILERS}")
+    os.makedirs(directory, exist_ok=True)
+    safe_name = re.sub(r"[^\w.-]", "_", name)
+    prefix = f"{safe_name}-{time.strftime('%Y%m%dT%H%M%S')}-"
+
+    def dump_path(suffix: str) -> str:
+        # mkstemp keeps profiles of runs started in the same second apart
+        fd, path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=directory)
+        os.close(fd)
+        return path
+
+    if profiler == "pyinstrument":
+        from pyinstrument import Profiler
+
+        session = Profiler()
+        session.start()
+        try:
+            yield
+        finally:
+            session.stop()
+            path = dump_path(".html")
+            with open(path, "w") as f:
+                f.write(session.output_html())
+            logger.info(f"Wrote profile {path}")
+        return
+
+    import cProfile
+
+    session = cProfile.Profile()
+    session.enable()
+    try:
+        yield
+    finally:
+        session.disable()
+        path = dump_path(".prof")
+        session.dump_stats(path)
+        logger.info(f"Wrote profile {path}")
@@ -7,12 +7,13 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=[
-        "streamlit>=1.20.0",
+        "streamlit>=1.27.0",
         "pandas>=1.5.0",
         "snowflake-connector-python>=3.0.0",
         "pyarrow>=12.0.0",
         "PyYAML>=6.0",
         "openpyxl>=3.1.0",
+        "xlrd>=2.0.1",
     ],
     extras_require={
         "dev": [
@@ -24,6 +25,12 @@ setup(
             "pre-commit>=3.3.1",
             "bandit>=1.7.5",
         ],
+        "calamine": [
+            "python-calamine>=0.1.7",  # Requires pandas>=2.2
+        ],
+        "watch": [
+            "watchdog>=3.0.0",
+        ],
         "docs": [
             "sphinx>=6.0.0",
         ],
@@ -0,0 +1,84 @@
+"""Shared fixtures: workbooks generated on the fly instead of checked-in files."""
+import datetime as dt
+
+import pandas as pd
+import pytest
+
+from excel_to_bronze.config import config
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """Read settings from the environment only and keep state files in tmp_path."""
+    monkeypatch.setenv("LEDGER_PATH", "")
+    monkeypatch.setenv("FINGERPRINT_INDEX_PATH", str(tmp_path / "fingerprints.db"))
+    monkeypatch.setenv("QUARANTINE_DIR", str(tmp_path / "quarantine"))
+    config_path = config.config_path
+    config.use_file(str(tmp_path / "missing.yaml"))
+    yield
+    config.use_file(config_path)
+
+
+def sample_frame(rows: int = 4) -> pd.DataFrame:
+    """Build a DataFrame covering the cell types the backends must agree on.
+
+    Args:
+        rows: Number of rows; values repeat every four rows
+
+    Returns:
+        DataFrame with integer, float, text, datetime, date, time and
+        boolean columns, each with an empty cell
+    """
+    pattern = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 2**40],
+            "amount": [1.5, -2.25, None, 1e10],
+            "name": ["plain", "ü ñ 中文", None, 'comma, "quoted"'],
+            "created": [
+                dt.datetime(2024, 1, 2, 3, 4, 5),
+                dt.datetime(2020, 2, 29),
+                None,
+                dt.datetime(1999, 12, 31, 23, 59, 59),
+            ],
+            "day": [
+                dt.date(2024, 1, 2),
+                dt.date(1970, 1, 1),
+                None,
+                dt.date(2038, 1, 19),
+            ],
+            "at": [dt.time(1, 2, 3), dt.time(0, 0), None, dt.time(23, 59, 59)],
+            "flag": [True, False, None, True],
+        }
+    )
+    frame = pd.concat([pattern] * -(-rows // len(pattern)), ignore_index=True)
+    return frame.head(rows)
+
+
+@pytest.fixture
+def xlsx_workbook(tmp_path):
+    """Path of a generated .xlsx workbook holding ``sample_frame()``."""
+    path = tmp_path / "sample.xlsx"
+    sample_frame().to_excel(path, index=False, engine="openpyxl")
+    return str(path)
+
+
+@pytest.fixture
+def xls_workbook(tmp_path):
+    """Path of a generated legacy .xls workbook; skipped without xlwt."""
+    xlwt = pytest.importorskip("xlwt")
+    frame = sample_frame()
+    book = xlwt.Workbook()
+    sheet = book.add_sheet("Sheet1")
+    date_style = xlwt.easyxf(num_format_str="yyyy-mm-dd hh:mm:ss")
+    for column, name in enumerate(frame.columns):
+        sheet.write(0, column, name)
+        for row, value in enumerate(frame[name], start=1):
+            if pd.isna(value):
+                continue
+            if isinstance(value, (dt.date, dt.time)):
+                sheet.write(row, column, value, date_style)
+            else:
+                sheet.write(row, column, value)
+    path = tmp_path / "sample.xls"
+    book.save(str(path))
+    return str(path)
@@ -0,0 +1,53 @@
+"""Excel backend selection and cross-backend output equality."""
+import os
+
+import pytest
+
+from excel_to_bronze.ingestion.backends import (
+    BACKENDS,
+    compare_backends,
+    select_backend,
+)
+
+
+def installed_backends(extension: str):
+    """Names of the installed backends that read an extension."""
+    return [
+        name
+        for name, backend in BACKENDS.items()
+        if backend.available() and extension in backend.extensions
+    ]
+
+
+@pytest.mark.parametrize("workbook", ["xlsx_workbook", "xls_workbook"])
+def test_installed_backends_serialize_identical_raw_data(workbook, request):
+    path = request.getfixturevalue(workbook)
+    backends = installed_backends(os.path.splitext(path)[1])
+    if len(backends) <= 1:
+        pytest.skip(f"Fewer than two installed backends read {path}")
+
+    results = compare_backends(path, backends)
+
+    assert [result["backend"] for result in results] == backends
+    assert len({result["rows"] for result in results}) == 1
+    assert len({result["raw_data_sha256"] for result in results}) == 1
+
+
+def test_override_must_support_extension():
+    if not BACKENDS["xlrd"].available():
+        pytest.skip("xlrd is not installed")
+
+    with pytest.raises(ValueError, match=r"xlrd cannot read \.xlsx files"):
+        select_backend("report.xlsx", override="xlrd")
+
+
+def test_override_is_used_for_supported_extension():
+    if not BACKENDS["openpyxl"].available():
+        pytest.skip("openpyxl is not installed")
+
+    assert select_backend("report.XLSX", override="openpyxl").name == "openpyxl"
+
+
+def test_unknown_override_is_rejected():
+    with pytest.raises(ValueError, match="Unknown Excel backend"):
+        select_backend("report.xlsx", override="missing")
@@ -0,0 +1,35 @@
+"""Peak memory of the batched write path, measured like the benchmark."""
+import pytest
+
+from excel_to_bronze.benchmark import run_benchmark
+from excel_to_bronze.connectors.sqlite import SQLiteConnector
+from excel_to_bronze.ingestion.bronze import MEMORY_MODES, ExcelIngestor
+
+ROWS = 10_000
+BATCH_SIZE = 500
+
+# Writing 20 batches one at a time should hold a fraction of the DataFrame;
+# a traced peak above its whole size means the sheet is serialized at once
+MAX_WRITE_PEAK_RATIO = 1.0
+
+
+@pytest.mark.parametrize("memory_mode", MEMORY_MODES)
+def test_write_peak_memory_follows_batch_size(memory_mode, tmp_path):
+    ingestor = ExcelIngestor(connector=SQLiteConnector())
+    ingestor.write_settings.load_method = "insert"
+    ingestor.batch_size = BATCH_SIZE
+
+    results = run_benchmark(
+        rows=ROWS,
+        columns=8,
+        repeat=1,
+        workdir=str(tmp_path),
+        ingestor=ingestor,
+        memory_mode=memory_mode,
+    )
+
+    assert results["frame_mb"] > 0
+    assert results["write_peak_ratio"] <= MAX_WRITE_PEAK_RATIO, (
+        f"traced write peak {results['write_peak_mb']} MB is "
+        f"{results['write_peak_ratio']}x the {results['frame_mb']} MB DataFrame"
+    )
@@ -0,0 +1,195 @@
+"""Query result cache and streamed reads through a fake Snowflake cursor."""
+import pytest
+
+from excel_to_bronze.connectors.cache import ResultCache, read_tables, written_tables
+from excel_to_bronze.connectors.pool import ConnectionPool
+from excel_to_bronze.connectors.snowflake import snowflake_connector
+
+SELECT_ORDERS = "SELECT * FROM orders"
+INSERT_ORDERS = "INSERT INTO db.public.orders VALUES (%s)"
+CHUNKS = 3
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCursor:
+    """Cursor returning canned rows and recording how they were fetched."""
+
+    def __init__(self, server):
+        self.server = server
+
+    def execute(self, sql, _params):
+        self.server.executed.append(sql)
+
+    def executemany(self, sql, _params_list):
+        self.server.executed.append(sql)
+
+    def fetchall(self):
+        self.server.calls.append("fetchall")
+        return [(len(self.server.executed),)]
+
+    def fetch_arrow_batches(self):
+        self.server.calls.append("fetch_arrow_batches")
+        for number in range(CHUNKS):
+            self.server.calls.append(f"chunk {number}")
+            yield [(number,)]
+
+    def close(self):
+        self.server.calls.append("close")
+
+
+class FakeConnection:
+    """Connection handing out FakeCursors."""
+
+    def __init__(self, server):
+        self.server = server
+
+    def cursor(self):
+        return FakeCursor(self.server)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeServer:
+    """Records the statements and fetch calls of all fake connections."""
+
+    def __init__(self):
+        self.executed = []
+        self.calls = []
+
+    def connect(self):
+        return FakeConnection(self)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Route the shared connector to a fake server with a fresh cache."""
+    server = FakeServer()
+    monkeypatch.setattr(snowflake_connector, "_pool", ConnectionPool(server.connect))
+    monkeypatch.setattr(snowflake_connector, "_result_cache", ResultCache())
+    monkeypatch.setattr(snowflake_connector, "_cache_configured", True)
+    return server
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ResultCache(ttl_seconds=10, clock=clock)
+    key = cache.key(SELECT_ORDERS)
+    cache.put(key, SELECT_ORDERS, [(1,)])
+
+    clock.now = 9.9
+    assert cache.get(key) == [(1,)]
+    clock.now = 10
+    assert cache.get(key) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(max_entries=2)
+    keys = [cache.key(f"SELECT {n} FROM orders") for n in range(3)]
+    cache.put(keys[0], SELECT_ORDERS, [(0,)])
+    cache.put(keys[1], SELECT_ORDERS, [(1,)])
+    cache.get(keys[0])
+
+    cache.put(keys[2], SELECT_ORDERS, [(2,)])
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == [(0,)]
+    assert cache.get(keys[2]) == [(2,)]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_result_read_before_a_write_is_not_stored():
+    cache = ResultCache()
+    key = cache.key(SELECT_ORDERS)
+    generation = cache.generation
+
+    cache.invalidate("INSERT INTO orders VALUES (1)")
+    cache.put(key, SELECT_ORDERS, [(1,)], generation)
+
+    assert cache.get(key) is None
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "INSERT INTO orders VALUES (1)",
+        "insert into db.public.ORDERS (id) values (1)",
+        'INSERT INTO "DB"."PUBLIC"."ORDERS" VALUES (1)',
+        "MERGE INTO analytics.orders o USING staged s ON o.id = s.id "
+        "WHEN MATCHED THEN UPDATE SET o.total = s.total",
+        "COPY INTO db.public.orders FROM @%orders FILE_FORMAT = (TYPE = JSON)",
+    ],
+)
+def test_writes_invalidate_results_of_their_table(statement):
+    cache = ResultCache()
+    orders = cache.key(SELECT_ORDERS)
+    customers = cache.key("SELECT * FROM customers")
+    cache.put(orders, SELECT_ORDERS, [(1,)])
+    cache.put(customers, "SELECT * FROM customers", [(2,)])
+
+    assert cache.invalidate(statement) == 1
+    assert cache.get(orders) is None
+    assert cache.get(customers) == [(2,)]
+
+
+def test_table_names_are_unqualified_and_lower_case():
+    assert read_tables('SELECT * FROM "DB"."S"."Orders" o JOIN s.items i ON 1=1') == {
+        "orders",
+        "items",
+    }
+    assert written_tables("COPY INTO DB.S.ORDERS FROM @stage") == {"orders"}
+
+
+def test_execute_query_serves_repeats_from_the_cache(server):
+    first = snowflake_connector.execute_query(SELECT_ORDERS)
+    second = snowflake_connector.execute_query(SELECT_ORDERS)
+
+    assert first == second
+    assert server.executed == [SELECT_ORDERS]
+
+
+def test_execute_batch_invalidates_results_of_its_table(server):
+    snowflake_connector.execute_query(SELECT_ORDERS)
+    generation = snowflake_connector.result_cache.generation
+
+    snowflake_connector.execute_batch(INSERT_ORDERS, [])
+    snowflake_connector.execute_query(SELECT_ORDERS)
+
+    assert snowflake_connector.result_cache.generation == generation + 1
+    assert server.executed == [SELECT_ORDERS, INSERT_ORDERS, SELECT_ORDERS]
+
+
+def test_stream_query_fetches_chunks_lazily_without_fetchall(server):
+    stream = snowflake_connector.stream_query(SELECT_ORDERS)
+    assert server.executed == []
+
+    first = next(stream)
+    assert first == [(0,)]
+    assert server.calls == ["fetch_arrow_batches", "chunk 0"]
+
+    rest = list(stream)
+    assert rest == [[(n,)] for n in range(1, CHUNKS)]
+    assert "fetchall" not in server.calls
+    assert server.calls[-1] == "close"
+    assert snowflake_connector.connection_pool.stats()["in_use"] == 0
+
+
+def test_stream_query_is_never_cached(server):
+    list(snowflake_connector.stream_query(SELECT_ORDERS))
+    list(snowflake_connector.stream_query(SELECT_ORDERS))
+
+    assert server.executed == [SELECT_ORDERS, SELECT_ORDERS]
+    assert snowflake_connector.result_cache.stats()["entries"] == 0
@@ -0,0 +1,86 @@
+"""Resuming an interrupted load from its checkpoint journal."""
+import json
+
+import pandas as pd
+import pytest
+
+from excel_to_bronze.config import config
+from excel_to_bronze.connectors.sqlite import SQLiteConnector
+from excel_to_bronze.ingestion.base import DataIngestionError
+from excel_to_bronze.ingestion.bronze import ExcelIngestor
+
+ROWS = 20
+BATCH_SIZE = 4
+# Batches committed and journaled before the crash
+COMMITTED = 2
+
+
+class CrashingConnector:
+    """Commits a given batch, then loses the connection before it is journaled."""
+
+    def __init__(self, connector, crash_on=None):
+        self.connector = connector
+        self.crash_on = crash_on
+        self.batches = 0
+        self.queries = []
+
+    def __getattr__(self, name):
+        return getattr(self.connector, name)
+
+    def execute_query(self, sql, params=None):
+        self.queries.append((" ".join(sql.split()), params))
+        return self.connector.execute_query(sql, params)
+
+    def execute_batch(self, sql, params_list):
+        self.connector.execute_batch(sql, params_list)
+        self.batches += 1
+        if self.batches == self.crash_on:
+            raise ConnectionError("Connection lost after commit")
+
+
+@pytest.fixture
+def workbook(tmp_path, monkeypatch):
+    monkeypatch.setenv("CHECKPOINT_PATH", str(tmp_path / "checkpoints.db"))
+    monkeypatch.setenv("BATCH_SIZE", str(BATCH_SIZE))
+    monkeypatch.setenv("PAYLOAD_FORMAT", "compact")
+    monkeypatch.setenv("WRITE_RETRIES", "0")
+    config.use_file(str(tmp_path / "missing.yaml"))
+    path = tmp_path / "orders.xlsx"
+    frame = pd.DataFrame(
+        {"order": range(ROWS), "total": [n * 1.5 for n in range(ROWS)]}
+    )
+    frame.to_excel(path, index=False, engine="openpyxl")
+    return str(path)
+
+
+def test_resumed_load_writes_every_row_once(workbook):
+    sink = SQLiteConnector()
+    crashing = CrashingConnector(sink, crash_on=COMMITTED + 1)
+    ingestor = ExcelIngestor(crashing)
+    sink.create_table(ingestor.bronze_table)
+
+    with pytest.raises(DataIngestionError):
+        ingestor.ingest_excel(workbook)
+
+    resuming = CrashingConnector(sink)
+    ExcelIngestor(resuming).ingest_excel(workbook)
+
+    rows = sink.execute_query(f"SELECT id, raw_data FROM {ingestor.bronze_table}")
+    ids = [row_id for row_id, _ in rows]
+    manifests = [raw for _, raw in rows if json.loads(raw)["metadata"].get("manifest")]
+    assert len(ids) == len(set(ids))
+    assert sorted(i for i in ids if not i.startswith("schema:")) == sorted(
+        str(i) for i in range(ROWS)
+    )
+    assert len(manifests) == 1
+
+    # Only the batches after the journaled ones were sent again, each after
+    # deleting rows an earlier attempt may have committed under its key
+    deleted = [
+        params["load_id"].rsplit(":", 1)[1]
+        for sql, params in resuming.queries
+        if sql.startswith("DELETE")
+    ]
+    batches = -(-ROWS // BATCH_SIZE)
+    assert deleted == [str(n) for n in range(COMMITTED + 1, batches + 1)]
+    assert resuming.batches == batches - COMMITTED
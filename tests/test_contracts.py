@@ -0,0 +1,160 @@
+"""Schema contract rules and the quarantine of rows breaking them."""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from excel_to_bronze.config import config
+from excel_to_bronze.connectors.sqlite import SQLiteConnector
+from excel_to_bronze.ingestion.base import DataIngestionError
+from excel_to_bronze.ingestion.bronze import ExcelIngestor
+from excel_to_bronze.ingestion.contracts import SchemaContract, type_violations
+
+CONTRACT = """
+contracts:
+  - name: orders
+    pattern: "orders_*.xlsx"
+    columns:
+      order_id: {type: int, nullable: false, unique: true}
+      amount: {type: float, min: 0, max: 100}
+      status: {allowed: [open, shipped]}
+      email: {regex: "[^@ ]+@[^@ ]+"}
+"""
+
+
+def orders():
+    return pd.DataFrame(
+        {
+            "order_id": [1, 2, 2, None, 5],
+            "amount": [10.0, 250.0, 5.0, 1.0, 2.0],
+            "status": ["open", "open", "lost", "shipped", "open"],
+            "email": ["a@x.io", "b@x.io", "c@x.io", "d@x.io", "not an email"],
+        }
+    )
+
+
+def failing(contract, df):
+    result = contract.validator().validate(df)
+    return {
+        rule: np.flatnonzero(mask).tolist() for rule, mask in result.failures.items()
+    }
+
+
+@pytest.mark.parametrize(
+    ("values", "type_name", "bad"),
+    [
+        (["1", 2, 3.0, 1.5, "x", None], "int", [3, 4]),
+        (["1.5", 2, "1e3", "abc", None], "float", [3]),
+        (["a", "b", 3, None], "str", [2]),
+        ([True, False, "yes", None], "bool", [2]),
+        (
+            ["2024-01-02", "02/03/2024 10:00", "2024-13-45", "nope", None],
+            "datetime",
+            [2, 3],
+        ),
+    ],
+)
+def test_type_violations_inspect_object_columns(values, type_name, bad):
+    series = pd.Series(values, dtype=object)
+
+    assert np.flatnonzero(type_violations(series, type_name)).tolist() == bad
+
+
+def test_every_rule_reports_its_rows():
+    contract = SchemaContract.from_dict(
+        {
+            "name": "orders",
+            "columns": {
+                "order_id": {"type": "int", "nullable": False, "unique": True},
+                "amount": {"min": 0, "max": 100},
+                "status": {"allowed": ["open", "shipped"]},
+                "email": {"regex": "[^@ ]+@[^@ ]+"},
+                "region": {"required": True},
+            },
+        }
+    )
+
+    assert failing(contract, orders()) == {
+        "not_null:order_id": [3],
+        "range:amount": [1],
+        "allowed:status": [2],
+        "regex:email": [4],
+        "required:region": [0, 1, 2, 3, 4],
+        "unique:order_id": [2],
+    }
+
+
+def test_uniqueness_holds_across_chunks():
+    validator = SchemaContract("ids", columns={"id": {"unique": True}}).validator()
+
+    first = validator.validate(pd.DataFrame({"id": [1, 2]}))
+    second = validator.validate(pd.DataFrame({"id": [2, 3, 3]}))
+
+    assert first.failed == 0
+    assert second.violations() == [["unique:id"], ["unique:id"]]
+
+
+def test_unknown_rules_are_rejected():
+    with pytest.raises(ValueError, match="unknown rules for amount: maximum"):
+        SchemaContract("orders", columns={"amount": {"maximum": 1}})
+    with pytest.raises(ValueError, match="Unknown contract keys: column"):
+        SchemaContract.from_dict({"column": {}})
+
+
+@pytest.fixture
+def contract_ingestor(tmp_path, monkeypatch):
+    """Build an ingestor checking the orders contract, writing to SQLite."""
+
+    def make(action: str = "quarantine") -> ExcelIngestor:
+        path = tmp_path / "contracts.yaml"
+        path.write_text(CONTRACT)
+        monkeypatch.setenv("CONTRACTS_PATH", str(path))
+        monkeypatch.setenv("CONTRACT_ACTION", action)
+        config.use_file(str(tmp_path / "missing.yaml"))
+        sink = SQLiteConnector()
+        ingestor = ExcelIngestor(sink)
+        sink.create_table(ingestor.bronze_table)
+        return ingestor
+
+    return make
+
+
+def bronze_ids(ingestor):
+    rows = ingestor.connector.execute_query(f"SELECT id FROM {ingestor.bronze_table}")
+    return sorted(row[0] for row in rows)
+
+
+def test_failing_rows_are_quarantined(contract_ingestor, tmp_path):
+    ingestor = contract_ingestor()
+
+    assert ingestor.ingest_excel(orders(), original_filename="orders_1.xlsx")
+
+    assert bronze_ids(ingestor) == ["0"]
+    with open(os.path.join(tmp_path, "quarantine", "orders_1.xlsx.ndjson")) as f:
+        quarantined = [json.loads(line) for line in f]
+    assert [(row["id"], row["violations"]) for row in quarantined] == [
+        ("1", ["range:amount"]),
+        ("2", ["allowed:status", "unique:order_id"]),
+        ("3", ["not_null:order_id"]),
+        ("4", ["regex:email"]),
+    ]
+    assert quarantined[0]["raw_data"]["data"]["amount"] == orders()["amount"][1]
+
+
+def test_files_without_a_matching_contract_load_whole(contract_ingestor):
+    ingestor = contract_ingestor()
+
+    ingestor.ingest_excel(orders(), original_filename="returns.xlsx")
+
+    assert len(bronze_ids(ingestor)) == len(orders())
+
+
+def test_fail_action_rejects_the_file(contract_ingestor):
+    ingestor = contract_ingestor(action="fail")
+
+    with pytest.raises(DataIngestionError, match="4 of 5 rows failed contract orders"):
+        ingestor.ingest_excel(orders(), original_filename="orders_1.xlsx")
+
+    assert bronze_ids(ingestor) == []
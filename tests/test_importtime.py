@@ -0,0 +1,53 @@
+"""Entry points must not import heavy modules they do not need."""
+import os
+
+import pytest
+
+from excel_to_bronze.importtime import (
+    SCENARIOS,
+    forbidden_imports,
+    measure,
+    parse_importtime,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_scenario_skips_forbidden_imports(scenario, monkeypatch):
+    # Run the checkout under test, wherever pytest was started
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setenv("PYTHONPATH", ROOT)
+
+    result = measure(SCENARIOS[scenario], repeat=1)
+
+    assert result["modules"], "no -X importtime output was parsed"
+    assert forbidden_imports(scenario, result["modules"]) == []
+
+
+def test_parse_importtime_reads_nesting():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:       300 |        420 | json\n"
+    )
+
+    assert parse_importtime(stderr) == [
+        ("json.decoder", 120, 120, 1),
+        ("json", 300, 420, 0),
+    ]
+
+
+def test_forbidden_imports_match_submodules_only():
+    modules = ["pandas.core.frame", "pandasql", "excel_to_bronze"]
+
+    assert forbidden_imports("help", modules) == ["pandas"]
+
+
+def test_pipeline_bans_pyarrow_readers():
+    modules = ["pyarrow", "pyarrow.lib", "pyarrow.csv", "pyarrow.parquet.core"]
+
+    assert forbidden_imports("pipeline", modules) == [
+        "pyarrow.csv",
+        "pyarrow.parquet",
+    ]
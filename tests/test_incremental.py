@@ -0,0 +1,73 @@
+"""Row fingerprints and the diff against a sheet's previous upload."""
+import pandas as pd
+import pytest
+
+from excel_to_bronze.ingestion.incremental import FingerprintIndex, row_fingerprints
+
+FILENAME = "orders.xlsx"
+SHEET = "0"
+
+
+@pytest.fixture
+def index(tmp_path):
+    return FingerprintIndex(str(tmp_path / "fingerprints.db"))
+
+
+def upload(index, df, key_columns=None):
+    """Diff a frame against the index and record it, like a successful load."""
+    diff = index.diff(df, FILENAME, SHEET, key_columns)
+    index.apply(FILENAME, SHEET, diff)
+    return diff
+
+
+def frame(*rows):
+    return pd.DataFrame(list(rows), columns=["sku", "qty"])
+
+
+def test_identical_rows_get_distinct_keys():
+    keys, fingerprints = row_fingerprints(frame(("a", 1), ("a", 1), ("b", 2)))
+
+    assert len(set(keys)) == len(keys)
+    assert fingerprints[0] == fingerprints[1]
+    assert keys[1] == f"{keys[0]}#1"
+
+
+def test_unchanged_upload_ships_nothing(index):
+    upload(index, frame(("a", 1), ("b", 2)))
+
+    diff = upload(index, frame(("b", 2), ("a", 1)))
+
+    assert not diff.changed.any()
+    assert diff.deleted == []
+
+
+def test_added_copy_of_a_row_is_new(index):
+    upload(index, frame(("a", 1), ("b", 2)))
+
+    diff = upload(index, frame(("a", 1), ("b", 2), ("a", 1)))
+
+    assert diff.changed.tolist() == [False, False, True]
+
+
+def test_removed_copy_of_a_row_is_deleted(index):
+    upload(index, frame(("a", 1), ("a", 1), ("b", 2)))
+
+    diff = upload(index, frame(("a", 1), ("b", 2)))
+
+    assert not diff.changed.any()
+    assert [row_id for _, row_id in diff.deleted] == ["1"]
+    assert diff.tombstones(FILENAME)[0][0] == "1"
+
+
+def test_key_columns_turn_edits_into_changes(index):
+    upload(index, frame(("a", 1), ("b", 2)), key_columns=["sku"])
+
+    diff = upload(index, frame(("a", 1), ("b", 3)), key_columns=["sku"])
+
+    assert diff.changed.tolist() == [False, True]
+    assert diff.deleted == []
+
+
+def test_missing_key_columns_are_rejected():
+    with pytest.raises(ValueError, match="Key columns not found: id"):
+        row_fingerprints(frame(("a", 1)), key_columns=["id"])
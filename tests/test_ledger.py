@@ -0,0 +1,91 @@
+"""Ingestion ledger hashes and lookups."""
+import datetime as dt
+
+import openpyxl
+import pytest
+from openpyxl.utils.datetime import CALENDAR_MAC_1904
+
+from excel_to_bronze.ingestion.ledger import (
+    IngestionLedger,
+    hash_file,
+    hash_sheets,
+    sheet_selection_key,
+    sheet_signature,
+)
+
+TABLE = "bronze_excel_data"
+
+
+def save_workbook(path, title="Data", epoch=None, creator="alice"):
+    """Save a one-sheet workbook holding a date, returning its path."""
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.title = title
+    sheet.append(["day", "amount"])
+    sheet.append([dt.datetime(2024, 1, 2), 1.5])
+    if epoch is not None:
+        book.epoch = epoch
+    book.properties.creator = creator
+    book.save(path)
+    return str(path)
+
+
+def signature(path):
+    return sheet_signature(hash_sheets(path))
+
+
+def test_resaved_workbook_keeps_its_signature(tmp_path):
+    first = save_workbook(tmp_path / "a.xlsx")
+    second = save_workbook(tmp_path / "b.xlsx", creator="bob")
+
+    assert hash_file(first) != hash_file(second)
+    assert signature(first) == signature(second)
+
+
+@pytest.mark.parametrize("change", [{"title": "Renamed"}, {"epoch": CALENDAR_MAC_1904}])
+def test_workbook_level_changes_change_the_signature(tmp_path, change):
+    original = save_workbook(tmp_path / "a.xlsx")
+    changed = save_workbook(tmp_path / "b.xlsx", **change)
+
+    assert "xl/workbook.xml" in hash_sheets(changed)
+    assert signature(original) != signature(changed)
+
+
+def test_non_zip_files_have_no_signature(tmp_path):
+    path = tmp_path / "legacy.xls"
+    path.write_bytes(b"\xd0\xcf\x11\xe0 not a zip archive")
+
+    assert hash_sheets(str(path)) == {}
+    assert signature(str(path)) is None
+
+
+def test_lookup_matches_content_hash_or_signature(tmp_path):
+    ledger = IngestionLedger(str(tmp_path / "ledger.db"))
+    first = save_workbook(tmp_path / "a.xlsx")
+    resaved = save_workbook(tmp_path / "b.xlsx", creator="bob")
+    renamed = save_workbook(tmp_path / "c.xlsx", title="Renamed")
+    ledger.record(hash_file(first), TABLE, "a.xlsx", hash_sheets(first))
+
+    assert ledger.lookup(hash_file(first), TABLE) == "a.xlsx"
+    assert ledger.lookup(hash_file(resaved), TABLE, signature(resaved)) == "a.xlsx"
+    assert ledger.lookup(hash_file(renamed), TABLE, signature(renamed)) is None
+    assert ledger.lookup(hash_file(first), "other_table") is None
+
+
+def test_lookup_is_scoped_to_the_sheet_selection(tmp_path):
+    ledger = IngestionLedger(str(tmp_path / "ledger.db"))
+    path = save_workbook(tmp_path / "a.xlsx")
+    ledger.record(hash_file(path), TABLE, "a.xlsx", sheets=sheet_selection_key("A"))
+
+    assert ledger.lookup(hash_file(path), TABLE, sheets=sheet_selection_key("A"))
+    assert (
+        ledger.lookup(hash_file(path), TABLE, sheets=sheet_selection_key("B")) is None
+    )
+    assert ledger.lookup(hash_file(path), TABLE) is None
+
+
+def test_sheet_selection_key_ignores_order_and_duplicates():
+    assert sheet_selection_key("B, A,B") == sheet_selection_key(["A", "B"])
+    assert sheet_selection_key("*") == "*"
+    assert not sheet_selection_key(None)
+    assert not sheet_selection_key(" , ")
@@ -0,0 +1,79 @@
+"""Compact payloads rebuilt from their schema manifest match the full layout."""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from excel_to_bronze.config import config
+from excel_to_bronze.connectors.sqlite import SQLiteConnector
+from excel_to_bronze.ingestion.bronze import ExcelIngestor
+
+SHEET = "Orders"
+
+
+def orders():
+    return pd.DataFrame(
+        {
+            "order": [1, 2, 3],
+            "total": [1.5, np.nan, 3.0],
+            "status": ["open", None, "shipped"],
+            "day": pd.to_datetime(["2024-01-02", None, "2024-01-03"]),
+        }
+    )
+
+
+@pytest.fixture
+def prepare(tmp_path, monkeypatch):
+    """Prepare bronze rows in a payload format, keyed by row id."""
+
+    def make(payload_format: str):
+        monkeypatch.setenv("PAYLOAD_FORMAT", payload_format)
+        config.use_file(str(tmp_path / "missing.yaml"))
+        ingestor = ExcelIngestor(SQLiteConnector())
+        rows = ingestor.prepare_data(orders(), "orders.xlsx", SHEET)
+        return {row_id: json.loads(raw) for row_id, _, raw in rows}
+
+    return make
+
+
+def rebuild(payload, manifests):
+    """Rejoin a compact row with its manifest, as ``payload_view_sql`` does.
+
+    The view takes column names and dtypes from the manifest and aggregates
+    the ``data`` array into an object keyed by column name at each position.
+    """
+    schema = manifests[payload["metadata"]["schema_id"]]
+    return {
+        "sheet_name": payload["metadata"].get("sheet_name"),
+        "column_names": schema["column_names"],
+        "data": {
+            schema["column_names"][index]: value
+            for index, value in enumerate(payload["data"])
+        },
+    }
+
+
+def test_compact_rows_rebuild_the_full_payload(prepare):
+    full = prepare("full")
+    compact = prepare("compact")
+
+    manifests = {
+        payload["metadata"]["schema_id"]: payload["metadata"]
+        for payload in compact.values()
+        if payload["metadata"].get("manifest")
+    }
+    rows = {
+        row_id: payload
+        for row_id, payload in compact.items()
+        if not payload["metadata"].get("manifest")
+    }
+
+    assert len(manifests) == 1
+    assert rows.keys() == full.keys()
+    for row_id, payload in rows.items():
+        assert rebuild(payload, manifests) == {
+            "sheet_name": full[row_id]["metadata"]["sheet_name"],
+            "column_names": full[row_id]["metadata"]["column_names"],
+            "data": full[row_id]["data"],
+        }
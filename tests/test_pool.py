@@ -0,0 +1,154 @@
+"""Connection pool reuse, limits, expiry and shutdown with fake connections."""
+import threading
+
+import pytest
+
+from excel_to_bronze.connectors.pool import (
+    ConnectionPool,
+    PoolClosedError,
+    PoolTimeoutError,
+)
+
+
+class FakeConnection:
+    """Connection stand-in that records whether it was closed."""
+
+    def __init__(self, number: int):
+        self.number = number
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeConnect:
+    """Connection factory counting the connections it opened."""
+
+    def __init__(self):
+        self.opened = []
+
+    def __call__(self) -> FakeConnection:
+        connection = FakeConnection(len(self.opened))
+        self.opened.append(connection)
+        return connection
+
+
+@pytest.fixture
+def connect():
+    return FakeConnect()
+
+
+def test_released_connection_is_reused(connect):
+    pool = ConnectionPool(connect)
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+
+    assert second is first
+    assert len(connect.opened) == 1
+    assert pool.stats()["hits"] == 1
+
+
+def test_exhausted_pool_waits_for_a_release(connect):
+    pool = ConnectionPool(connect, max_size=1, timeout=5)
+    held = pool.acquire()
+    releaser = threading.Timer(0.05, pool.release, args=(held,))
+    releaser.start()
+
+    connection = pool.acquire()
+    releaser.join()
+
+    assert connection is held
+    assert len(connect.opened) == 1
+    assert pool.stats()["waits"] >= 1
+
+
+def test_exhausted_pool_times_out(connect):
+    pool = ConnectionPool(connect, max_size=1, timeout=0.01)
+    pool.acquire()
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+    assert len(connect.opened) == 1
+
+
+def test_expired_connection_is_replaced(connect):
+    pool = ConnectionPool(connect, max_lifetime_seconds=0)
+
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+
+    assert second is not first
+    assert first.closed
+
+
+def test_idle_connection_is_evicted(connect):
+    pool = ConnectionPool(connect, max_idle_seconds=0)
+    first = pool.acquire()
+    pool.release(first)
+
+    second = pool.acquire()
+
+    assert second is not first
+    assert first.closed
+    assert pool.stats()["evictions"] == 1
+
+
+def test_discarded_and_unhealthy_connections_are_not_reused(connect):
+    pool = ConnectionPool(connect, max_size=1)
+
+    first = pool.acquire()
+    pool.release(first, discard=True)
+    second = pool.acquire()
+    pool.release(second)
+    second.closed = True
+    third = pool.acquire()
+
+    assert first.closed
+    assert len({id(first), id(second), id(third)}) == len(connect.opened)
+    assert pool.stats()["discards"] == len(connect.opened) - 1
+
+
+def test_close_all_closes_in_use_connections_on_release(connect):
+    pool = ConnectionPool(connect)
+    idle = pool.acquire()
+    busy = pool.acquire()
+    pool.release(idle)
+
+    pool.close_all()
+
+    assert idle.closed
+    assert not busy.closed
+    with pytest.raises(PoolClosedError):
+        pool.acquire()
+
+    pool.release(busy)
+
+    assert busy.closed
+    assert pool.stats()["idle"] == 0
+    assert pool.stats()["in_use"] == 0
+
+
+def test_close_all_wakes_waiting_acquire(connect):
+    pool = ConnectionPool(connect, max_size=1, timeout=5)
+    pool.acquire()
+    errors = []
+
+    def wait():
+        try:
+            pool.acquire()
+        except PoolClosedError as e:
+            errors.append(e)
+
+    waiter = threading.Thread(target=wait)
+    waiter.start()
+    threading.Timer(0.05, pool.close_all).start()
+    waiter.join(timeout=5)
+
+    assert not waiter.is_alive()
+    assert len(errors) == 1
@@ -0,0 +1,66 @@
+"""Streaming Excel reader chunks compared with a whole-sheet read."""
+import datetime as dt
+
+import pandas as pd
+import pytest
+
+from excel_to_bronze.config import config
+from excel_to_bronze.connectors.sqlite import SQLiteConnector
+from excel_to_bronze.ingestion.bronze import ExcelIngestor
+from excel_to_bronze.ingestion.readers import align_dtypes, iter_excel_chunks
+
+CHUNK_ROWS = 3
+
+
+@pytest.fixture
+def drifting_workbook(tmp_path):
+    """Workbook whose columns look different in every chunk of three rows."""
+    path = tmp_path / "drift.xlsx"
+    pd.DataFrame(
+        {
+            "amount": [1.5, 2, 3, 4, 5, 6, 7, 8, 9],
+            "qty": [None, 1, 2, 3, 4, 5, 6, 7, 8],
+            "note": ["a", "b", "c", "d", None, None, None, None, None],
+            "when": [dt.datetime(2024, 1, day) for day in range(1, 7)] + [None] * 3,
+            "mixed": ["x", 1, 2.5, 3, 4, 5, 6, 7, 8],
+        }
+    ).to_excel(path, index=False, engine="openpyxl")
+    return str(path)
+
+
+def loaded_rows(path, streaming):
+    sink = SQLiteConnector()
+    ingestor = ExcelIngestor(sink)
+    sink.create_table(ingestor.bronze_table)
+    ingestor.ingest_excel(path, streaming=streaming)
+    return sink.execute_query(
+        f"SELECT id, raw_data FROM {ingestor.bronze_table} ORDER BY CAST(id AS INT)"
+    )
+
+
+def test_streamed_rows_match_a_whole_sheet_read(
+    drifting_workbook, monkeypatch, tmp_path
+):
+    monkeypatch.setenv("BATCH_SIZE", str(CHUNK_ROWS))
+    config.use_file(str(tmp_path / "missing.yaml"))
+
+    assert loaded_rows(drifting_workbook, streaming=True) == loaded_rows(
+        drifting_workbook, streaming=False
+    )
+
+
+def test_chunks_keep_the_first_chunks_types(drifting_workbook):
+    chunks = list(iter_excel_chunks(drifting_workbook, CHUNK_ROWS))
+
+    assert all(chunk.dtypes.equals(chunks[0].dtypes) for chunk in chunks)
+
+
+def test_types_that_cannot_be_cast_are_left_as_read():
+    dtypes = {"count": pd.Series([1]).dtype}
+    drifted = set()
+    chunk = pd.DataFrame({"count": [1.5, None]})
+
+    aligned = align_dtypes(chunk, dtypes, drifted)
+
+    assert aligned["count"].dtype == chunk["count"].dtype
+    assert drifted == {"count"}
@@ -0,0 +1,98 @@
+"""Batch retries and timeout splits against injected connector faults."""
+import pytest
+
+from excel_to_bronze.config import config
+from excel_to_bronze.connectors.faults import (
+    FaultInjectingConnector,
+    InjectedConnectionError,
+    InjectedTimeoutError,
+)
+from excel_to_bronze.connectors.sqlite import SQLiteConnector
+from excel_to_bronze.ingestion.bronze import ExcelIngestor
+
+ROWS = 40
+# A batch that times out with one retry left, then its first half
+BUDGETED_TIMEOUTS = 2
+
+
+@pytest.fixture
+def make_ingestor(tmp_path, monkeypatch):
+    """Build an ingestor writing to SQLite through a FaultInjectingConnector."""
+
+    def make(
+        journal: bool = False, adaptive: bool = False, retries: int = 50, **faults
+    ):
+        monkeypatch.setenv("WRITE_RETRIES", str(retries))
+        monkeypatch.setenv("WRITE_RETRY_DELAY", "0")
+        monkeypatch.setenv("ADAPTIVE_BATCHING", str(adaptive).lower())
+        monkeypatch.setenv("BATCH_MIN_ROWS", "1")
+        if journal:
+            monkeypatch.setenv("CHECKPOINT_PATH", str(tmp_path / "checkpoints.db"))
+        config.use_file(str(tmp_path / "missing.yaml"))
+        sink = SQLiteConnector()
+        ingestor = ExcelIngestor(FaultInjectingConnector(sink, seed=7, **faults))
+        sink.create_table(ingestor.bronze_table)
+        return ingestor
+
+    return make
+
+
+def sample_batch(rows: int = ROWS):
+    return [(str(i), "sample.xlsx", f'{{"n": {i}}}') for i in range(rows)]
+
+
+def stored_ids(ingestor):
+    rows = ingestor.connector.execute_query(f"SELECT id FROM {ingestor.bronze_table}")
+    return sorted(int(row[0]) for row in rows)
+
+
+def test_errors_raised_before_sending_are_retried(make_ingestor):
+    ingestor = make_ingestor(failure_rate=0.5)
+
+    ingestor.insert_batch(ingestor.insert_sql, sample_batch(), 1)
+
+    assert ingestor.connector.injected["transient"] > 0
+    assert stored_ids(ingestor) == list(range(ROWS))
+
+
+def test_possibly_committed_batch_without_load_id_is_not_resent(make_ingestor):
+    ingestor = make_ingestor(lost_ack_rate=1.0)
+
+    with pytest.raises(InjectedConnectionError):
+        ingestor.insert_batch(ingestor.insert_sql, sample_batch(), 1)
+
+    assert ingestor.connector.injected["lost_ack"] == 1
+    assert stored_ids(ingestor) == list(range(ROWS))
+
+
+def test_possibly_committed_batch_with_load_id_is_deleted_before_retry(
+    make_ingestor,
+):
+    ingestor = make_ingestor(journal=True, lost_ack_rate=0.6)
+
+    for batch_number in range(1, 6):
+        ingestor.insert_batch(ingestor.insert_sql, sample_batch(), batch_number)
+
+    assert ingestor.connector.injected["lost_ack"] > 0
+    assert stored_ids(ingestor) == sorted(list(range(ROWS)) * 5)
+
+
+def test_timed_out_batch_is_split(make_ingestor):
+    ingestor = make_ingestor(adaptive=True, max_batch_bytes=150)
+    initial = ingestor.batch_sizer.rows
+
+    ingestor.insert_batch(ingestor.insert_sql, sample_batch(), 1)
+
+    assert ingestor.connector.injected["timeout"] > 0
+    assert stored_ids(ingestor) == list(range(ROWS))
+    assert ingestor.batch_sizer.rows < initial
+
+
+def test_splits_use_the_remaining_retries(make_ingestor):
+    ingestor = make_ingestor(adaptive=True, retries=1, max_batch_bytes=0)
+
+    with pytest.raises(InjectedTimeoutError):
+        ingestor.insert_batch(ingestor.insert_sql, sample_batch(), 1)
+
+    assert ingestor.connector.injected["timeout"] == BUDGETED_TIMEOUTS
+    assert stored_ids(ingestor) == []
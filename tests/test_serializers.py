@@ -0,0 +1,61 @@
+"""Column-wise serialization matches the row-by-row reference output."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from excel_to_bronze.ingestion.serializers import DataSerializer
+
+FRAMES = {
+    "mixed": lambda: pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "name": ["a", None, "c"],
+            "price": [1.5, np.nan, 3.0],
+            "flag": [True, False, None],
+        }
+    ),
+    "nullable": lambda: pd.DataFrame(
+        {"id": pd.array([1, None, 3], dtype="Int64"), "name": ["a", "b", None]}
+    ),
+    "nullable_only": lambda: pd.DataFrame(
+        {"id": pd.array([1, None, 3], dtype="Int64")}
+    ),
+    "nullable_with_int": lambda: pd.DataFrame(
+        {"id": pd.array([1, None, 3], dtype="Int64"), "qty": [4, 5, 6]}
+    ),
+    "nullable_with_float": lambda: pd.DataFrame(
+        {"id": pd.array([1, None, 3], dtype="Int64"), "price": [1.5, np.nan, 3.0]}
+    ),
+    "nullable_float_with_int": lambda: pd.DataFrame(
+        {"price": pd.array([1.5, None, 2.0], dtype="Float64"), "qty": [4, 5, 6]}
+    ),
+    "nullable_bool": lambda: pd.DataFrame(
+        {"flag": pd.array([True, None, False], dtype="boolean"), "ok": [1, 0, 1]}
+    ),
+    "datetime": lambda: pd.DataFrame(
+        {
+            "day": pd.to_datetime(["2024-01-02", None, "2024-03-04"]),
+            "at": pd.to_datetime(
+                ["2024-01-02 10:00:00.5", "2024-01-03 00:00:00.0", None]
+            ),
+            "utc": pd.to_datetime(["2024-01-02", None, "2024-01-03"], utc=True),
+        }
+    ),
+    "all_numeric": lambda: pd.DataFrame(
+        {
+            "small": np.array([1, 2, 3], dtype="uint8"),
+            "qty": [4, 5, 6],
+            "price": [1.5, np.nan, 3.0],
+        }
+    ),
+    "all_int": lambda: pd.DataFrame({"a": [1, 2, 3], "b": [True, False, True]}),
+}
+
+
+@pytest.mark.parametrize("name", FRAMES)
+def test_serialize_rows_matches_row_to_json(name):
+    df = FRAMES[name]()
+
+    expected = df.apply(DataSerializer.row_to_json, axis=1).tolist()
+
+    assert DataSerializer.serialize_rows(df) == expected
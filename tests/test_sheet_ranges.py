@@ -0,0 +1,62 @@
+"""Row-range parsing helpers and their fallbacks to a serial read."""
+import pandas as pd
+import pytest
+
+from excel_to_bronze.ingestion import sheet_ranges
+from excel_to_bronze.ingestion.sheet_ranges import (
+    NA_VALUES,
+    OpenpyxlInternals,
+    RangeParseError,
+    index_sheet,
+    value_kind,
+)
+
+PARTS = 2
+
+
+def test_na_values_match_pandas_defaults():
+    parsers = pytest.importorskip("pandas._libs.parsers")
+
+    assert NA_VALUES == frozenset(parsers.STR_NA_VALUES)
+
+
+@pytest.mark.parametrize("text", ["NA", "n/a", "", "#N/A"])
+def test_na_text_is_classed_missing(text):
+    assert value_kind(text) == "missing"
+
+
+def test_index_sheet_splits_rows(tmp_path):
+    path = tmp_path / "rows.xlsx"
+    pd.DataFrame({"a": range(2000), "b": ["x"] * 2000}).to_excel(path, index=False)
+
+    index = index_sheet(str(path), parts=PARTS)
+
+    assert index is not None
+    assert len(index.ranges) == PARTS
+    assert index.ranges[0][2] == 1
+
+
+def test_index_sheet_falls_back_without_openpyxl_internals(tmp_path, monkeypatch):
+    path = tmp_path / "rows.xlsx"
+    pd.DataFrame({"a": range(10)}).to_excel(path, index=False)
+    monkeypatch.setattr(
+        sheet_ranges.OpenpyxlInternals, "parser_class", staticmethod(lambda: None)
+    )
+
+    assert index_sheet(str(path), parts=PARTS) is None
+
+
+def test_changed_parser_raises_range_parse_error(monkeypatch):
+    class ChangedParser:
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def parse(self):
+            yield 1, [{"col": 1, "val": 2}]
+
+    monkeypatch.setattr(
+        OpenpyxlInternals, "parser_class", staticmethod(lambda: ChangedParser)
+    )
+
+    with pytest.raises(RangeParseError):
+        list(OpenpyxlInternals.parse_rows(b"", [], None, set(), set()))
@@ -0,0 +1,79 @@
+"""Bulk loads through a local stage and COPY INTO."""
+import os
+
+import pandas as pd
+import pytest
+
+from excel_to_bronze.config import config
+from excel_to_bronze.connectors.sqlite import SQLiteConnector
+from excel_to_bronze.connectors.stage import LocalStage
+from excel_to_bronze.ingestion.bronze import ExcelIngestor
+
+ROWS = 10
+BATCH_SIZE = 4
+
+
+def orders():
+    return pd.DataFrame(
+        {
+            "order": range(ROWS),
+            "total": [n * 1.5 for n in range(ROWS)],
+            "status": [None if n % 3 == 0 else f"s{n}" for n in range(ROWS)],
+        }
+    )
+
+
+@pytest.fixture
+def make_ingestor(tmp_path, monkeypatch):
+    """Build an ingestor for a load method, writing batches of BATCH_SIZE rows."""
+
+    def make(load_method: str, file_format: str = "ndjson") -> ExcelIngestor:
+        monkeypatch.setenv("BATCH_SIZE", str(BATCH_SIZE))
+        monkeypatch.setenv("LOAD_METHOD", load_method)
+        monkeypatch.setenv("STAGE_FILE_FORMAT", file_format)
+        monkeypatch.setenv("LOCAL_STAGE_DIR", str(tmp_path / "stage"))
+        config.use_file(str(tmp_path / "missing.yaml"))
+        sink = SQLiteConnector()
+        ingestor = ExcelIngestor(sink)
+        sink.create_table(ingestor.bronze_table)
+        return ingestor
+
+    return make
+
+
+@pytest.mark.parametrize("file_format", ["ndjson", "parquet"])
+def test_stage_loader_copies_every_batch(make_ingestor, tmp_path, file_format):
+    ingestor = make_ingestor("copy", file_format)
+    rows = ingestor.prepare_data(orders(), "orders.xlsx")
+    batches = [
+        (number, rows[start : start + BATCH_SIZE])
+        for number, start in enumerate(range(0, ROWS, BATCH_SIZE), start=1)
+    ]
+
+    loaded = ingestor.stage_loader.load_rows(batches, "orders.xlsx")
+
+    assert isinstance(ingestor.stage_loader.stage, LocalStage)
+    assert loaded == ROWS
+    assert ingestor.stage_loader.stage.tables[ingestor.bronze_table] == rows
+    assert os.listdir(tmp_path / "stage") == []
+
+
+@pytest.mark.parametrize("file_format", ["ndjson", "parquet"])
+def test_copy_loads_the_rows_an_insert_writes(make_ingestor, file_format):
+    inserting = make_ingestor("insert")
+    inserting.ingest_excel(orders(), original_filename="orders.xlsx")
+    inserted = inserting.connector.execute_query(
+        f"SELECT id, filename, raw_data FROM {inserting.bronze_table}"
+    )
+
+    copying = make_ingestor("copy", file_format)
+    assert copying.ingest_excel(orders(), original_filename="orders.xlsx")
+
+    assert sorted(copying.stage_loader.stage.tables[copying.bronze_table]) == sorted(
+        inserted
+    )
+
+
+def test_unsupported_load_method_is_rejected(make_ingestor):
+    with pytest.raises(ValueError, match="Unsupported load method"):
+        make_ingestor("bulk")
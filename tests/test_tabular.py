@@ -0,0 +1,96 @@
+"""CSV and Parquet files round-tripped through the bronze write path."""
+import json
+
+import pandas as pd
+import pytest
+
+from excel_to_bronze.config import config
+from excel_to_bronze.connectors.sqlite import SQLiteConnector
+from excel_to_bronze.ingestion.bronze import BronzeIngestor, ExcelIngestor
+from excel_to_bronze.ingestion.tabular import (
+    CSVIngestor,
+    ParquetIngestor,
+    create_ingestor,
+)
+
+ROWS = 10
+BATCH_SIZE = 4
+
+
+def orders():
+    return pd.DataFrame(
+        {
+            "order": range(ROWS),
+            "total": [n * 1.5 for n in range(ROWS)],
+            "status": [None if n % 3 == 0 else f"s{n}" for n in range(ROWS)],
+        }
+    )
+
+
+def write_file(df, path):
+    if path.suffix == ".parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False, sep="\t" if path.suffix == ".tsv" else ",")
+    return str(path)
+
+
+@pytest.fixture
+def sink(tmp_path, monkeypatch):
+    monkeypatch.setenv("BATCH_SIZE", str(BATCH_SIZE))
+    config.use_file(str(tmp_path / "missing.yaml"))
+    return SQLiteConnector()
+
+
+def bronze_data(sink, ingestor):
+    rows = sink.execute_query(
+        f"SELECT id, filename, raw_data FROM {ingestor.bronze_table}"
+    )
+    return {
+        int(row_id): (filename, json.loads(raw)["data"])
+        for row_id, filename, raw in rows
+    }
+
+
+def test_tabular_ingestors_are_siblings_of_the_excel_ingestor():
+    for cls in (CSVIngestor, ParquetIngestor):
+        assert issubclass(cls, BronzeIngestor)
+        assert not issubclass(cls, ExcelIngestor)
+    assert not hasattr(CSVIngestor, "process_sheets")
+
+
+@pytest.mark.parametrize("name", ["orders.csv", "orders.tsv", "orders.parquet"])
+@pytest.mark.parametrize("streaming", [False, True])
+def test_rows_round_trip_through_bronze(sink, tmp_path, name, streaming):
+    path = write_file(orders(), tmp_path / name)
+    ingestor = create_ingestor(path, connector=sink)
+    sink.create_table(ingestor.bronze_table)
+
+    assert ingestor.ingest_excel(path, streaming=streaming)
+
+    loaded = bronze_data(sink, ingestor)
+    expected = orders().astype(object).where(orders().notna(), None)
+    assert loaded == {
+        n: (name, {**expected.iloc[n].to_dict(), "id": str(n)}) for n in range(ROWS)
+    }
+
+
+def test_preview_reads_the_first_rows(sink, tmp_path):
+    path = write_file(orders(), tmp_path / "orders.parquet")
+
+    with open(path, "rb") as f:
+        preview = create_ingestor(path, connector=sink).preview(
+            f.read(), "orders.parquet", nrows=3
+        )
+
+    pd.testing.assert_frame_equal(preview, orders().head(3))
+
+
+def test_sheets_are_ignored_for_single_table_files(sink, tmp_path):
+    path = write_file(orders(), tmp_path / "orders.csv")
+    ingestor = create_ingestor(path, connector=sink)
+    sink.create_table(ingestor.bronze_table)
+
+    assert ingestor.ingest_excel(path, sheets="*")
+
+    assert len(bronze_data(sink, ingestor)) == ROWS